@@ -46,12 +46,15 @@ __all__ = [
     "HttpRequestError",
     "ResilientClient",
     "__version__",
+    "async_session",
+    "close_default_clients",
     "delete",
     "delete_async",
     "get",
     "get_async",
     "head",
     "head_async",
+    "install_uvloop",
     "options",
     "options_async",
     "patch",
@@ -68,6 +71,7 @@ from importlib.metadata import PackageNotFoundError, version
 
 from aresilient.client import ResilientClient
 from aresilient.client_async import AsyncResilientClient
+from aresilient.core.default_clients import async_session, close_default_clients
 from aresilient.delete import delete
 from aresilient.delete_async import delete_async
 from aresilient.exceptions import HttpRequestError
@@ -85,6 +89,7 @@ from aresilient.put import put
 from aresilient.put_async import put_async
 from aresilient.request import request
 from aresilient.request_async import request_async
+from aresilient.utils.event_loop import install_uvloop
 
 try:
     __version__ = version(__name__)
@@ -2,7 +2,7 @@ r"""Backoff strategies and utilities for retry delays.
 
 This package provides various backoff strategies for calculating retry
 delays, including exponential, linear, Fibonacci, and constant backoff
-patterns.
+patterns, full jitter on top of any of them, and decorrelated jitter.
 """
 
 from __future__ import annotations
@@ -10,13 +10,17 @@ from __future__ import annotations
 __all__ = [
     "BaseBackoffStrategy",
     "ConstantBackoff",
+    "DecorrelatedJitterBackoff",
     "ExponentialBackoff",
     "FibonacciBackoff",
+    "FullJitterBackoff",
     "LinearBackoff",
 ]
 
 from aresilient.backoff.base import BaseBackoffStrategy
 from aresilient.backoff.constant import ConstantBackoff
+from aresilient.backoff.decorrelated_jitter import DecorrelatedJitterBackoff
 from aresilient.backoff.exponential import ExponentialBackoff
 from aresilient.backoff.fibonacci import FibonacciBackoff
+from aresilient.backoff.full_jitter import FullJitterBackoff
 from aresilient.backoff.linear import LinearBackoff
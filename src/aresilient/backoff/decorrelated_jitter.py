@@ -0,0 +1,72 @@
+r"""Decorrelated jitter backoff strategy."""
+
+from __future__ import annotations
+
+__all__ = ["DecorrelatedJitterBackoff"]
+
+import random
+
+from aresilient.backoff.base import BaseBackoffStrategy
+
+
+class DecorrelatedJitterBackoff(BaseBackoffStrategy):
+    """Decorrelated jitter backoff strategy.
+
+    Each delay is drawn uniformly between base_delay and three times the
+    previous delay: delay = min(max_delay, random.uniform(base_delay, previous * 3))
+
+    Unlike full jitter, the delays never go below base_delay, and the
+    range they are drawn from grows with the previous random delay
+    instead of a fixed schedule. This spreads the retries of many clients
+    while keeping a minimum wait between attempts.
+
+    The strategy does not store the previous delay, so one instance can
+    be shared by concurrent requests: the chain of delays up to the
+    attempt is drawn on each call, which gives a delay with the same
+    distribution as the stateful formula.
+
+    Args:
+        base_delay: The minimum delay in seconds (default: 0.3), also
+            used as the first previous delay.
+        max_delay: Optional maximum delay cap in seconds. If specified,
+            delays will not exceed this value.
+
+    Example:
+        ```pycon
+        >>> from aresilient.backoff import DecorrelatedJitterBackoff
+        >>> backoff = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=10.0)
+        >>> 1.0 <= backoff.calculate(0) <= 3.0
+        True
+        >>> 1.0 <= backoff.calculate(10) <= 10.0
+        True
+
+        ```
+    """
+
+    def __init__(self, base_delay: float = 0.3, max_delay: float | None = None) -> None:
+        if base_delay < 0:
+            msg = f"base_delay must be non-negative, got {base_delay}"
+            raise ValueError(msg)
+        if max_delay is not None and max_delay <= 0:
+            msg = f"max_delay must be positive if specified, got {max_delay}"
+            raise ValueError(msg)
+
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def calculate(self, attempt: int) -> float:
+        """Calculate decorrelated jitter backoff delay.
+
+        Args:
+            attempt: The current attempt number (0-indexed).
+
+        Returns:
+            A random delay between base_delay and three times the
+            previous delay, capped at max_delay if set.
+        """
+        delay = self.base_delay
+        for _ in range(attempt + 1):
+            delay = random.uniform(self.base_delay, delay * 3)  # noqa: S311
+            if self.max_delay is not None:
+                delay = min(delay, self.max_delay)
+        return delay
@@ -6,6 +6,9 @@ __all__ = ["ExponentialBackoff"]
 
 from aresilient.backoff.base import BaseBackoffStrategy
 
+# Number of retry attempts whose delay is precomputed at construction
+_PRECOMPUTED_ATTEMPTS = 16
+
 
 class ExponentialBackoff(BaseBackoffStrategy):
     """Exponential backoff strategy.
@@ -13,7 +16,9 @@ class ExponentialBackoff(BaseBackoffStrategy):
     Calculates delay as: base_delay * (2 ** attempt), with optional max_delay cap.
 
     This is the default backoff strategy and works well for most scenarios where
-    you want progressively longer delays between retries.
+    you want progressively longer delays between retries. The delays of the first
+    retries are precomputed, and computed again when ``base_delay`` or
+    ``max_delay`` is changed.
 
     Args:
         base_delay: The base delay factor (default: 0.3). The actual delay
@@ -47,8 +52,46 @@ class ExponentialBackoff(BaseBackoffStrategy):
             msg = f"max_delay must be positive if specified, got {max_delay}"
             raise ValueError(msg)
 
-        self.base_delay = base_delay
-        self.max_delay = max_delay
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._delays: tuple[float, ...] = self._precompute()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExponentialBackoff):
+            return NotImplemented
+        return (self._base_delay, self._max_delay) == (other._base_delay, other._max_delay)
+
+    def __hash__(self) -> int:
+        return hash((ExponentialBackoff, self._base_delay, self._max_delay))
+
+    @property
+    def base_delay(self) -> float:
+        """The base delay factor in seconds."""
+        return self._base_delay
+
+    @base_delay.setter
+    def base_delay(self, base_delay: float) -> None:
+        self._base_delay = base_delay
+        self._delays = self._precompute()
+
+    @property
+    def max_delay(self) -> float | None:
+        """The optional maximum delay cap in seconds."""
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, max_delay: float | None) -> None:
+        self._max_delay = max_delay
+        self._delays = self._precompute()
+
+    def _precompute(self) -> tuple[float, ...]:
+        """Precompute the delay schedule, so that a retry only indexes a
+        tuple.
+
+        Returns:
+            The delays of the first ``_PRECOMPUTED_ATTEMPTS`` attempts.
+        """
+        return tuple(self._compute(attempt) for attempt in range(_PRECOMPUTED_ATTEMPTS))
 
     def calculate(self, attempt: int) -> float:
         """Calculate exponential backoff delay.
@@ -60,7 +103,24 @@ class ExponentialBackoff(BaseBackoffStrategy):
             The calculated delay: base_delay * (2 ** attempt),
             capped at max_delay if set.
         """
-        delay = self.base_delay * (2**attempt)
-        if self.max_delay is not None:
-            delay = min(delay, self.max_delay)
+        if 0 <= attempt < _PRECOMPUTED_ATTEMPTS:
+            return self._delays[attempt]
+        return self._compute(attempt)
+
+    def _compute(self, attempt: int) -> float:
+        """Compute the exponential backoff delay without the precomputed
+        schedule.
+
+        Args:
+            attempt: The current attempt number (0-indexed).
+
+        Returns:
+            The delay: base_delay * (2 ** attempt), capped at max_delay
+            if set.
+        """
+        # A shift is exact and faster than a power, but it does not accept
+        # negative attempts, which give a fraction of base_delay
+        delay = self._base_delay * (1 << attempt if attempt >= 0 else 2.0**attempt)
+        if self._max_delay is not None:
+            delay = min(delay, self._max_delay)
         return delay
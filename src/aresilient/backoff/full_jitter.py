@@ -0,0 +1,53 @@
+r"""Full jitter backoff strategy."""
+
+from __future__ import annotations
+
+__all__ = ["FullJitterBackoff"]
+
+import random
+
+from aresilient.backoff.base import BaseBackoffStrategy
+from aresilient.backoff.exponential import ExponentialBackoff
+
+
+class FullJitterBackoff(BaseBackoffStrategy):
+    """Full jitter backoff strategy.
+
+    Returns a delay drawn uniformly between 0 and the delay of another
+    backoff strategy: delay = random.uniform(0, base_strategy.calculate(attempt))
+
+    Unlike ``jitter_factor``, which adds up to a fraction of the delay on
+    top of it, full jitter spreads the retries of many clients over the
+    whole backoff window. This avoids synchronized retry waves when many
+    clients fail at the same time, at the cost of shorter average delays.
+
+    Args:
+        base_strategy: The backoff strategy giving the upper bound of the
+            delay. Defaults to ``ExponentialBackoff()``. Use its
+            ``max_delay`` to cap the upper bound.
+
+    Example:
+        ```pycon
+        >>> from aresilient.backoff import ExponentialBackoff, FullJitterBackoff
+        >>> backoff = FullJitterBackoff(ExponentialBackoff(base_delay=1.0, max_delay=10.0))
+        >>> 0.0 <= backoff.calculate(0) <= 1.0
+        True
+        >>> 0.0 <= backoff.calculate(10) <= 10.0
+        True
+
+        ```
+    """
+
+    def __init__(self, base_strategy: BaseBackoffStrategy | None = None) -> None:
+        self.base_strategy = base_strategy if base_strategy is not None else ExponentialBackoff()
+
+    def calculate(self, attempt: int) -> float:
+        """Calculate full jitter backoff delay.
+
+        Args:
+            attempt: The current attempt number (0-indexed).
+
+        Returns:
+            A random delay between 0 and the delay of the base strategy.
+        """
+        return random.random() * self.base_strategy.calculate(attempt)  # noqa: S311
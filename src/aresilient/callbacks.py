@@ -36,19 +36,33 @@ __all__ = [
     "invoke_on_request",
     "invoke_on_retry",
     "invoke_on_success",
+    "run_in_background",
 ]
 
+import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     import httpx
 
+T = TypeVar("T")
 
-@dataclass
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Thread pool running the callbacks in the background. It is created on the
+# first use and has a single worker, so the callbacks of a request still run
+# in the order of the lifecycle events
+_background_executor: ThreadPoolExecutor | None = None
+_background_executor_lock = threading.Lock()
+
+
+@dataclass(slots=True)
 class RequestInfo:
     """Information passed to on_request callback.
 
@@ -65,7 +79,7 @@ class RequestInfo:
     max_retries: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryInfo:
     """Information passed to on_retry callback.
 
@@ -88,7 +102,7 @@ class RetryInfo:
     status_code: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseInfo:
     """Information passed to on_success callback.
 
@@ -109,7 +123,7 @@ class ResponseInfo:
     total_time: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureInfo:
     """Information passed to on_failure callback.
 
@@ -132,7 +146,7 @@ class FailureInfo:
     total_time: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackInfo:
     """Unified callback information structure (for internal use).
 
@@ -212,7 +226,8 @@ def invoke_on_success(
             callback receives this as a 1-indexed value (attempt + 1).
         max_retries: Maximum number of retry attempts.
         response: The successful HTTP response object.
-        start_time: The timestamp when the request started.
+        start_time: The ``time.monotonic()`` timestamp when the request
+            started.
     """
     if on_success is not None:
         on_success(
@@ -222,7 +237,7 @@ def invoke_on_success(
                 attempt=attempt + 1,
                 max_retries=max_retries,
                 response=response,
-                total_time=time.time() - start_time,
+                total_time=time.monotonic() - start_time,
             )
         )
 
@@ -265,3 +280,60 @@ def invoke_on_retry(
                 status_code=last_status_code,
             )
         )
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    r"""Get the thread pool used to run the callbacks in the background.
+
+    Returns:
+        The shared thread pool.
+    """
+    global _background_executor  # noqa: PLW0603
+    if _background_executor is None:
+        with _background_executor_lock:
+            if _background_executor is None:
+                _background_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="aresilient-callbacks"
+                )
+    return _background_executor
+
+
+def _log_background_error(future: Future[None]) -> None:
+    r"""Log the exception raised by a callback run in the background.
+
+    Args:
+        future: The future of the callback.
+    """
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Callback run in the background failed", exc_info=exc)
+
+
+def run_in_background(callback: Callable[[T], None]) -> Callable[[T], None]:
+    r"""Wrap a callback so that it runs in a background thread.
+
+    The wrapped callback returns as soon as the call is submitted, so a
+    slow callback (e.g. sending metrics to a remote service) does not
+    delay the retry loop. The callbacks run one at a time in submission
+    order, and their exceptions are logged instead of being raised.
+
+    Args:
+        callback: The callback to wrap.
+
+    Returns:
+        The wrapped callback.
+
+    Example:
+        ```pycon
+        >>> from aresilient.callbacks import run_in_background
+        >>> on_retry = run_in_background(print)
+        >>> on_retry("retrying")  # doctest: +SKIP
+
+        ```
+    """
+
+    def wrapper(info: T) -> None:
+        future = _get_background_executor().submit(callback, info)
+        future.add_done_callback(_log_background_error)
+
+    return wrapper
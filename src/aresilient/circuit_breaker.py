@@ -165,6 +165,17 @@ class CircuitBreaker:
         ```
     """
 
+    __slots__ = (
+        "_expected_exception",
+        "_failure_count",
+        "_failure_threshold",
+        "_last_failure_time",
+        "_lock",
+        "_on_state_change",
+        "_recovery_timeout",
+        "_state",
+    )
+
     def __init__(
         self,
         *,
@@ -238,14 +249,16 @@ class CircuitBreaker:
         old_state = self._state
         if old_state != new_state:
             self._state = new_state
-            logger.debug(f"Circuit breaker state changed: {old_state.value} -> {new_state.value}")
+            logger.debug(
+                "Circuit breaker state changed: %s -> %s", old_state.value, new_state.value
+            )
 
             # Call state change callback if provided
             if self._on_state_change is not None:
                 try:
                     self._on_state_change(old_state, new_state)
                 except Exception as e:  # noqa: BLE001
-                    logger.warning(f"Error in circuit breaker state change callback: {e}")
+                    logger.warning("Error in circuit breaker state change callback: %s", e)
 
     def _handle_open_state(self) -> None:
         """Handle OPEN state: transition to HALF_OPEN or raise.
@@ -300,10 +313,13 @@ class CircuitBreaker:
 
             ```
         """
-        with self._lock:
-            current_state = self._state
+        # Fast path without the lock: a CLOSED or HALF_OPEN circuit lets the
+        # request proceed, and reading the state attribute is atomic
+        if self._state is not CircuitState.OPEN:
+            return
 
-            if current_state == CircuitState.OPEN:
+        with self._lock:
+            if self._state == CircuitState.OPEN:
                 self._handle_open_state()
 
     def call(self, func: Callable[[], object]) -> object:
@@ -411,8 +427,9 @@ class CircuitBreaker:
         ):
             # This exception type doesn't count, ignore it
             logger.debug(
-                f"Circuit breaker ignoring exception type {type(exception).__name__} "
-                f"(expected {self._expected_exception})"
+                "Circuit breaker ignoring exception type %s (expected %s)",
+                type(exception).__name__,
+                self._expected_exception,
             )
             return
 
@@ -421,15 +438,16 @@ class CircuitBreaker:
             self._last_failure_time = time.time()
 
             logger.debug(
-                f"Circuit breaker recorded failure "
-                f"({self._failure_count}/{self._failure_threshold})"
+                "Circuit breaker recorded failure (%d/%d)",
+                self._failure_count,
+                self._failure_threshold,
             )
 
             # Check if we should open the circuit
             if self._failure_count >= self._failure_threshold and self._state != CircuitState.OPEN:
                 self._change_state(CircuitState.OPEN)
                 logger.warning(
-                    f"Circuit breaker OPENED after {self._failure_count} consecutive failures"
+                    "Circuit breaker OPENED after %d consecutive failures", self._failure_count
                 )
 
     def reset(self) -> None:
@@ -15,12 +15,15 @@ from typing import TYPE_CHECKING, Any
 import httpx
 
 from aresilient.core.config import (
+    _DEFAULT_CONFIG,
     DEFAULT_TIMEOUT,
     ClientConfig,
 )
+from aresilient.core.methods import get_method_attr, normalize_method
 from aresilient.request import request
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from types import TracebackType
     from typing import Self
 
@@ -36,13 +39,13 @@ class ResilientClient:
     Two usage patterns are supported:
 
     **Scenario 1 - Two context managers (external lifecycle management)**:
-    The ``httpx.Client`` is created and managed by an outer ``with`` block,
-    and passed into ``ResilientClient``. ``ResilientClient`` does *not* close
-    the underlying client when it exits, leaving full control to the caller.
-    Use this pattern when you need to share a single ``httpx.Client`` across
-    multiple ``ResilientClient`` instances, or when you need to configure the
-    ``httpx.Client`` with headers, auth, proxies, etc. and want explicit
-    lifecycle control.
+    The ``httpx.Client`` is created and managed by the caller, e.g. with an
+    outer ``with`` block, and passed into ``ResilientClient``.
+    ``ResilientClient`` never enters nor closes a client that was passed to
+    it, leaving full control to the caller. Use this pattern when you need
+    to share a single ``httpx.Client`` across multiple ``ResilientClient``
+    instances, or when you need to configure the ``httpx.Client`` with
+    headers, auth, proxies, etc.
 
     .. code-block:: python
 
@@ -58,33 +61,42 @@ class ResilientClient:
         # http_client is closed here by the outer ``with`` block
 
     **Scenario 2 - Single context manager (ResilientClient manages lifecycle)**:
-    An ``httpx.Client`` instance is passed inline (or omitted, in which case a
-    default client is created). ``ResilientClient`` enters and closes the
-    underlying client automatically when the ``with`` block exits.
-    Use this pattern for the simplest usage when you don't need to reuse the
-    ``httpx.Client`` outside the ``with`` block.
+    If no ``httpx.Client`` is passed, ``ResilientClient`` creates a default
+    one, enters it, and closes it automatically when the ``with`` block
+    exits. Use this pattern for the simplest usage.
 
     .. code-block:: python
 
-        import httpx
         from aresilient import ResilientClient
         from aresilient.core.config import ClientConfig
 
-        with ResilientClient(
-            client=httpx.Client(), config=ClientConfig(max_retries=5)
-        ) as client:
+        with ResilientClient(config=ClientConfig(max_retries=5)) as client:
             response = client.get("https://api.example.com/data1")
-        # httpx.Client is closed here by ResilientClient
+        # The default httpx.Client is closed here by ResilientClient
 
-        # Equivalent shorthand (ResilientClient creates a default client):
-        with ResilientClient(config=ClientConfig(max_retries=5)) as client:
+    **Scenario 3 - Long-lived client (manual lifecycle management)**:
+    ``open()`` and ``close()`` have the same behavior as ``__enter__`` and
+    ``__exit__`` without requiring a ``with`` block. Use this pattern to
+    create a single client that is shared across call sites (e.g. the
+    request handlers of a web server) instead of entering a new context
+    manager for every request.
+
+    .. code-block:: python
+
+        from aresilient import ResilientClient
+
+        client = ResilientClient().open()
+        try:
             response = client.get("https://api.example.com/data1")
+        finally:
+            client.close()
 
     Args:
         config: Optional ClientConfig instance for retry configuration.
             If ``None``, a default ClientConfig is used.
-        client: Optional httpx.Client instance to use for requests.
-            If ``None``, a new client is created with the default timeout.
+        client: Optional httpx.Client instance to use for requests. Its
+            lifecycle is managed by the caller. If ``None``, a new client
+            is created with the default timeout and closed on exit.
 
     Example:
         ```pycon
@@ -103,31 +115,36 @@ class ResilientClient:
         use the resilience parameters defined in the ``config`` passed to the constructor.
     """
 
+    __slots__ = ("_client", "_close_client", "_config", "_method_map", "_owns_client")
+
     def __init__(
         self,
         *,
         config: ClientConfig | None = None,
         client: httpx.Client | None = None,
     ) -> None:
-        self._config: ClientConfig = config or ClientConfig()
+        self._config: ClientConfig = config if config is not None else _DEFAULT_CONFIG
         self._client: httpx.Client = client or httpx.Client(timeout=DEFAULT_TIMEOUT)
+        # The httpx client is closed on exit only if it was created here
+        self._owns_client = client is None
         self._close_client = False
+        # Request functions are bound on first use of each method, so a
+        # short-lived client only binds the methods it actually sends
+        self._method_map: dict[str, Callable[..., httpx.Response]] = {}
 
     def __enter__(self) -> Self:
         """Enter the context manager.
 
-        If the underlying ``httpx.Client`` is not yet open, it is entered and
-        its lifecycle is managed by this context manager (closed on exit).
-        If the client is already open (e.g. managed by an outer ``with``
-        block), ``ResilientClient`` uses it without closing it on exit.
+        If the underlying ``httpx.Client`` was created by
+        ``ResilientClient``, it is entered and its lifecycle is managed by
+        this context manager (closed on exit). A client passed to the
+        constructor is used as-is and is never closed by
+        ``ResilientClient``.
 
         Returns:
             The ResilientClient instance for making requests.
         """
-        if self._client.is_closed:
-            self._client.__enter__()
-            self._close_client = True
-        return self
+        return self.open()
 
     def __exit__(
         self,
@@ -136,7 +153,7 @@ class ResilientClient:
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit the context manager and close the underlying httpx
-        client if this context manager opened it.
+        client if ``ResilientClient`` created and opened it.
 
         Args:
             exc_type: Exception type if an exception occurred.
@@ -147,9 +164,58 @@ class ResilientClient:
             self._client.__exit__(exc_type, exc_val, exc_tb)
             self._close_client = False
 
+    def open(self) -> Self:
+        r"""Open the client without using a ``with`` block.
+
+        This method has the same behavior as ``__enter__`` and must be
+        paired with ``close()``. It is useful to keep a single
+        long-lived client, e.g. one instance shared by all the request
+        handlers of a web server, instead of creating a new client for
+        every call site.
+
+        Returns:
+            The ResilientClient instance for making requests.
+
+        Example:
+            ```pycon
+            >>> from aresilient import ResilientClient
+            >>> client = ResilientClient().open()  # doctest: +SKIP
+            >>> try:  # doctest: +SKIP
+            ...     response = client.get("https://api.example.com/data")
+            ... finally:
+            ...     client.close()
+            ...
+
+            ```
+        """
+        if self._owns_client and not self._close_client:
+            self._client.__enter__()
+            self._close_client = True
+        return self
+
+    def close(self) -> None:
+        r"""Close the underlying httpx client if this client opened it.
+
+        This method has the same behavior as ``__exit__`` when no
+        exception occurred. It can be called several times.
+
+        Example:
+            ```pycon
+            >>> from aresilient import ResilientClient
+            >>> client = ResilientClient().open()  # doctest: +SKIP
+            >>> client.close()  # doctest: +SKIP
+
+            ```
+        """
+        self.__exit__(None, None, None)
+
     def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         r"""Send an HTTP request with automatic retry logic.
 
+        The verb methods (``get()``, ``post()``, etc.) send their
+        requests through this method, so a subclass can override it to
+        customize every request.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, etc.).
             url: The URL to send the request to.
@@ -170,13 +236,27 @@ class ResilientClient:
 
             ```
         """
-        return request(
-            url=url,
-            method=method,
-            request_func=getattr(self._client, method.lower()),
-            config=self._config,
-            **kwargs,
-        )
+        return self._request(normalize_method(method), url, kwargs)
+
+    def _request(self, method: str, url: str, kwargs: dict[str, Any]) -> httpx.Response:
+        """Send a request whose keyword arguments are already packed.
+
+        The keyword arguments are forwarded as-is, so they are unpacked
+        only once, when the underlying request function is called.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, etc.).
+            url: The URL to send the request to.
+            kwargs: Keyword arguments passed to the underlying request function.
+
+        Returns:
+            An httpx.Response object containing the server's HTTP response.
+        """
+        request_func = self._method_map.get(method)
+        if request_func is None:
+            request_func = getattr(self._client, get_method_attr(method))
+            self._method_map[method] = request_func
+        return request(url, method, request_func, config=self._config, **kwargs)
 
     def get(self, url: str, **kwargs: Any) -> httpx.Response:
         r"""Send an HTTP GET request with automatic retry logic.
@@ -11,21 +11,41 @@ from __future__ import annotations
 
 __all__ = ["AsyncResilientClient"]
 
+import asyncio
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import httpx
 
 from aresilient.core.config import (
+    _DEFAULT_CONFIG,
     DEFAULT_TIMEOUT,
     ClientConfig,
 )
+from aresilient.core.methods import get_method_attr, normalize_method
 from aresilient.request_async import request_async
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
     from types import TracebackType
     from typing import Self
 
 
+class _HostLimit:
+    r"""Bound the GET requests in flight for one host.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight for the host.
+    """
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Number of requests running or waiting on the semaphore
+        self.users = 0
+
+
 class AsyncResilientClient:
     r"""Asynchronous context manager for resilient HTTP requests.
 
@@ -37,13 +57,13 @@ class AsyncResilientClient:
     Two usage patterns are supported:
 
     **Scenario 1 - Two context managers (external lifecycle management)**:
-    The ``httpx.AsyncClient`` is created and managed by an outer ``async with``
-    block, and passed into ``AsyncResilientClient``. ``AsyncResilientClient``
-    does *not* close the underlying client when it exits, leaving full control
-    to the caller. Use this pattern when you need to share a single
+    The ``httpx.AsyncClient`` is created and managed by the caller, e.g.
+    with an outer ``async with`` block, and passed into
+    ``AsyncResilientClient``. ``AsyncResilientClient`` never enters nor
+    closes a client that was passed to it, leaving full control to the
+    caller. Use this pattern when you need to share a single
     ``httpx.AsyncClient`` across multiple ``AsyncResilientClient`` instances,
     or when you need to configure the client with headers, auth, proxies, etc.
-    and want explicit lifecycle control.
 
     .. code-block:: python
 
@@ -59,33 +79,48 @@ class AsyncResilientClient:
         # http_client is closed here by the outer ``async with`` block
 
     **Scenario 2 - Single context manager (AsyncResilientClient manages lifecycle)**:
-    An ``httpx.AsyncClient`` instance is passed inline (or omitted, in which
-    case a default client is created). ``AsyncResilientClient`` enters and
-    closes the underlying client automatically when the ``async with`` block
-    exits. Use this pattern for the simplest usage when you don't need to
-    reuse the ``httpx.AsyncClient`` outside the ``async with`` block.
+    If no ``httpx.AsyncClient`` is passed, ``AsyncResilientClient`` creates
+    a default one, enters it, and closes it automatically when the
+    ``async with`` block exits. Use this pattern for the simplest usage.
 
     .. code-block:: python
 
-        import httpx
         from aresilient import AsyncResilientClient
         from aresilient.core.config import ClientConfig
 
-        async with AsyncResilientClient(
-            client=httpx.AsyncClient(), config=ClientConfig(max_retries=5)
-        ) as client:
+        async with AsyncResilientClient(config=ClientConfig(max_retries=5)) as client:
             response = await client.get("https://api.example.com/data1")
-        # httpx.AsyncClient is closed here by AsyncResilientClient
+        # The default httpx.AsyncClient is closed here by AsyncResilientClient
 
-        # Equivalent shorthand (AsyncResilientClient creates a default client):
-        async with AsyncResilientClient(config=ClientConfig(max_retries=5)) as client:
+    **Scenario 3 - Long-lived client (manual lifecycle management)**:
+    ``aopen()`` and ``aclose()`` have the same behavior as ``__aenter__`` and
+    ``__aexit__`` without requiring an ``async with`` block. Use this pattern
+    to create a single client that is shared across call sites (e.g. the
+    request handlers of a web server) instead of entering a new context
+    manager for every request.
+
+    .. code-block:: python
+
+        from aresilient import AsyncResilientClient
+
+        client = await AsyncResilientClient().aopen()
+        try:
             response = await client.get("https://api.example.com/data1")
+        finally:
+            await client.aclose()
 
     Args:
         config: Optional ClientConfig instance for retry configuration.
             If ``None``, a default ClientConfig is used.
-        client: Optional httpx.AsyncClient instance to use for requests.
-            If ``None``, a new client is created with the default timeout.
+        client: Optional httpx.AsyncClient instance to use for requests. Its
+            lifecycle is managed by the caller. If ``None``, a new client
+            is created with the default timeout and closed on exit.
+        max_concurrency_per_host: Optional maximum number of GET requests
+            in flight per host. If set, every GET request, sent by
+            ``get()``, ``request()`` or ``gather()``, waits on a per-host
+            semaphore before it is sent, so one busy host cannot take all
+            the connections of the pool. If ``None``, GET requests are
+            sent directly.
 
     Example:
         ```pycon
@@ -105,36 +140,55 @@ class AsyncResilientClient:
         ```
 
     Note:
-        All HTTP method calls (get, post, put, delete, patch, head, options, request)
-        use the resilience parameters defined in the ``config`` passed to the constructor.
+        All HTTP method calls (get, post, put, delete, patch, head, options, request,
+        gather) use the resilience parameters defined in the ``config`` passed to the
+        constructor.
     """
 
+    __slots__ = (
+        "_client",
+        "_close_client",
+        "_config",
+        "_host_limits",
+        "_max_concurrency_per_host",
+        "_method_map",
+        "_owns_client",
+    )
+
     def __init__(
         self,
         *,
         config: ClientConfig | None = None,
         client: httpx.AsyncClient | None = None,
+        max_concurrency_per_host: int | None = None,
     ) -> None:
-        self._config = config or ClientConfig()
+        if max_concurrency_per_host is not None and max_concurrency_per_host < 1:
+            msg = f"max_concurrency_per_host must be > 0, got {max_concurrency_per_host}"
+            raise ValueError(msg)
+        self._config = config if config is not None else _DEFAULT_CONFIG
         self._client: httpx.AsyncClient = client or httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
+        # The httpx client is closed on exit only if it was created here
+        self._owns_client = client is None
         self._close_client = False
+        # Request functions are bound on first use of each method, so a
+        # short-lived client only binds the methods it actually sends
+        self._method_map: dict[str, Callable[..., Awaitable[httpx.Response]]] = {}
+        self._max_concurrency_per_host = max_concurrency_per_host
+        self._host_limits: dict[str, _HostLimit] = {}
 
     async def __aenter__(self) -> Self:
         """Enter the async context manager.
 
-        If the underlying ``httpx.AsyncClient`` is not yet open, it is
-        entered and its lifecycle is managed by this context manager (closed
-        on exit). If the client is already open (e.g. managed by an outer
-        ``async with`` block), ``AsyncResilientClient`` uses it without
-        closing it on exit.
+        If the underlying ``httpx.AsyncClient`` was created by
+        ``AsyncResilientClient``, it is entered and its lifecycle is
+        managed by this context manager (closed on exit). A client passed
+        to the constructor is used as-is and is never closed by
+        ``AsyncResilientClient``.
 
         Returns:
             The AsyncResilientClient instance for making requests.
         """
-        if self._client.is_closed:
-            await self._client.__aenter__()
-            self._close_client = True
-        return self
+        return await self.aopen()
 
     async def __aexit__(
         self,
@@ -143,7 +197,7 @@ class AsyncResilientClient:
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit the async context manager and close the underlying httpx
-        client if this context manager opened it.
+        client if ``AsyncResilientClient`` created and opened it.
 
         Args:
             exc_type: Exception type if an exception occurred.
@@ -154,9 +208,65 @@ class AsyncResilientClient:
             await self._client.__aexit__(exc_type, exc_val, exc_tb)
             self._close_client = False
 
+    async def aopen(self) -> Self:
+        r"""Open the client without using an ``async with`` block.
+
+        This method has the same behavior as ``__aenter__`` and must be
+        paired with ``aclose()``. It is useful to keep a single
+        long-lived client, e.g. one instance shared by all the request
+        handlers of a web server, instead of creating a new client for
+        every call site.
+
+        Returns:
+            The AsyncResilientClient instance for making requests.
+
+        Example:
+            ```pycon
+            >>> import asyncio
+            >>> from aresilient import AsyncResilientClient
+            >>> async def main():  # doctest: +SKIP
+            ...     client = await AsyncResilientClient().aopen()
+            ...     try:
+            ...         response = await client.get("https://api.example.com/data")
+            ...     finally:
+            ...         await client.aclose()
+            ...
+            >>> asyncio.run(main())  # doctest: +SKIP
+
+            ```
+        """
+        if self._owns_client and not self._close_client:
+            await self._client.__aenter__()
+            self._close_client = True
+        return self
+
+    async def aclose(self) -> None:
+        r"""Close the underlying httpx client if this client opened it.
+
+        This method has the same behavior as ``__aexit__`` when no
+        exception occurred. It can be called several times.
+
+        Example:
+            ```pycon
+            >>> import asyncio
+            >>> from aresilient import AsyncResilientClient
+            >>> async def main():  # doctest: +SKIP
+            ...     client = await AsyncResilientClient().aopen()
+            ...     await client.aclose()
+            ...
+            >>> asyncio.run(main())  # doctest: +SKIP
+
+            ```
+        """
+        await self.__aexit__(None, None, None)
+
     async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         r"""Send an HTTP request with automatic retry logic.
 
+        The verb methods (``get()``, ``post()``, etc.) send their
+        requests through this method, so a subclass can override it to
+        customize every request.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, etc.).
             url: The URL to send the request to.
@@ -180,13 +290,64 @@ class AsyncResilientClient:
 
             ```
         """
-        return await request_async(
-            url=url,
-            method=method,
-            request_func=getattr(self._client, method.lower()),
-            config=self._config,
-            **kwargs,
-        )
+        return await self._request(normalize_method(method), url, kwargs)
+
+    async def _request(self, method: str, url: str, kwargs: dict[str, Any]) -> httpx.Response:
+        """Send a request whose keyword arguments are already packed.
+
+        The keyword arguments are forwarded as-is, so they are unpacked
+        only once, when the underlying request function is called.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, etc.).
+            url: The URL to send the request to.
+            kwargs: Keyword arguments passed to the underlying request function.
+
+        Returns:
+            An httpx.Response object containing the server's HTTP response.
+        """
+        request_func = self._method_map.get(method)
+        if request_func is None:
+            request_func = getattr(self._client, get_method_attr(method))
+            self._method_map[method] = request_func
+        if method == "GET" and self._max_concurrency_per_host is not None:
+            return await self._request_per_host(url, request_func, kwargs)
+        return await request_async(url, method, request_func, config=self._config, **kwargs)
+
+    async def _request_per_host(
+        self,
+        url: str,
+        request_func: Callable[..., Awaitable[httpx.Response]],
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        """Send a GET request once the limit of its host allows it.
+
+        The limit of a host is created by its first request, and removed
+        once no request of the host is running or waiting, so a client
+        that sends requests to many hosts does not keep one limit per
+        host.
+
+        Args:
+            url: The URL to send the request to.
+            request_func: The function that sends the GET request.
+            kwargs: Keyword arguments passed to the request function.
+
+        Returns:
+            An httpx.Response object containing the server's HTTP response.
+        """
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = _HostLimit(self._max_concurrency_per_host)
+            self._host_limits[host] = limit
+        limit.users += 1
+        try:
+            async with limit.semaphore:
+                return await request_async(url, "GET", request_func, config=self._config, **kwargs)
+        finally:
+            limit.users -= 1
+            if not limit.users:
+                del self._host_limits[host]
 
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         r"""Send an HTTP GET request with automatic retry logic.
@@ -361,3 +522,76 @@ class AsyncResilientClient:
             ```
         """
         return await self.request(method="OPTIONS", url=url, **kwargs)
+
+    async def gather(
+        self,
+        specs: Iterable[tuple[str, str, dict[str, Any]]],
+        *,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[httpx.Response | BaseException]:
+        r"""Send a batch of HTTP requests concurrently with automatic retry
+        logic.
+
+        Each request is sent with the same resilience parameters as
+        ``request()``. An ``asyncio.Semaphore`` bounds the number of
+        requests in flight, so a large batch does not stampede the
+        connection pool, in particular when many requests are retried
+        at the same time.
+
+        Args:
+            specs: The requests to send, as ``(method, url, kwargs)``
+                tuples where ``kwargs`` holds the keyword arguments
+                passed to httpx.AsyncClient.request().
+            max_concurrency: Maximum number of requests in flight at the
+                same time. If ``None``, the concurrency is not bounded.
+            return_exceptions: If ``True``, the exceptions raised by the
+                requests are returned in the result list instead of
+                being raised.
+
+        Returns:
+            The responses (or exceptions if ``return_exceptions`` is
+                ``True``), in the same order as ``specs``.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is not positive.
+            HttpRequestError: If a request fails after all retries and
+                ``return_exceptions`` is ``False``.
+
+        Example:
+            ```pycon
+            >>> import asyncio
+            >>> from aresilient import AsyncResilientClient
+            >>> async def main():  # doctest: +SKIP
+            ...     async with AsyncResilientClient() as client:
+            ...         responses = await client.gather(
+            ...             [
+            ...                 ("GET", "https://api.example.com/data1", {}),
+            ...                 ("POST", "https://api.example.com/data2", {"json": {"key": 1}}),
+            ...             ],
+            ...             max_concurrency=10,
+            ...         )
+            ...
+            >>> asyncio.run(main())  # doctest: +SKIP
+
+            ```
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = f"max_concurrency must be > 0, got {max_concurrency}"
+            raise ValueError(msg)
+        # Every spec is checked before any coroutine is created, so an
+        # invalid spec does not leave coroutines that are never awaited
+        specs = [(normalize_method(method), url, kwargs) for method, url, kwargs in specs]
+        if max_concurrency is None:
+            coros = [self._request(method, url, kwargs) for method, url, kwargs in specs]
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _bounded_request(
+                method: str, url: str, kwargs: dict[str, Any]
+            ) -> httpx.Response:
+                async with semaphore:
+                    return await self._request(method, url, kwargs)
+
+            coros = [_bounded_request(method, url, kwargs) for method, url, kwargs in specs]
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
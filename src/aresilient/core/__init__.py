@@ -8,12 +8,23 @@ logic, and HTTP method handling.
 from __future__ import annotations
 
 __all__ = [
+    "DEFAULT_LIMITS",
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_TIMEOUT",
+    "HTTP_METHODS",
+    "HTTP_METHOD_ATTRS",
+    "HTTP_METHOD_NAMES",
+    "MAX_DEFAULT_CLIENTS",
     "RETRY_STATUS_CODES",
     "ClientConfig",
+    "async_session",
+    "close_default_clients",
     "execute_http_method",
     "execute_http_method_async",
+    "get_default_async_client",
+    "get_default_client",
+    "get_method_attr",
+    "normalize_method",
     "should_retry_exception",
     "should_retry_response",
     "validate_retry_params",
@@ -27,10 +38,25 @@ from aresilient.core.config import (
     RETRY_STATUS_CODES,
     ClientConfig,
 )
+from aresilient.core.default_clients import (
+    DEFAULT_LIMITS,
+    MAX_DEFAULT_CLIENTS,
+    async_session,
+    close_default_clients,
+    get_default_async_client,
+    get_default_client,
+)
 from aresilient.core.http_logic import (
     execute_http_method,
     execute_http_method_async,
 )
+from aresilient.core.methods import (
+    HTTP_METHOD_ATTRS,
+    HTTP_METHOD_NAMES,
+    HTTP_METHODS,
+    get_method_attr,
+    normalize_method,
+)
 from aresilient.core.retry_logic import (
     should_retry_exception,
     should_retry_response,
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from aresilient.backoff import BaseBackoffStrategy
     from aresilient.callbacks import FailureInfo, RequestInfo, ResponseInfo, RetryInfo
     from aresilient.circuit_breaker import CircuitBreaker
+    from aresilient.retry.budget import RetryBudget
 
 
 # Default timeout in seconds for HTTP requests
@@ -47,7 +48,7 @@ DEFAULT_MAX_RETRIES = 3
 RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClientConfig:
     """Configuration for ResilientClient retry behavior.
 
@@ -58,6 +59,9 @@ class ClientConfig:
     Note:
         The timeout parameter is NOT included in this config as it is used
         directly by httpx.Client/AsyncClient, not by aresilient's retry logic.
+        ClientConfig is immutable, so a single instance can be safely shared
+        by many requests and clients. Use ``dataclasses.replace`` to derive a
+        config with different values.
 
     Args:
         max_retries: Maximum number of retry attempts for failed requests. Must be >= 0.
@@ -73,6 +77,12 @@ class ClientConfig:
         on_retry: Optional callback called before each retry (after backoff).
         on_success: Optional callback called when request succeeds.
         on_failure: Optional callback called when all retries are exhausted.
+        background_callbacks: If ``True``, the callbacks run in a background
+            thread, so slow callbacks do not delay the retry loop. The
+            callbacks still run one at a time in the order of the events,
+            and their exceptions are logged instead of being raised.
+        retry_budget: Optional retry budget shared by requests to limit
+            their retries to a fraction of the successful requests.
 
     Example:
         ```pycon
@@ -88,7 +98,7 @@ class ClientConfig:
     """
 
     max_retries: int = DEFAULT_MAX_RETRIES
-    status_forcelist: tuple[int, ...] = field(default_factory=lambda: RETRY_STATUS_CODES)
+    status_forcelist: tuple[int, ...] = RETRY_STATUS_CODES
     jitter_factor: float = 0.0
     retry_if: Callable[[httpx.Response | None, Exception | None], bool] | None = None
     backoff_strategy: BaseBackoffStrategy = field(default_factory=ExponentialBackoff)
@@ -99,6 +109,8 @@ class ClientConfig:
     on_retry: Callable[[RetryInfo], None] | None = None
     on_success: Callable[[ResponseInfo], None] | None = None
     on_failure: Callable[[FailureInfo], None] | None = None
+    background_callbacks: bool = False
+    retry_budget: RetryBudget | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration parameters after initialization.
@@ -147,4 +159,11 @@ class ClientConfig:
             "on_retry": self.on_retry,
             "on_success": self.on_success,
             "on_failure": self.on_failure,
+            "background_callbacks": self.background_callbacks,
+            "retry_budget": self.retry_budget,
         }
+
+
+# Shared configuration used when no config is passed, so that the default
+# ClientConfig is not constructed and validated again on every request
+_DEFAULT_CONFIG = ClientConfig()
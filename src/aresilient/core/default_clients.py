@@ -0,0 +1,232 @@
+r"""Shared default httpx clients for the module-level request functions.
+
+This module keeps one ``httpx.Client`` per timeout value for the
+synchronous request functions (``get``, ``post``, ...) that are called
+without a client, so that consecutive calls reuse the same connection
+pool instead of opening a new TCP (and TLS) connection every time.
+The default clients use larger connection pool limits than the httpx
+defaults, so that more idle connections survive between bursts of
+requests. At most ``MAX_DEFAULT_CLIENTS`` default clients are kept, and
+they do not store the cookies set by the responses, so that unrelated
+calls do not share cookies.
+
+The asynchronous request functions can not share a process-wide client,
+because an ``httpx.AsyncClient`` is bound to the event loop it is used
+in. Instead, ``async_session`` opens a default ``httpx.AsyncClient`` for
+the current context, which the asynchronous request functions called
+without a client use until the session exits.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "MAX_DEFAULT_CLIENTS",
+    "async_session",
+    "close_default_clients",
+    "get_default_async_client",
+    "get_default_client",
+]
+
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from http.cookiejar import CookieJar
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from aresilient.core.config import DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    import urllib.request
+    from collections.abc import AsyncIterator
+
+# Connection pool limits of the default clients. The httpx defaults keep at
+# most 20 idle connections for 5 seconds, which forces new handshakes when
+# the requests come in bursts
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=1024, max_keepalive_connections=512, keepalive_expiry=30.0
+)
+
+# Maximum number of default clients kept at the same time. A caller that
+# computes its timeouts would otherwise create a client, and its connection
+# pool, for every distinct timeout value
+MAX_DEFAULT_CLIENTS = 8
+
+# Default clients keyed by their timeout, from the least to the most
+# recently used. The lock guards every access, because a lookup also
+# updates the order of the clients
+_default_clients: OrderedDict[Any, httpx.Client] = OrderedDict()
+_default_clients_lock = threading.Lock()
+
+# Default async client of the current context, set by async_session. A
+# context variable keeps the sessions of concurrent tasks and threads apart
+_default_async_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "aresilient_default_async_client", default=None
+)
+
+
+class _NoPersistenceCookieJar(CookieJar):
+    r"""Cookie jar that does not store the cookies set by the responses.
+
+    The cookies passed to a request are still sent, and the cookies of
+    a response are still available in ``response.cookies``.
+    """
+
+    def extract_cookies(
+        self,
+        response: Any,
+        request: urllib.request.Request,
+    ) -> None:
+        r"""Ignore the cookies set by a response."""
+
+
+def _get_timeout_key(timeout: float | httpx.Timeout) -> Any:
+    r"""Get a hashable key for a timeout value.
+
+    Args:
+        timeout: The timeout value.
+
+    Returns:
+        The timeout itself for numbers, or the tuple of its connect,
+            read, write and pool timeouts for ``httpx.Timeout`` objects.
+    """
+    if isinstance(timeout, httpx.Timeout):
+        return (timeout.connect, timeout.read, timeout.write, timeout.pool)
+    return timeout
+
+
+def get_default_client(timeout: float | httpx.Timeout) -> httpx.Client:
+    r"""Get the shared default client for a timeout.
+
+    The client is created on the first call for a given timeout and then
+    reused by the following calls, until ``close_default_clients`` is
+    called. When more than ``MAX_DEFAULT_CLIENTS`` timeouts are used,
+    the least recently used client is closed.
+
+    The client does not store the cookies set by the responses, so the
+    cookies of a call are not sent by the following calls.
+
+    Args:
+        timeout: Maximum seconds to wait for the server response.
+
+    Returns:
+        The shared ``httpx.Client`` configured with this timeout and
+            ``DEFAULT_LIMITS``.
+
+    Example:
+        ```pycon
+        >>> from aresilient.core import close_default_clients, get_default_client
+        >>> client = get_default_client(10.0)
+        >>> client is get_default_client(10.0)
+        True
+        >>> close_default_clients()
+
+        ```
+    """
+    key = _get_timeout_key(timeout)
+    evicted = None
+    with _default_clients_lock:
+        client = _default_clients.get(key)
+        if client is None:
+            client = httpx.Client(
+                timeout=timeout, limits=DEFAULT_LIMITS, cookies=_NoPersistenceCookieJar()
+            )
+            _default_clients[key] = client
+            if len(_default_clients) > MAX_DEFAULT_CLIENTS:
+                _, evicted = _default_clients.popitem(last=False)
+        else:
+            _default_clients.move_to_end(key)
+    if evicted is not None:
+        evicted.close()
+    return client
+
+
+def close_default_clients() -> None:
+    r"""Close the shared default clients.
+
+    The clients are closed automatically when the interpreter exits.
+    This function can be called to release the connections earlier,
+    and the next request creates a new default client.
+
+    Example:
+        ```pycon
+        >>> from aresilient import close_default_clients
+        >>> close_default_clients()
+
+        ```
+    """
+    with _default_clients_lock:
+        clients = list(_default_clients.values())
+        _default_clients.clear()
+    for client in clients:
+        client.close()
+
+
+def get_default_async_client() -> httpx.AsyncClient | None:
+    r"""Get the default async client of the current context.
+
+    Returns:
+        The ``httpx.AsyncClient`` opened by the innermost active
+            ``async_session``, or ``None`` outside of a session.
+
+    Example:
+        ```pycon
+        >>> from aresilient.core import get_default_async_client
+        >>> get_default_async_client() is None
+        True
+
+        ```
+    """
+    return _default_async_client.get()
+
+
+@asynccontextmanager
+async def async_session(
+    timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+) -> AsyncIterator[httpx.AsyncClient]:
+    r"""Open a default async client for the current context.
+
+    Inside the session, the asynchronous request functions (``get_async``,
+    ``post_async``, ...) called without a client reuse the session client,
+    and its connection pool, instead of creating and closing a new client
+    for every call. The setting is inherited by the tasks created inside
+    the session, for example with ``asyncio.gather``. The client is closed
+    when the session exits.
+
+    Args:
+        timeout: Maximum seconds to wait for the server response. A
+            request function called with an explicit timeout uses its
+            own timeout instead.
+
+    Yields:
+        The session ``httpx.AsyncClient``, configured with this timeout
+            and ``DEFAULT_LIMITS``.
+
+    Example:
+        ```pycon
+        >>> import asyncio
+        >>> from aresilient import async_session, get_async
+        >>> async def main():
+        ...     async with async_session():
+        ...         return await asyncio.gather(
+        ...             get_async("https://api.example.com/data1"),
+        ...             get_async("https://api.example.com/data2"),
+        ...         )
+        ...
+        >>> responses = asyncio.run(main())  # doctest: +SKIP
+
+        ```
+    """
+    async with httpx.AsyncClient(timeout=timeout, limits=DEFAULT_LIMITS) as client:
+        token = _default_async_client.set(client)
+        try:
+            yield client
+        finally:
+            _default_async_client.reset(token)
+
+
+atexit.register(close_default_clients)
@@ -13,11 +13,46 @@ from typing import Any
 import httpx
 
 from aresilient.core.config import DEFAULT_TIMEOUT, ClientConfig
+from aresilient.core.default_clients import get_default_async_client, get_default_client
+from aresilient.core.methods import HTTP_METHODS, HTTP_METHOD_ATTRS, normalize_method
 from aresilient.core.validation import validate_timeout
 from aresilient.request import request
 from aresilient.request_async import request_async
 
 
+def _prepare_request(
+    method: str, timeout: float | httpx.Timeout, client: httpx.Client | httpx.AsyncClient | None
+) -> tuple[str, str]:
+    r"""Validate the request parameters shared by the sync and async
+    HTTP methods.
+
+    Args:
+        method: The HTTP method name (e.g., "GET", "post").
+        timeout: Maximum seconds to wait for the server response.
+        client: The client passed by the caller, if any.
+
+    Returns:
+        A tuple with the uppercase HTTP method name, which is used in the
+            logs and error messages, and the lowercase name of the httpx
+            client method.
+
+    Raises:
+        ValueError: If the timeout is invalid or the HTTP method is not
+            supported.
+    """
+    # Validate timeout (not part of ClientConfig). The timeout is only used
+    # to create a client, and the default is known to be valid, so it is only
+    # checked when the caller passed a timeout but no client
+    if client is None and timeout is not DEFAULT_TIMEOUT:
+        validate_timeout(timeout)
+    name = normalize_method(method)
+    attr = HTTP_METHOD_ATTRS.get(name)
+    if attr is None:
+        msg = f"Unsupported HTTP method: {method!r} (supported methods: {', '.join(HTTP_METHODS)})"
+        raise ValueError(msg)
+    return name, attr
+
+
 def execute_http_method(
     url: str,
     method: str,
@@ -30,17 +65,18 @@ def execute_http_method(
     """Execute an HTTP method with automatic retry logic (synchronous).
 
     This is the core shared logic for all synchronous HTTP methods.
-    It handles client creation, parameter validation, and cleanup.
+    It handles client selection and parameter validation.
 
     Args:
         url: The URL to send the request to.
         method: The HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS).
         client: An optional httpx.Client object to use for making requests.
-            If None, a new client will be created and closed after use.
+            If None, a shared default client for the timeout is used and
+            kept open between calls (see ``close_default_clients``).
         config: An optional ClientConfig object with retry configuration.
             If None, default ClientConfig values are used.
         timeout: Maximum seconds to wait for the server response.
-            Only used if client is None. Must be > 0.
+            Only used, and validated, if client is None. Must be > 0.
         **kwargs: Additional keyword arguments passed to the client method.
 
     Returns:
@@ -48,27 +84,24 @@ def execute_http_method(
 
     Raises:
         HttpRequestError: If the request fails after exhausting all retries.
-        ValueError: If parameters are invalid.
+        ValueError: If parameters are invalid or the HTTP method is not
+            supported.
     """
-    # Validate timeout (not part of ClientConfig)
-    validate_timeout(timeout)
-
-    # Client management
-    owns_client = client is None
-    client = client or httpx.Client(timeout=timeout)
-    try:
-        # Get the appropriate request method from the client
-        request_func = getattr(client, method.lower())
-        return request(
-            url=url,
-            method=method,
-            request_func=request_func,
-            config=config,
-            **kwargs,
-        )
-    finally:
-        if owns_client:
-            client.close()
+    method, attr = _prepare_request(method, timeout, client)
+
+    # Client management: reuse the shared default client, and its connection
+    # pool, when the caller did not pass a client
+    if client is None:
+        client = get_default_client(timeout)
+    # Get the appropriate request method from the client
+    request_func = getattr(client, attr)
+    return request(
+        url=url,
+        method=method,
+        request_func=request_func,
+        config=config,
+        **kwargs,
+    )
 
 
 async def execute_http_method_async(
@@ -83,17 +116,20 @@ async def execute_http_method_async(
     """Execute an HTTP method with automatic retry logic (asynchronous).
 
     This is the core shared logic for all asynchronous HTTP methods.
-    It handles client creation, parameter validation, and cleanup.
+    It handles client selection and creation, parameter validation, and
+    cleanup.
 
     Args:
         url: The URL to send the request to.
         method: The HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS).
         client: An optional httpx.AsyncClient object to use for making requests.
-            If None, a new client will be created and closed after use.
+            If None, the client of the current ``async_session`` is used,
+            or a new client is created and closed after use outside of a
+            session.
         config: An optional ClientConfig object with retry configuration.
             If None, default ClientConfig values are used.
         timeout: Maximum seconds to wait for the server response.
-            Only used if client is None. Must be > 0.
+            Only used, and validated, if client is None. Must be > 0.
         **kwargs: Additional keyword arguments passed to the client method.
 
     Returns:
@@ -101,17 +137,22 @@ async def execute_http_method_async(
 
     Raises:
         HttpRequestError: If the request fails after exhausting all retries.
-        ValueError: If parameters are invalid.
+        ValueError: If parameters are invalid or the HTTP method is not
+            supported.
     """
-    # Validate timeout (not part of ClientConfig)
-    validate_timeout(timeout)
-
-    # Client management
+    method, attr = _prepare_request(method, timeout, client)
+
+    # Client management: use the client of the current async_session if any,
+    # otherwise create a client for this call only
+    if client is None:
+        client = get_default_async_client()
+        if client is not None and timeout is not DEFAULT_TIMEOUT:
+            kwargs["timeout"] = timeout
     owns_client = client is None
     client = client or httpx.AsyncClient(timeout=timeout)
     try:
         # Get the appropriate request method from the client
-        request_func = getattr(client, method.lower())
+        request_func = getattr(client, attr)
         return await request_async(
             url=url,
             method=method,
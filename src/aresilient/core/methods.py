@@ -0,0 +1,94 @@
+r"""HTTP method names used to dispatch resilient requests.
+
+This module provides the canonical names of the HTTP methods that have a
+dedicated method on ``httpx.Client`` and ``httpx.AsyncClient``, so that
+the request function for each of them can be resolved once instead of on
+every request.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "HTTP_METHODS",
+    "HTTP_METHOD_ATTRS",
+    "HTTP_METHOD_NAMES",
+    "get_method_attr",
+    "normalize_method",
+]
+
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# HTTP methods with a dedicated method on httpx.Client and httpx.AsyncClient
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+
+# Name of the httpx client attribute for each HTTP method, keyed by both the
+# uppercase and the lowercase spelling of the method. The names are interned
+# so that the attribute lookup on the client can match them by identity. The
+# table is read-only because it is shared by every client.
+HTTP_METHOD_ATTRS: Mapping[str, str] = MappingProxyType(
+    {method: sys.intern(method.lower()) for method in HTTP_METHODS}
+    | {sys.intern(method.lower()): sys.intern(method.lower()) for method in HTTP_METHODS}
+)
+
+# Canonical uppercase name of each HTTP method, keyed by both the uppercase
+# and the lowercase spelling of the method
+HTTP_METHOD_NAMES: Mapping[str, str] = MappingProxyType(
+    {method: method for method in HTTP_METHODS}
+    | {sys.intern(method.lower()): method for method in HTTP_METHODS}
+)
+
+
+def get_method_attr(method: str) -> str:
+    r"""Get the name of the httpx client attribute for an HTTP method.
+
+    The standard HTTP methods are resolved with a table lookup, so
+    the common case does not allocate a new lowercase string.
+
+    Args:
+        method: The HTTP method name (e.g., "GET", "post").
+
+    Returns:
+        The lowercase name of the httpx client attribute.
+
+    Example:
+        ```pycon
+        >>> from aresilient.core.methods import get_method_attr
+        >>> get_method_attr("GET")
+        'get'
+        >>> get_method_attr("Patch")
+        'patch'
+
+        ```
+    """
+    return HTTP_METHOD_ATTRS.get(method) or method.lower()
+
+
+def normalize_method(method: str) -> str:
+    r"""Get the canonical uppercase name of an HTTP method.
+
+    The standard HTTP methods are resolved with a table lookup and
+    return the shared canonical string, so the log messages and errors
+    use the same spelling whatever the casing passed by the caller.
+
+    Args:
+        method: The HTTP method name (e.g., "GET", "post").
+
+    Returns:
+        The uppercase HTTP method name.
+
+    Example:
+        ```pycon
+        >>> from aresilient.core.methods import normalize_method
+        >>> normalize_method("get")
+        'GET'
+        >>> normalize_method("Propfind")
+        'PROPFIND'
+
+        ```
+    """
+    return HTTP_METHOD_NAMES.get(method) or method.upper()
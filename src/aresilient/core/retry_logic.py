@@ -14,12 +14,12 @@ __all__ = [
 ]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
 from aresilient.exceptions import HttpRequestError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
 
     import httpx
 
@@ -30,7 +30,7 @@ def should_retry_response(
     response: httpx.Response,
     url: str,
     method: str,
-    status_forcelist: tuple[int, ...],
+    status_forcelist: Collection[int],
     retry_if: Callable[[httpx.Response | None, Exception | None], bool] | None,
 ) -> tuple[bool, str]:
     """Determine if response should trigger retry.
@@ -43,7 +43,8 @@ def should_retry_response(
         response: The HTTP response to evaluate.
         url: The URL being requested.
         method: The HTTP method being used.
-        status_forcelist: Tuple of retryable HTTP status codes.
+        status_forcelist: Collection of retryable HTTP status codes.
+            A frozenset gives constant-time membership tests.
         retry_if: Optional custom retry predicate.
 
     Returns:
@@ -52,45 +53,55 @@ def should_retry_response(
     Raises:
         HttpRequestError: For non-retryable error responses.
     """
-    # Success case (status < 400)
-    if response.status_code < 400:
-        if retry_if is not None and retry_if(response, None):
-            return (True, "retry_if predicate")
-        return (False, "success")
+    status_code = response.status_code
+    # Success case (status < 400). Without a custom predicate, this is the
+    # most common outcome, so it is checked first
+    if status_code < 400:
+        if retry_if is None or not retry_if(response, None):
+            return (False, "success")
+        return (True, "retry_if predicate")
 
     # Error case (status >= 400)
     if retry_if is not None:
         should_retry = retry_if(response, None)
         if not should_retry:
             # retry_if returned False for an error response
-            logger.debug(
-                f"{method} request to {url} failed with status {response.status_code} "
-                f"(retry_if returned False)"
-            )
-            raise HttpRequestError(
-                method=method,
-                url=url,
-                message=f"{method} request to {url} failed with status {response.status_code}",
-                status_code=response.status_code,
-                response=response,
-            )
+            _raise_status_error(response, url, method, reason="retry_if returned False")
         return (should_retry, "retry_if predicate")
 
     # Check status_forcelist
-    is_retryable = response.status_code in status_forcelist
+    is_retryable = status_code in status_forcelist
     if not is_retryable:
         # Non-retryable status code
-        logger.debug(
-            f"{method} request to {url} failed with non-retryable status {response.status_code}"
-        )
-        raise HttpRequestError(
-            method=method,
-            url=url,
-            message=f"{method} request to {url} failed with status {response.status_code}",
-            status_code=response.status_code,
-            response=response,
-        )
-    return (is_retryable, f"status {response.status_code}")
+        _raise_status_error(response, url, method, reason="non-retryable status")
+    return (is_retryable, f"status {status_code}")
+
+
+def _raise_status_error(response: httpx.Response, url: str, method: str, reason: str) -> NoReturn:
+    """Log and raise the error for a response that is not retried.
+
+    The error message is built once and used for both the debug log
+    and the exception.
+
+    Args:
+        response: The HTTP error response.
+        url: The URL being requested.
+        method: The HTTP method being used.
+        reason: The reason why the response is not retried, only used
+            in the debug log.
+
+    Raises:
+        HttpRequestError: Always.
+    """
+    message = f"{method} request to {url} failed with status {response.status_code}"
+    logger.debug("%s (%s)", message, reason)
+    raise HttpRequestError(
+        method=method,
+        url=url,
+        message=message,
+        status_code=response.status_code,
+        response=response,
+    )
 
 
 def should_retry_exception(
@@ -36,8 +36,9 @@ async def delete_async(
     Args:
         url: The URL to send the DELETE request to.
         client: An optional httpx.AsyncClient object to use for making
-            requests. If None, a new client will be created and closed
-            after use.
+            requests. If None, the client of the current
+            ``async_session`` is used, or a new client is created and
+            closed after use outside of a session.
         config: An optional ClientConfig object with retry configuration.
             If None, default ClientConfig values are used.
         timeout: Maximum seconds to wait for the server response.
@@ -35,7 +35,8 @@ def get(
     Args:
         url: The URL to send the GET request to.
         client: An optional httpx.Client object to use for making requests.
-            If None, a new client will be created and closed after use.
+            If None, a shared default client for the timeout is used and
+            kept open between calls (see ``close_default_clients``).
         config: An optional ClientConfig object with retry configuration.
             If None, default ClientConfig values are used.
         timeout: Maximum seconds to wait for the server response.
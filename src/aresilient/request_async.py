@@ -5,9 +5,10 @@ from __future__ import annotations
 
 __all__ = ["request_async"]
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from aresilient.core.config import ClientConfig
+from aresilient.core.config import _DEFAULT_CONFIG, ClientConfig
 from aresilient.retry import (
     AsyncRetryExecutor,
     CallbackConfig,
@@ -95,31 +96,62 @@ async def request_async(
 
         ```
     """
-    config = config or ClientConfig()
-
-    # Create retry configuration
-    retry_config = RetryConfig(
-        max_retries=config.max_retries,
-        status_forcelist=config.status_forcelist,
-        jitter_factor=config.jitter_factor,
-        retry_if=config.retry_if,
-        backoff_strategy=config.backoff_strategy,
-        max_total_time=config.max_total_time,
-        max_wait_time=config.max_wait_time,
-    )
+    if config is None or config is _DEFAULT_CONFIG:
+        return await _DEFAULT_EXECUTOR.execute(
+            url=url, method=method, request_func=request_func, **kwargs
+        )
+    executor = _get_executor(config)
+    return await executor.execute(url=url, method=method, request_func=request_func, **kwargs)
 
-    # Create callback configuration
-    callback_config = CallbackConfig(
-        on_request=config.on_request,
-        on_retry=config.on_retry,
-        on_success=config.on_success,
-        on_failure=config.on_failure,
-    )
 
-    # Create executor and execute request
-    executor = AsyncRetryExecutor(
-        retry_config=retry_config,
-        callback_config=callback_config,
+def _get_executor(config: ClientConfig) -> AsyncRetryExecutor:
+    r"""Get the retry executor for a configuration.
+
+    The executors of the recently used configurations are cached, so that
+    the requests that pass the same configuration do not build a new
+    executor on every call.
+
+    Args:
+        config: The retry configuration.
+
+    Returns:
+        The retry executor.
+    """
+    try:
+        return _get_cached_executor(config)
+    except TypeError:
+        # The configuration is hashed again only when the lookup failed, to
+        # tell an unhashable field (e.g. a list as status_forcelist), whose
+        # executor can not be cached, from an error raised while creating
+        # the executor
+        try:
+            hash(config)
+        except TypeError:
+            return _create_executor(config)
+        raise
+
+
+def _create_executor(config: ClientConfig) -> AsyncRetryExecutor:
+    r"""Create the retry executor for a configuration.
+
+    Args:
+        config: The retry configuration.
+
+    Returns:
+        The retry executor.
+    """
+    return AsyncRetryExecutor(
+        retry_config=RetryConfig.from_client_config(config),
+        callback_config=CallbackConfig.from_client_config(config),
         circuit_breaker=config.circuit_breaker,
     )
-    return await executor.execute(url=url, method=method, request_func=request_func, **kwargs)
+
+
+# Executor for the shared default config. Executors do not keep any
+# per-request state, so the requests without a config reuse it instead of
+# building the retry and callback configurations on every call
+_DEFAULT_EXECUTOR = _create_executor(_DEFAULT_CONFIG)
+
+# Executors of the recently used configurations. ClientConfig is frozen and
+# hashable, and two equal configurations get equivalent executors
+_get_cached_executor = lru_cache(maxsize=128)(_create_executor)
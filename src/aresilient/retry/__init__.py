@@ -4,6 +4,7 @@ This package provides a modular retry execution system using composition
 and strategy patterns for improved maintainability and testability.
 
 Public API:
+    - RetryBudget: Token bucket limiting retries across requests
     - RetryConfig: Configuration for retry behavior
     - CallbackConfig: Configuration for callbacks
     - RetryStrategy: Strategy for calculating retry delays
@@ -19,12 +20,14 @@ __all__ = [
     "AsyncRetryExecutor",
     "CallbackConfig",
     "CallbackManager",
+    "RetryBudget",
     "RetryConfig",
     "RetryDecider",
     "RetryExecutor",
     "RetryStrategy",
 ]
 
+from aresilient.retry.budget import RetryBudget
 from aresilient.retry.config import CallbackConfig, RetryConfig
 from aresilient.retry.decider import RetryDecider
 from aresilient.retry.executor import RetryExecutor
@@ -0,0 +1,161 @@
+r"""Retry budget for limiting retries across requests.
+
+This module provides a retry budget that bounds the number of retries
+made by all the requests sharing it. When a service is down, every
+request fails and retries, which multiplies the load on the service. A
+retry budget keeps the retries to a fraction of the successful requests,
+so the requests fail fast instead once the budget is empty.
+
+Example:
+    ```pycon
+    >>> from aresilient import get
+    >>> from aresilient.core import ClientConfig
+    >>> from aresilient.retry import RetryBudget
+    >>> retry_budget = RetryBudget(retry_ratio=0.1, min_retries_per_sec=5.0)
+    >>> response = get(
+    ...     "https://api.example.com/data",
+    ...     config=ClientConfig(retry_budget=retry_budget),
+    ... )  # doctest: +SKIP
+
+    ```
+"""
+
+from __future__ import annotations
+
+__all__ = ["RetryBudget"]
+
+import threading
+import time
+
+
+class RetryBudget:
+    r"""Token bucket limiting the retries of the requests sharing it.
+
+    Each retry withdraws one token from the bucket. The bucket is
+    refilled in two ways:
+
+    - Each successful request deposits ``retry_ratio`` tokens, so the
+      retries are bounded to this fraction of the successful requests.
+    - The bucket also refills at ``min_retries_per_sec`` tokens per
+      second, so that a low traffic client can still retry.
+
+    When the bucket is empty, the requests stop retrying and fail
+    immediately. The bucket starts full, and never holds more than
+    ``max_tokens`` tokens. The refill is computed from
+    ``time.monotonic()`` when the bucket is used, so no background
+    thread is needed.
+
+    Thread-safe implementation using locks.
+
+    Args:
+        retry_ratio: Number of tokens deposited by each successful
+            request. Must be >= 0. Default is 0.2, which allows one
+            retry for 5 successful requests.
+        min_retries_per_sec: Number of tokens added to the bucket per
+            second. Must be >= 0. Default is 10.0.
+        max_tokens: Maximum number of tokens in the bucket, which is
+            also the largest burst of retries allowed. Must be >= 1.
+            Default is 100.0.
+
+    Raises:
+        ValueError: If retry_ratio, min_retries_per_sec, or max_tokens
+            are invalid.
+
+    Example:
+        ```pycon
+        >>> from aresilient.retry import RetryBudget
+        >>> budget = RetryBudget(retry_ratio=0.5, min_retries_per_sec=0.0, max_tokens=1.0)
+        >>> budget.try_withdraw()
+        True
+        >>> budget.try_withdraw()
+        False
+        >>> budget.deposit()
+        >>> budget.deposit()
+        >>> budget.try_withdraw()
+        True
+
+        ```
+    """
+
+    __slots__ = (
+        "_last_refill_time",
+        "_lock",
+        "_max_tokens",
+        "_min_retries_per_sec",
+        "_retry_ratio",
+        "_tokens",
+    )
+
+    def __init__(
+        self,
+        *,
+        retry_ratio: float = 0.2,
+        min_retries_per_sec: float = 10.0,
+        max_tokens: float = 100.0,
+    ) -> None:
+        if retry_ratio < 0:
+            msg = f"retry_ratio must be >= 0, got {retry_ratio}"
+            raise ValueError(msg)
+        if min_retries_per_sec < 0:
+            msg = f"min_retries_per_sec must be >= 0, got {min_retries_per_sec}"
+            raise ValueError(msg)
+        if max_tokens < 1:
+            msg = f"max_tokens must be >= 1, got {max_tokens}"
+            raise ValueError(msg)
+
+        self._retry_ratio = retry_ratio
+        self._min_retries_per_sec = min_retries_per_sec
+        self._max_tokens = max_tokens
+
+        # State tracking (protected by lock)
+        self._tokens = max_tokens
+        self._last_refill_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of tokens in the bucket.
+
+        Thread-safe property that returns the current number of tokens,
+        including the time-based refill.
+
+        Returns:
+            The number of tokens in the bucket.
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill.
+
+        Must be called with ``self._lock`` held.
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_refill_time
+        self._last_refill_time = now
+        self._tokens = min(self._max_tokens, self._tokens + elapsed * self._min_retries_per_sec)
+
+    def deposit(self) -> None:
+        """Record a successful request.
+
+        Adds ``retry_ratio`` tokens to the bucket. Thread-safe.
+        """
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._retry_ratio)
+
+    def try_withdraw(self) -> bool:
+        """Try to withdraw the token of one retry from the bucket.
+
+        Thread-safe.
+
+        Returns:
+            ``True`` if the retry is allowed, ``False`` if the bucket is
+                empty.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -9,7 +9,9 @@ from __future__ import annotations
 __all__ = ["CallbackConfig", "RetryConfig"]
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+from aresilient.callbacks import run_in_background
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -18,9 +20,13 @@ if TYPE_CHECKING:
 
     from aresilient.backoff.base import BaseBackoffStrategy
     from aresilient.callbacks import FailureInfo, RequestInfo, ResponseInfo, RetryInfo
+    from aresilient.core.config import ClientConfig
+    from aresilient.retry.budget import RetryBudget
+
+T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Configuration for retry behavior.
 
@@ -32,6 +38,7 @@ class RetryConfig:
         backoff_strategy: Backoff strategy instance.
         max_total_time: Optional maximum total time budget for all retries.
         max_wait_time: Optional maximum backoff delay cap.
+        retry_budget: Optional retry budget limiting the retries.
     """
 
     max_retries: int
@@ -41,9 +48,31 @@ class RetryConfig:
     backoff_strategy: BaseBackoffStrategy | None = None
     max_total_time: float | None = None
     max_wait_time: float | None = None
+    retry_budget: RetryBudget | None = None
+
+    @classmethod
+    def from_client_config(cls, config: ClientConfig) -> RetryConfig:
+        """Create the retry configuration of a client configuration.
+
+        Args:
+            config: The client configuration.
 
+        Returns:
+            The retry configuration with the retry fields of ``config``.
+        """
+        return cls(
+            max_retries=config.max_retries,
+            status_forcelist=config.status_forcelist,
+            jitter_factor=config.jitter_factor,
+            retry_if=config.retry_if,
+            backoff_strategy=config.backoff_strategy,
+            max_total_time=config.max_total_time,
+            max_wait_time=config.max_wait_time,
+            retry_budget=config.retry_budget,
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CallbackConfig:
     """Configuration for callbacks.
 
@@ -58,3 +87,52 @@ class CallbackConfig:
     on_retry: Callable[[RetryInfo], None] | None = None
     on_success: Callable[[ResponseInfo], None] | None = None
     on_failure: Callable[[FailureInfo], None] | None = None
+
+    @classmethod
+    def from_client_config(cls, config: ClientConfig) -> CallbackConfig:
+        """Create the callback configuration of a client configuration.
+
+        Args:
+            config: The client configuration.
+
+        Returns:
+            The callback configuration with the callbacks of ``config``,
+                running in a background thread if
+                ``config.background_callbacks`` is set.
+        """
+        callback_config = cls(
+            on_request=config.on_request,
+            on_retry=config.on_retry,
+            on_success=config.on_success,
+            on_failure=config.on_failure,
+        )
+        if config.background_callbacks:
+            return callback_config.in_background()
+        return callback_config
+
+    def in_background(self) -> CallbackConfig:
+        """Create a configuration whose callbacks run in a background
+        thread.
+
+        Returns:
+            A new configuration with each callback wrapped by
+                ``run_in_background``.
+        """
+        return CallbackConfig(
+            on_request=_run_in_background(self.on_request),
+            on_retry=_run_in_background(self.on_retry),
+            on_success=_run_in_background(self.on_success),
+            on_failure=_run_in_background(self.on_failure),
+        )
+
+
+def _run_in_background(callback: Callable[[T], None] | None) -> Callable[[T], None] | None:
+    """Wrap an optional callback so that it runs in a background thread.
+
+    Args:
+        callback: The callback to wrap, or ``None``.
+
+    Returns:
+        The wrapped callback, or ``None`` if there is no callback.
+    """
+    return None if callback is None else run_in_background(callback)
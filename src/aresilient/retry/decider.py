@@ -45,6 +45,8 @@ class RetryDecider:
     ) -> None:
         self.status_forcelist = status_forcelist
         self.retry_if = retry_if
+        # Hash set built once so each error response is checked in O(1)
+        self._retryable_status_codes: frozenset[int] = frozenset(status_forcelist)
 
     def should_retry_response(
         self,
@@ -73,7 +75,7 @@ class RetryDecider:
             response=response,
             url=url,
             method=method,
-            status_forcelist=self.status_forcelist,
+            status_forcelist=self._retryable_status_codes,
             retry_if=self.retry_if,
         )
 
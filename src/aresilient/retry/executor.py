@@ -165,7 +165,8 @@ class RetryExecutor:
         if self.circuit_breaker is not None:
             self.circuit_breaker.check()
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        retry_if = self.decider.retry_if
         last_error: Exception | None = None
         last_status_code: int | None = None
         response: httpx.Response | None = None
@@ -181,18 +182,23 @@ class RetryExecutor:
                 )
                 response = request_func(url=url, **kwargs)
 
-                # Evaluate response
-                should_retry, reason = self.decider.should_retry_response(
-                    response=response,
-                    attempt=attempt,
-                    max_retries=self.config.max_retries,
-                    url=url,
-                    method=method,
-                )
+                # Evaluate response. A successful response is final unless a
+                # retry_if predicate is configured, so skip the decider for it
+                if response.status_code < 400 and retry_if is None:
+                    should_retry, reason = False, "success"
+                else:
+                    should_retry, reason = self.decider.should_retry_response(
+                        response=response,
+                        attempt=attempt,
+                        max_retries=self.config.max_retries,
+                        url=url,
+                        method=method,
+                    )
 
                 if not should_retry:
                     # Success!
                     executor_core.record_success(self.circuit_breaker)
+                    executor_core.deposit_retry_budget(self.config.retry_budget)
                     self.callbacks.on_success(
                         url=url,
                         method=method,
@@ -211,9 +217,9 @@ class RetryExecutor:
                     url=url,
                     method=method,
                 )
-                logger.debug(f"{method} to {url}: will retry ({reason})")
+                logger.debug("%s to %s: will retry (%s)", method, url, reason)
 
-            except (httpx.TimeoutException, httpx.RequestError) as exc:
+            except httpx.RequestError as exc:  # Includes httpx.TimeoutException
                 last_error = exc
 
                 # Evaluate exception
@@ -239,10 +245,25 @@ class RetryExecutor:
 
                 # Record circuit breaker failure for retryable exception
                 executor_core.record_failure(circuit_breaker=self.circuit_breaker, error=exc)
-                logger.debug(f"{method} to {url}: will retry ({reason})")
+                logger.debug("%s to %s: will retry (%s)", method, url, reason)
 
             # Sleep before retry (if not last attempt)
             if attempt < self.config.max_retries:
+                # Fail fast if the circuit breaker opened during this request,
+                # instead of sleeping and retrying against a service that it
+                # considers down
+                executor_core.check_circuit_breaker(
+                    circuit_breaker=self.circuit_breaker,
+                    config=self.config,
+                    callbacks=self.callbacks,
+                    start_time=start_time,
+                    url=url,
+                    method=method,
+                    attempt=attempt,
+                    response=response,
+                    error=last_error,
+                )
+
                 # Check max_total_time BEFORE sleeping
                 executor_core.check_time_budget_exceeded(
                     config=self.config,
@@ -254,7 +275,22 @@ class RetryExecutor:
                     response=response,
                 )
 
+                # Stop retrying if the shared retry budget is empty
+                executor_core.check_retry_budget(
+                    config=self.config,
+                    callbacks=self.callbacks,
+                    start_time=start_time,
+                    url=url,
+                    method=method,
+                    attempt=attempt,
+                    response=response,
+                    error=last_error,
+                )
+
                 sleep_time = self.strategy.calculate_delay(attempt=attempt, response=response)
+                sleep_time = executor_core.clamp_sleep_time(
+                    config=self.config, start_time=start_time, sleep_time=sleep_time
+                )
                 self.callbacks.on_retry(
                     url=url,
                     method=method,
@@ -126,7 +126,8 @@ class AsyncRetryExecutor:
         - Records success on completion
 
         Time limits:
-        - max_total_time: Stops retrying if total elapsed time exceeds limit
+        - max_total_time: Stops retrying if total elapsed time exceeds limit,
+          and cancels an attempt still running when the limit is reached
         - max_wait_time: Caps individual backoff delays
 
         Note:
@@ -182,12 +183,22 @@ class AsyncRetryExecutor:
         if self.circuit_breaker is not None:
             self.circuit_breaker.check()
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        retry_if = self.decider.retry_if
         last_error: Exception | None = None
         last_status_code: int | None = None
         response: httpx.Response | None = None
 
         for attempt in range(self.config.max_retries + 1):
+            remaining = executor_core.get_remaining_time(
+                config=self.config,
+                callbacks=self.callbacks,
+                start_time=start_time,
+                url=url,
+                method=method,
+                attempt=attempt,
+                response=response,
+            )
             try:
                 # Attempt request
                 self.callbacks.on_request(
@@ -196,20 +207,37 @@ class AsyncRetryExecutor:
                     attempt=attempt,
                     max_retries=self.config.max_retries,
                 )
-                response = await request_func(url=url, **kwargs)
+                if remaining is None:
+                    response = await request_func(url=url, **kwargs)
+                else:
+                    response = await self._request_within_budget(
+                        url=url,
+                        method=method,
+                        request_func=request_func,
+                        kwargs=kwargs,
+                        attempt=attempt,
+                        start_time=start_time,
+                        remaining=remaining,
+                        last_response=response,
+                    )
 
-                # Evaluate response
-                should_retry, reason = self.decider.should_retry_response(
-                    response=response,
-                    attempt=attempt,
-                    max_retries=self.config.max_retries,
-                    url=url,
-                    method=method,
-                )
+                # Evaluate response. A successful response is final unless a
+                # retry_if predicate is configured, so skip the decider for it
+                if response.status_code < 400 and retry_if is None:
+                    should_retry, reason = False, "success"
+                else:
+                    should_retry, reason = self.decider.should_retry_response(
+                        response=response,
+                        attempt=attempt,
+                        max_retries=self.config.max_retries,
+                        url=url,
+                        method=method,
+                    )
 
                 if not should_retry:
                     # Success!
                     executor_core.record_success(self.circuit_breaker)
+                    executor_core.deposit_retry_budget(self.config.retry_budget)
                     self.callbacks.on_success(
                         url=url,
                         method=method,
@@ -228,9 +256,9 @@ class AsyncRetryExecutor:
                     url=url,
                     method=method,
                 )
-                logger.debug(f"{method} to {url}: will retry ({reason})")
+                logger.debug("%s to %s: will retry (%s)", method, url, reason)
 
-            except (httpx.TimeoutException, httpx.RequestError) as exc:
+            except httpx.RequestError as exc:  # Includes httpx.TimeoutException
                 last_error = exc
 
                 # Evaluate exception
@@ -256,10 +284,25 @@ class AsyncRetryExecutor:
 
                 # Record circuit breaker failure for retryable exception
                 executor_core.record_failure(circuit_breaker=self.circuit_breaker, error=exc)
-                logger.debug(f"{method} to {url}: will retry ({reason})")
+                logger.debug("%s to %s: will retry (%s)", method, url, reason)
 
             # Sleep before retry (if not last attempt)
             if attempt < self.config.max_retries:
+                # Fail fast if the circuit breaker opened during this request,
+                # instead of sleeping and retrying against a service that it
+                # considers down
+                executor_core.check_circuit_breaker(
+                    circuit_breaker=self.circuit_breaker,
+                    config=self.config,
+                    callbacks=self.callbacks,
+                    start_time=start_time,
+                    url=url,
+                    method=method,
+                    attempt=attempt,
+                    response=response,
+                    error=last_error,
+                )
+
                 # Check max_total_time BEFORE sleeping
                 executor_core.check_time_budget_exceeded(
                     config=self.config,
@@ -271,7 +314,22 @@ class AsyncRetryExecutor:
                     response=response,
                 )
 
+                # Stop retrying if the shared retry budget is empty
+                executor_core.check_retry_budget(
+                    config=self.config,
+                    callbacks=self.callbacks,
+                    start_time=start_time,
+                    url=url,
+                    method=method,
+                    attempt=attempt,
+                    response=response,
+                    error=last_error,
+                )
+
                 sleep_time = self.strategy.calculate_delay(attempt=attempt, response=response)
+                sleep_time = executor_core.clamp_sleep_time(
+                    config=self.config, start_time=start_time, sleep_time=sleep_time
+                )
                 self.callbacks.on_retry(
                     url=url,
                     method=method,
@@ -293,3 +351,57 @@ class AsyncRetryExecutor:
             start_time=start_time,
         )
         return None  # pragma: no cover  # raise_final_error never returns
+
+    async def _request_within_budget(
+        self,
+        *,
+        url: str,
+        method: str,
+        request_func: Callable[..., httpx.Response],
+        kwargs: dict[str, Any],
+        attempt: int,
+        start_time: float,
+        remaining: float,
+        last_response: httpx.Response | None,
+    ) -> httpx.Response:
+        """Make one request attempt, cancelled when the time budget runs
+        out.
+
+        Args:
+            url: The URL to request.
+            method: The HTTP method name. Used for the error message.
+            request_func: Async function to make the HTTP request.
+            kwargs: Additional keyword arguments passed to request_func.
+            attempt: Current attempt number (0-indexed).
+            start_time: When the request started, from ``time.monotonic()``.
+            remaining: The time left before max_total_time is reached.
+            last_response: The response of the previous attempt if
+                available.
+
+        Returns:
+            The HTTP response of the attempt.
+
+        Raises:
+            HttpRequestError: If the attempt is cancelled because the time
+                budget ran out.
+        """
+        try:
+            return await asyncio.wait_for(request_func(url=url, **kwargs), timeout=remaining)
+        except asyncio.TimeoutError:
+            # A TimeoutError raised by request_func itself is not a time
+            # budget error, so it is raised unchanged unless the budget is
+            # really exhausted
+            if not executor_core.is_time_budget_exhausted(
+                config=self.config, start_time=start_time
+            ):
+                raise
+        executor_core.raise_time_budget_error(
+            config=self.config,
+            callbacks=self.callbacks,
+            start_time=start_time,
+            url=url,
+            method=method,
+            attempt=attempt,
+            response=last_response,
+        )
+        return None  # pragma: no cover  # raise_time_budget_error never returns
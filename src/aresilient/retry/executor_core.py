@@ -2,30 +2,39 @@ r"""Shared core logic for retry executors.
 
 This module provides shared helper functions used by both synchronous
 and asynchronous retry executors. These functions encapsulate common
-logic for circuit breaker recording, error creation, and time budget
-validation.
+logic for circuit breaker recording, error creation, and time and retry
+budget validation.
 """
 
 from __future__ import annotations
 
 __all__ = [
+    "check_circuit_breaker",
+    "check_retry_budget",
     "check_time_budget_exceeded",
+    "clamp_sleep_time",
     "create_exception_error",
+    "deposit_retry_budget",
+    "get_remaining_time",
+    "is_time_budget_exhausted",
+    "raise_time_budget_error",
     "record_failure",
     "record_response_failure",
     "record_success",
 ]
 
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
 import httpx
 
+from aresilient.circuit_breaker import CircuitBreakerError
 from aresilient.exceptions import HttpRequestError
 from aresilient.utils.exceptions import raise_final_error
 
 if TYPE_CHECKING:
     from aresilient.circuit_breaker import CircuitBreaker
+    from aresilient.retry.budget import RetryBudget
     from aresilient.retry.config import RetryConfig
     from aresilient.retry.manager import CallbackManager
 
@@ -51,6 +60,16 @@ def record_failure(circuit_breaker: CircuitBreaker | None, error: Exception) ->
         circuit_breaker.record_failure(error)
 
 
+def deposit_retry_budget(retry_budget: RetryBudget | None) -> None:
+    """Record success in retry budget if present.
+
+    Args:
+        retry_budget: Optional retry budget to deposit into.
+    """
+    if retry_budget is not None:
+        retry_budget.deposit()
+
+
 def record_response_failure(
     circuit_breaker: CircuitBreaker | None,
     response: httpx.Response,
@@ -78,6 +97,67 @@ def record_response_failure(
     circuit_breaker.record_failure(error)
 
 
+def check_circuit_breaker(
+    *,
+    circuit_breaker: CircuitBreaker | None,
+    config: RetryConfig,
+    callbacks: CallbackManager,
+    start_time: float,
+    url: str,
+    method: str,
+    attempt: int,
+    response: httpx.Response | None,
+    error: Exception | None,
+) -> None:
+    """Check the circuit breaker before a retry and raise error if open.
+
+    The failures of the request can open the circuit while it is
+    retrying. In this case the request stops instead of sleeping and
+    retrying against a service that the circuit breaker considers down.
+    Like the other early exits of the retry loop, the on_failure callback
+    is invoked and the error is chained to the last failure.
+
+    Args:
+        circuit_breaker: Optional circuit breaker to check.
+        config: Retry configuration containing max_retries.
+        callbacks: Callback manager for invoking on_failure.
+        start_time: When the request started, from ``time.monotonic()``.
+        url: The URL being requested.
+        method: The HTTP method being used.
+        attempt: Current attempt number (0-indexed).
+        response: The response if available.
+        error: The exception of the attempt if available.
+
+    Raises:
+        CircuitBreakerError: If the circuit is OPEN.
+    """
+    if circuit_breaker is None:
+        return
+    try:
+        circuit_breaker.check()
+    except CircuitBreakerError as exc:
+        status_code = None if response is None else response.status_code
+        cause = error
+        if response is not None:
+            cause = HttpRequestError(
+                method=method,
+                url=url,
+                message=f"{method} request to {url} failed with status {status_code}",
+                status_code=status_code,
+                response=response,
+            )
+        callbacks.on_failure(
+            url=url,
+            method=method,
+            attempt=attempt,
+            max_retries=config.max_retries,
+            error=exc,
+            status_code=status_code,
+            start_time=start_time,
+        )
+        raise exc from cause
+
+
 def create_exception_error(
     exc: Exception,
     url: str,
@@ -128,7 +208,7 @@ def check_time_budget_exceeded(
     Args:
         config: Retry configuration containing max_total_time.
         callbacks: Callback manager for invoking on_failure.
-        start_time: When the request started.
+        start_time: When the request started, from ``time.monotonic()``.
         url: The URL being requested.
         method: The HTTP method being used.
         attempt: Current attempt number (0-indexed).
@@ -140,11 +220,93 @@ def check_time_budget_exceeded(
     if config.max_total_time is None:
         return
 
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.monotonic() - start_time
     if elapsed_time < config.max_total_time:
         return
 
-    # Time budget exceeded - raise error immediately
+    raise_time_budget_error(
+        config=config,
+        callbacks=callbacks,
+        start_time=start_time,
+        url=url,
+        method=method,
+        attempt=attempt,
+        response=response,
+    )
+
+
+def get_remaining_time(
+    *,
+    config: RetryConfig,
+    callbacks: CallbackManager,
+    start_time: float,
+    url: str,
+    method: str,
+    attempt: int,
+    response: httpx.Response | None,
+) -> float | None:
+    """Get the time left in the time budget before an attempt.
+
+    The first attempt starts right after ``start_time``, so it gets the
+    whole max_total_time without reading the clock.
+
+    Args:
+        config: Retry configuration containing max_total_time.
+        callbacks: Callback manager for invoking on_failure.
+        start_time: When the request started, from ``time.monotonic()``.
+        url: The URL being requested.
+        method: The HTTP method being used.
+        attempt: The attempt about to be made (0-indexed).
+        response: The response of the previous attempt if available.
+
+    Returns:
+        The remaining time in seconds, or ``None`` if max_total_time
+            is not set.
+
+    Raises:
+        HttpRequestError: If the time budget is already exhausted.
+    """
+    if config.max_total_time is None or attempt == 0:
+        return config.max_total_time
+
+    remaining = config.max_total_time - (time.monotonic() - start_time)
+    if remaining <= 0:
+        raise_time_budget_error(
+            config=config,
+            callbacks=callbacks,
+            start_time=start_time,
+            url=url,
+            method=method,
+            attempt=attempt - 1,
+            response=response,
+        )
+    return remaining
+
+
+def raise_time_budget_error(
+    *,
+    config: RetryConfig,
+    callbacks: CallbackManager,
+    start_time: float,
+    url: str,
+    method: str,
+    attempt: int,
+    response: httpx.Response | None,
+) -> NoReturn:
+    """Raise the error for a request that ran out of time budget.
+
+    Args:
+        config: Retry configuration containing max_total_time.
+        callbacks: Callback manager for invoking on_failure.
+        start_time: When the request started, from ``time.monotonic()``.
+        url: The URL being requested.
+        method: The HTTP method being used.
+        attempt: Current attempt number (0-indexed).
+        response: The last response if available.
+
+    Raises:
+        HttpRequestError: Always.
+    """
     if response is not None:
         raise_final_error(
             url=url,
@@ -174,3 +336,106 @@ def check_time_budget_exceeded(
         start_time=start_time,
     )
     raise error
+
+
+def is_time_budget_exhausted(*, config: RetryConfig, start_time: float) -> bool:
+    """Check if the time budget is exhausted.
+
+    Args:
+        config: Retry configuration containing max_total_time.
+        start_time: When the request started, from ``time.monotonic()``.
+
+    Returns:
+        ``True`` if max_total_time is set and the elapsed time reached
+            it, otherwise ``False``.
+    """
+    return (
+        config.max_total_time is not None and time.monotonic() - start_time >= config.max_total_time
+    )
+
+
+def clamp_sleep_time(config: RetryConfig, start_time: float, sleep_time: float) -> float:
+    """Clamp the sleep time before a retry to the remaining time budget.
+
+    Without clamping, a long backoff delay could make the request
+    overshoot max_total_time while sleeping.
+
+    Args:
+        config: Retry configuration containing max_total_time.
+        start_time: When the request started, from ``time.monotonic()``.
+        sleep_time: The backoff delay computed by the retry strategy.
+
+    Returns:
+        The sleep time, reduced to the time left before max_total_time
+            is reached if it is set and smaller.
+    """
+    if config.max_total_time is None:
+        return sleep_time
+    remaining = config.max_total_time - (time.monotonic() - start_time)
+    return max(0.0, min(sleep_time, remaining))
+
+
+def check_retry_budget(
+    *,
+    config: RetryConfig,
+    callbacks: CallbackManager,
+    start_time: float,
+    url: str,
+    method: str,
+    attempt: int,
+    response: httpx.Response | None,
+    error: Exception | None,
+) -> None:
+    """Withdraw a retry from the retry budget and raise error if empty.
+
+    If no retry budget is configured, the function returns normally.
+
+    Args:
+        config: Retry configuration containing retry_budget.
+        callbacks: Callback manager for invoking on_failure.
+        start_time: When the request started, from ``time.monotonic()``.
+        url: The URL being requested.
+        method: The HTTP method being used.
+        attempt: Current attempt number (0-indexed).
+        response: The response if available.
+        error: The exception of the attempt if available.
+
+    Raises:
+        HttpRequestError: If the retry budget is empty.
+    """
+    if config.retry_budget is None or config.retry_budget.try_withdraw():
+        return
+
+    if response is not None:
+        status_code: int | None = response.status_code
+        final_error = HttpRequestError(
+            method=method,
+            url=url,
+            message=(
+                f"{method} request to {url} failed with status {status_code} "
+                f"after {attempt + 1} attempts (retry budget exhausted)"
+            ),
+            status_code=status_code,
+            response=response,
+        )
+    else:
+        status_code = None
+        final_error = HttpRequestError(
+            method=method,
+            url=url,
+            message=(
+                f"{method} request to {url} failed after {attempt + 1} attempts "
+                f"(retry budget exhausted): {error}"
+            ),
+            cause=error,
+        )
+    callbacks.on_failure(
+        url=url,
+        method=method,
+        attempt=attempt,
+        max_retries=config.max_retries,
+        error=final_error,
+        status_code=status_code,
+        start_time=start_time,
+    )
+    raise final_error from error
@@ -109,7 +109,7 @@ class CallbackManager:
             attempt: Attempt number that succeeded (0-indexed).
             max_retries: Maximum number of retries.
             response: The successful response.
-            start_time: Timestamp when request started.
+            start_time: ``time.monotonic()`` timestamp when request started.
         """
         if self.callbacks.on_success:
             invoke_on_success(
@@ -141,7 +141,7 @@ class CallbackManager:
             max_retries: Maximum number of retries.
             error: The error that caused failure.
             status_code: Status code if available.
-            start_time: Timestamp when request started.
+            start_time: ``time.monotonic()`` timestamp when request started.
         """
         if self.callbacks.on_failure:
             self.callbacks.on_failure(
@@ -152,6 +152,6 @@ class CallbackManager:
                     max_retries=max_retries,
                     error=error,
                     status_code=status_code,
-                    total_time=time.time() - start_time,
+                    total_time=time.monotonic() - start_time,
                 )
             )
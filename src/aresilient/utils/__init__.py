@@ -14,11 +14,13 @@ __all__ = [
     "handle_response",
     "handle_response_with_retry_if",
     "handle_timeout_exception",
+    "install_uvloop",
     "parse_retry_after",
     "raise_final_error",
 ]
 
 
+from aresilient.utils.event_loop import install_uvloop
 from aresilient.utils.exceptions import (
     handle_exception_with_callback,
     handle_request_error,
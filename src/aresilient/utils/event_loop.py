@@ -0,0 +1,63 @@
+r"""Event loop utilities for asynchronous HTTP requests.
+
+This module provides a helper to opt into the ``uvloop`` event loop,
+which reduces the overhead of every ``await`` performed by the
+asynchronous request functions and clients.
+"""
+
+from __future__ import annotations
+
+__all__ = ["install_uvloop"]
+
+import asyncio
+import logging
+import sys
+
+from aresilient.utils.imports import is_uvloop_available
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    r"""Use ``uvloop`` as the asyncio event loop policy if it is
+    installed.
+
+    ``uvloop`` implements the event loop on top of libuv, which makes the
+    I/O dispatch and the ``Future``/``Task`` machinery faster than the
+    default asyncio event loop. This function must be called before the
+    event loop is created, e.g. before the first ``asyncio.run()`` call.
+    It does nothing if ``uvloop`` is not installed, so it is safe to call
+    unconditionally.
+
+    The event loop policies are deprecated since Python 3.14, so this
+    function also does nothing on Python 3.14+. Pass
+    ``loop_factory=uvloop.new_event_loop`` to ``asyncio.run()`` instead.
+
+    Returns:
+        ``True`` if the ``uvloop`` event loop policy was installed,
+            otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> import asyncio
+        >>> from aresilient import get_async, install_uvloop
+        >>> install_uvloop()  # doctest: +SKIP
+        True
+        >>> asyncio.run(get_async("https://api.example.com/data"))  # doctest: +SKIP
+
+        ```
+    """
+    if not is_uvloop_available():
+        logger.debug("uvloop is not installed, keeping the default event loop policy")
+        return False
+    if sys.version_info >= (3, 14):
+        logger.debug(
+            "event loop policies are deprecated since Python 3.14, pass "
+            "loop_factory=uvloop.new_event_loop to asyncio.run() instead"
+        )
+        return False
+
+    import uvloop  # noqa: PLC0415
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -62,7 +62,9 @@ def handle_timeout_exception(
         (attempt < max_retries), the function returns without raising, allowing
         the retry loop to continue.
     """
-    logger.debug(f"{method} request to {url} timed out on attempt {attempt + 1}/{max_retries + 1}")
+    logger.debug(
+        "%s request to %s timed out on attempt %d/%d", method, url, attempt + 1, max_retries + 1
+    )
     if attempt == max_retries:
         raise HttpRequestError(
             method=method,
@@ -108,8 +110,13 @@ def handle_request_error(
     """
     error_type = type(exc).__name__
     logger.debug(
-        f"{method} request to {url} encountered {error_type} on attempt "
-        f"{attempt + 1}/{max_retries + 1}: {exc}"
+        "%s request to %s encountered %s on attempt %d/%d: %s",
+        method,
+        url,
+        error_type,
+        attempt + 1,
+        max_retries + 1,
+        exc,
     )
     if attempt == max_retries:
         raise HttpRequestError(
@@ -141,7 +148,8 @@ def handle_exception_with_callback(
         max_retries: Maximum number of retry attempts.
         handler_func: Function to handle the exception (raises if final attempt).
         on_failure: Optional callback to invoke when all retries are exhausted.
-        start_time: The timestamp when the request started.
+        start_time: The ``time.monotonic()`` timestamp when the request
+            started.
 
     Raises:
         HttpRequestError: If this is the final attempt.
@@ -159,7 +167,7 @@ def handle_exception_with_callback(
                     max_retries=max_retries,
                     error=err,
                     status_code=None,
-                    total_time=time.time() - start_time,
+                    total_time=time.monotonic() - start_time,
                 )
             )
         raise
@@ -182,12 +190,13 @@ def raise_final_error(
         max_retries: Maximum number of retry attempts.
         response: The final HTTP response object (if available).
         on_failure: Optional callback to invoke when all retries are exhausted.
-        start_time: The timestamp when the request started.
+        start_time: The ``time.monotonic()`` timestamp when the request
+            started.
 
     Raises:
         HttpRequestError: Always raises with details about the failure.
     """
-    total_time = time.time() - start_time
+    total_time = time.monotonic() - start_time
 
     if response is None:  # pragma: no cover
         # This should never happen in practice, but we check for type safety
@@ -0,0 +1,31 @@
+r"""Utilities to manage the optional dependencies.
+
+This module provides functions to check whether the optional packages
+used by aresilient are installed.
+"""
+
+from __future__ import annotations
+
+__all__ = ["is_uvloop_available"]
+
+from functools import lru_cache
+
+from coola.utils.imports import package_available
+
+
+@lru_cache(1)
+def is_uvloop_available() -> bool:
+    r"""Indicate if the ``uvloop`` package is installed or not.
+
+    Returns:
+        ``True`` if ``uvloop`` is available otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> from aresilient.utils.imports import is_uvloop_available
+        >>> isinstance(is_uvloop_available(), bool)
+        True
+
+        ```
+    """
+    return package_available("uvloop")
@@ -54,7 +54,10 @@ def handle_response(
     # Non-retryable HTTP error (e.g., 404, 401, 403)
     if response.status_code not in status_forcelist:
         logger.debug(
-            f"{method} request to {url} failed with non-retryable status {response.status_code}"
+            "%s request to %s failed with non-retryable status %s",
+            method,
+            url,
+            response.status_code,
         )
         raise HttpRequestError(
             method=method,
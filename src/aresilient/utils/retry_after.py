@@ -69,5 +69,5 @@ def parse_retry_after(retry_after_header: str | None) -> float | None:
         # Ensure we don't return negative values
         return max(0.0, delta_seconds)
     except (ValueError, TypeError, OverflowError):
-        logger.debug(f"Failed to parse Retry-After header: {retry_after_header!r}")
+        logger.debug("Failed to parse Retry-After header: %r", retry_after_header)
         return None
@@ -73,8 +73,10 @@ def handle_response_with_retry_if(
     # Error case: status >= 400
     if not should_retry:
         logger.debug(
-            f"{method} request to {url} failed with status {response.status_code}, "
-            f"retry_if predicate returned False"
+            "%s request to %s failed with status %s, retry_if predicate returned False",
+            method,
+            url,
+            response.status_code,
         )
         raise HttpRequestError(
             method=method,
@@ -115,7 +117,8 @@ def handle_exception_with_retry_if(
         attempt: The current attempt number (0-indexed).
         max_retries: Maximum number of retry attempts.
         on_failure: Optional callback to invoke when all retries are exhausted.
-        start_time: The timestamp when the request started.
+        start_time: The ``time.monotonic()`` timestamp when the request
+            started.
 
     Returns:
         True if the predicate indicates retry should continue and attempts
@@ -136,7 +139,10 @@ def handle_exception_with_retry_if(
         # Create appropriate error based on exception type
         if isinstance(exc, httpx.TimeoutException):
             logger.debug(
-                f"{method} request to {url} timed out, retry_if predicate returned {should_retry}"
+                "%s request to %s timed out, retry_if predicate returned %s",
+                method,
+                url,
+                should_retry,
             )
             error = HttpRequestError(
                 method=method,
@@ -148,8 +154,11 @@ def handle_exception_with_retry_if(
             # RequestError or subclass
             error_type = type(exc).__name__
             logger.debug(
-                f"{method} request to {url} encountered {error_type}, "
-                f"retry_if predicate returned {should_retry}"
+                "%s request to %s encountered %s, retry_if predicate returned %s",
+                method,
+                url,
+                error_type,
+                should_retry,
             )
             error = HttpRequestError(
                 method=method,
@@ -168,7 +177,7 @@ def handle_exception_with_retry_if(
                     max_retries=max_retries,
                     error=error,
                     status_code=None,
-                    total_time=time.time() - start_time,
+                    total_time=time.monotonic() - start_time,
                 )
             )
 
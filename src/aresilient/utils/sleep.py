@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Strategy used when no backoff strategy is passed, shared by the calls so
+# that its delay schedule is not computed again on every call
+_DEFAULT_BACKOFF_STRATEGY = ExponentialBackoff()
+
 
 def calculate_sleep_time(
     attempt: int,
@@ -44,14 +48,14 @@ def calculate_sleep_time(
     2. Apply max_wait_time cap (if max_wait_time is set):
        - sleep_time = min(sleep_time, max_wait_time)
     3. Apply jitter (if jitter_factor > 0):
-       - jitter = random.uniform(0, jitter_factor) * base_sleep_time
-       - total_sleep_time = base_sleep_time + jitter
+       - jitter = random.random() * jitter_factor * base_sleep_time
+       - total_sleep_time = min(base_sleep_time + jitter, max_wait_time)
 
     Args:
         attempt: The current attempt number (0-indexed). For example,
             attempt=0 is the first retry, attempt=1 is the second retry, etc.
         jitter_factor: Factor for adding random jitter to backoff delays.
-            The jitter is calculated as: random.uniform(0, jitter_factor) * base_sleep_time,
+            The jitter is calculated as: random.random() * jitter_factor * base_sleep_time,
             and this jitter is ADDED to the base sleep time. Set to 0 to disable jitter.
             Recommended value is 0.1 to add up to 10% additional random delay.
         response: The HTTP response object (if available). Used to extract
@@ -60,7 +64,8 @@ def calculate_sleep_time(
             Defaults to ExponentialBackoff with base_delay=0.3.
         max_wait_time: Optional maximum backoff delay cap in seconds.
             If provided, individual backoff delays will not exceed this value,
-            even with exponential backoff growth or Retry-After headers.
+            even with exponential backoff growth, Retry-After headers or
+            jitter.
 
     Returns:
         The calculated sleep time in seconds, including any jitter applied.
@@ -93,28 +98,37 @@ def calculate_sleep_time(
     # Use Retry-After if available, otherwise use backoff strategy
     if retry_after_sleep is not None:
         sleep_time = retry_after_sleep
-        logger.debug(f"Using Retry-After header value: {sleep_time:.2f}s")
+        logger.debug("Using Retry-After header value: %.2fs", sleep_time)
     else:
         if backoff_strategy is None:
-            backoff_strategy = ExponentialBackoff()
+            backoff_strategy = _DEFAULT_BACKOFF_STRATEGY
         sleep_time = backoff_strategy.calculate(attempt)
 
     # Apply max_wait_time cap if configured
     if max_wait_time is not None and sleep_time > max_wait_time:
         logger.debug(
-            f"Capping sleep time from {sleep_time:.2f}s to {max_wait_time:.2f}s (max_wait_time={max_wait_time:.2f}s)"
+            "Capping sleep time from %.2fs to %.2fs (max_wait_time=%.2fs)",
+            sleep_time,
+            max_wait_time,
+            max_wait_time,
         )
         sleep_time = max_wait_time
 
     # Add jitter if jitter_factor is configured
     if jitter_factor > 0:
-        jitter = random.uniform(0, jitter_factor) * sleep_time  # noqa: S311
+        jitter = random.random() * jitter_factor * sleep_time  # noqa: S311
         total_sleep_time = sleep_time + jitter
+        # The jitter must not push the delay back above the cap
+        if max_wait_time is not None:
+            total_sleep_time = min(total_sleep_time, max_wait_time)
         logger.debug(
-            f"Waiting {total_sleep_time:.2f}s before retry (base={sleep_time:.2f}s, jitter={jitter:.2f}s)"
+            "Waiting %.2fs before retry (base=%.2fs, jitter=%.2fs)",
+            total_sleep_time,
+            sleep_time,
+            jitter,
         )
     else:
         total_sleep_time = sleep_time
-        logger.debug(f"Waiting {total_sleep_time:.2f}s before retry")
+        logger.debug("Waiting %.2fs before retry", total_sleep_time)
 
     return total_sleep_time
@@ -6,12 +6,21 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
+from aresilient.core import close_default_clients
 from tests.helpers import create_mock_response
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 
+@pytest.fixture(autouse=True)
+def reset_default_clients() -> Generator[None, None, None]:
+    """Close the shared default clients after each test, so that a client
+    created (or mocked) by one test is not reused by the next one."""
+    yield
+    close_default_clients()
+
+
 @pytest.fixture
 def mock_sleep() -> Generator[Mock, None, None]:
     """Patch time.sleep to make tests run faster."""
@@ -0,0 +1,76 @@
+r"""Unit tests for DecorrelatedJitterBackoff strategy."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from aresilient.backoff import DecorrelatedJitterBackoff
+
+
+def test_decorrelated_jitter_backoff_defaults() -> None:
+    """Test the default parameters."""
+    backoff = DecorrelatedJitterBackoff()
+    assert backoff.base_delay == 0.3
+    assert backoff.max_delay is None
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 5, 10])
+def test_decorrelated_jitter_backoff_bounds(attempt: int) -> None:
+    """Test that the delay is between base_delay and max_delay."""
+    backoff = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=10.0)
+    for _ in range(100):
+        assert 1.0 <= backoff.calculate(attempt) <= 10.0
+
+
+def test_decorrelated_jitter_backoff_first_delay_bounds() -> None:
+    """Test that the first delay is between base_delay and three times
+    base_delay."""
+    backoff = DecorrelatedJitterBackoff(base_delay=1.0)
+    for _ in range(100):
+        assert 1.0 <= backoff.calculate(0) <= 3.0
+
+
+def test_decorrelated_jitter_backoff_upper_bound() -> None:
+    """Test that each delay can reach three times the previous delay."""
+    backoff = DecorrelatedJitterBackoff(base_delay=1.0)
+    with patch("random.uniform", side_effect=lambda _low, high: high):
+        assert backoff.calculate(0) == 3.0
+        assert backoff.calculate(1) == 9.0
+        assert backoff.calculate(2) == 27.0
+
+
+def test_decorrelated_jitter_backoff_lower_bound() -> None:
+    """Test that the delay never goes below base_delay."""
+    backoff = DecorrelatedJitterBackoff(base_delay=2.0)
+    with patch("random.uniform", side_effect=lambda low, _high: low):
+        assert backoff.calculate(0) == 2.0
+        assert backoff.calculate(5) == 2.0
+
+
+def test_decorrelated_jitter_backoff_max_delay() -> None:
+    """Test that the delay is capped at max_delay."""
+    backoff = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=5.0)
+    with patch("random.uniform", side_effect=lambda _low, high: high):
+        assert backoff.calculate(0) == 3.0
+        assert backoff.calculate(1) == 5.0
+        assert backoff.calculate(10) == 5.0
+
+
+def test_decorrelated_jitter_backoff_base_delay_zero() -> None:
+    """Test that a zero base_delay gives zero delays."""
+    assert DecorrelatedJitterBackoff(base_delay=0.0).calculate(3) == 0.0
+
+
+def test_decorrelated_jitter_backoff_negative_base_delay() -> None:
+    """Test that a negative base_delay raises an error."""
+    with pytest.raises(ValueError, match=r"base_delay must be non-negative, got -1.0"):
+        DecorrelatedJitterBackoff(base_delay=-1.0)
+
+
+@pytest.mark.parametrize("max_delay", [0.0, -1.0])
+def test_decorrelated_jitter_backoff_invalid_max_delay(max_delay: float) -> None:
+    """Test that a non-positive max_delay raises an error."""
+    with pytest.raises(ValueError, match=r"max_delay must be positive if specified"):
+        DecorrelatedJitterBackoff(max_delay=max_delay)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from aresilient.backoff.exponential import ExponentialBackoff
+from aresilient.backoff.exponential import _PRECOMPUTED_ATTEMPTS, ExponentialBackoff
 
 
 def test_exponential_backoff_basic() -> None:
@@ -53,3 +53,55 @@ def test_exponential_backoff_zero_base_delay() -> None:
     backoff = ExponentialBackoff(base_delay=0.0)
     assert backoff.calculate(0) == 0.0
     assert backoff.calculate(5) == 0.0
+
+
+def test_exponential_backoff_beyond_precomputed_attempts() -> None:
+    """Test exponential backoff after the precomputed delay schedule."""
+    backoff = ExponentialBackoff(base_delay=0.5)
+    assert backoff.calculate(_PRECOMPUTED_ATTEMPTS - 1) == 0.5 * 2 ** (_PRECOMPUTED_ATTEMPTS - 1)
+    assert backoff.calculate(_PRECOMPUTED_ATTEMPTS) == 0.5 * 2**_PRECOMPUTED_ATTEMPTS
+    assert backoff.calculate(40) == 0.5 * 2**40
+
+
+def test_exponential_backoff_beyond_precomputed_attempts_with_max_delay() -> None:
+    """Test exponential backoff cap after the precomputed delay
+    schedule."""
+    backoff = ExponentialBackoff(base_delay=1.0, max_delay=30.0)
+    assert backoff.calculate(_PRECOMPUTED_ATTEMPTS + 4) == 30.0
+
+
+def test_exponential_backoff_attributes_are_writable() -> None:
+    """Test that changing the delay parameters updates the delays."""
+    backoff = ExponentialBackoff(base_delay=1.0, max_delay=5.0)
+    backoff.base_delay = 2.0
+    assert backoff.base_delay == 2.0
+    assert backoff.calculate(1) == 4.0
+    assert backoff.calculate(2) == 5.0
+    backoff.max_delay = None
+    assert backoff.max_delay is None
+    assert backoff.calculate(2) == 8.0
+    assert backoff.calculate(_PRECOMPUTED_ATTEMPTS) == 2.0 * 2**_PRECOMPUTED_ATTEMPTS
+
+
+def test_exponential_backoff_eq() -> None:
+    """Test that exponential backoffs with the same delays are equal."""
+    assert ExponentialBackoff(base_delay=1.0, max_delay=5.0) == ExponentialBackoff(
+        base_delay=1.0, max_delay=5.0
+    )
+    assert hash(ExponentialBackoff()) == hash(ExponentialBackoff())
+
+
+def test_exponential_backoff_not_eq() -> None:
+    """Test that exponential backoffs with different delays are not
+    equal."""
+    assert ExponentialBackoff(base_delay=1.0) != ExponentialBackoff(base_delay=2.0)
+    assert ExponentialBackoff(max_delay=5.0) != ExponentialBackoff()
+    assert ExponentialBackoff() != 0.3
+
+
+def test_exponential_backoff_negative_attempt() -> None:
+    """Test that a negative attempt gives a fraction of the base
+    delay."""
+    backoff = ExponentialBackoff(base_delay=1.0)
+    assert backoff.calculate(-1) == 0.5
+    assert backoff.calculate(-2) == 0.25
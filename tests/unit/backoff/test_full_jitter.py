@@ -0,0 +1,46 @@
+r"""Unit tests for FullJitterBackoff strategy."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from aresilient.backoff import (
+    ConstantBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    LinearBackoff,
+)
+
+
+def test_full_jitter_backoff_default_base_strategy() -> None:
+    """Test that the default base strategy is ExponentialBackoff."""
+    backoff = FullJitterBackoff()
+    assert isinstance(backoff.base_strategy, ExponentialBackoff)
+    assert backoff.base_strategy.base_delay == 0.3
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 5, 10])
+def test_full_jitter_backoff_bounds(attempt: int) -> None:
+    """Test that the delay is between 0 and the base strategy delay."""
+    base_strategy = ExponentialBackoff(base_delay=1.0, max_delay=10.0)
+    backoff = FullJitterBackoff(base_strategy)
+    for _ in range(100):
+        assert 0.0 <= backoff.calculate(attempt) <= base_strategy.calculate(attempt)
+
+
+@pytest.mark.parametrize(("random_value", "expected"), [(0.0, 0.0), (0.25, 0.5), (0.5, 1.0)])
+def test_full_jitter_backoff_scales_base_delay(random_value: float, expected: float) -> None:
+    """Test that the delay is the random fraction of the base delay."""
+    backoff = FullJitterBackoff(ConstantBackoff(delay=2.0))
+    with patch("random.random", return_value=random_value):
+        assert backoff.calculate(3) == expected
+
+
+def test_full_jitter_backoff_uses_attempt() -> None:
+    """Test that the attempt is forwarded to the base strategy."""
+    backoff = FullJitterBackoff(LinearBackoff(base_delay=1.0))
+    with patch("random.random", return_value=0.5):
+        assert backoff.calculate(0) == 0.5
+        assert backoff.calculate(3) == 2.0
@@ -6,12 +6,14 @@ core/config.py.
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError, fields, replace
 from typing import TYPE_CHECKING
 
 import pytest
 from coola.equality import objects_are_equal
 
 from aresilient.backoff.exponential import ExponentialBackoff
+from aresilient.core.config import _DEFAULT_CONFIG
 from aresilient.core import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
@@ -42,10 +44,12 @@ def test_client_config_defaults() -> None:
     assert config.max_total_time is None
     assert config.max_wait_time is None
     assert config.circuit_breaker is None
+    assert config.retry_budget is None
     assert config.on_request is None
     assert config.on_retry is None
     assert config.on_success is None
     assert config.on_failure is None
+    assert config.background_callbacks is False
 
 
 @pytest.mark.parametrize("max_retries", [5, 0, 10])
@@ -136,6 +140,12 @@ def test_client_config_on_failure() -> None:
     assert config.on_failure is on_failure_callback
 
 
+def test_client_config_background_callbacks() -> None:
+    """Test that ClientConfig accepts background_callbacks."""
+    config = ClientConfig(background_callbacks=True)
+    assert config.background_callbacks is True
+
+
 def test_client_config_validation_max_retries_negative() -> None:
     """Test that ClientConfig validates max_retries >= 0."""
     with pytest.raises(ValueError, match=r"max_retries must be >= 0"):
@@ -173,6 +183,27 @@ def test_client_config_validation_max_wait_time_negative() -> None:
         ClientConfig(max_wait_time=-5.0)
 
 
+def test_client_config_field_order() -> None:
+    """Test that the positional order of the fields is kept, with new
+    fields added at the end."""
+    assert [config_field.name for config_field in fields(ClientConfig)] == [
+        "max_retries",
+        "status_forcelist",
+        "jitter_factor",
+        "retry_if",
+        "backoff_strategy",
+        "max_total_time",
+        "max_wait_time",
+        "circuit_breaker",
+        "on_request",
+        "on_retry",
+        "on_success",
+        "on_failure",
+        "background_callbacks",
+        "retry_budget",
+    ]
+
+
 def test_client_config_to_dict() -> None:
     """Test that to_dict() returns all configuration parameters."""
     strategy = ExponentialBackoff(base_delay=0.5)
@@ -198,6 +229,8 @@ def test_client_config_to_dict() -> None:
             "on_retry": None,
             "on_success": None,
             "on_failure": None,
+            "background_callbacks": False,
+            "retry_budget": None,
         },
     )
 
@@ -221,12 +254,32 @@ def test_client_config_to_dict_with_callbacks() -> None:
     assert params["on_retry"] is on_retry_callback
 
 
+def test_client_config_backoff_strategy_default_not_shared() -> None:
+    """Test that each config gets its own default backoff strategy, so
+    changing it does not change the other configs."""
+    config = ClientConfig()
+    config.backoff_strategy.base_delay = 5.0
+    assert ClientConfig().backoff_strategy.base_delay == 0.3
+    assert _DEFAULT_CONFIG.backoff_strategy.base_delay == 0.3
+
+
+def test_client_config_equal_default_backoff_strategy() -> None:
+    """Test that configs with the default backoff strategy are equal."""
+    assert ClientConfig(max_retries=2) == ClientConfig(max_retries=2)
+    assert hash(ClientConfig(max_retries=2)) == hash(ClientConfig(max_retries=2))
+
+
 def test_client_config_status_forcelist_default() -> None:
     """Test that status_forcelist has correct default value."""
     config = ClientConfig()
     assert config.status_forcelist == RETRY_STATUS_CODES
 
 
+def test_client_config_status_forcelist_default_is_shared() -> None:
+    """Test that the default status_forcelist is the shared constant."""
+    assert ClientConfig().status_forcelist is RETRY_STATUS_CODES
+
+
 ###################################
 #     Tests for Configuration     #
 ###################################
@@ -278,3 +331,42 @@ def test_constants_are_immutable_types() -> None:
     assert isinstance(DEFAULT_MAX_RETRIES, int)
     assert isinstance(DEFAULT_TIMEOUT, float)
     assert isinstance(RETRY_STATUS_CODES, tuple)
+
+
+def test_client_config_is_frozen() -> None:
+    """Test that ClientConfig attributes cannot be modified."""
+    config = ClientConfig()
+    with pytest.raises(FrozenInstanceError):
+        config.max_retries = 5
+
+
+def test_client_config_has_no_instance_dict() -> None:
+    """Test that ClientConfig uses slots instead of an instance dict."""
+    assert not hasattr(ClientConfig(), "__dict__")
+
+
+def test_client_config_replace() -> None:
+    """Test that replace creates a new validated config."""
+    config = ClientConfig(max_retries=2)
+    new_config = replace(config, jitter_factor=0.5)
+    assert new_config.max_retries == 2
+    assert new_config.jitter_factor == 0.5
+    assert config.jitter_factor == 0.0
+    with pytest.raises(ValueError, match=r"max_retries must be >= 0"):
+        replace(config, max_retries=-1)
+
+
+#####################################
+#     Tests for _DEFAULT_CONFIG     #
+#####################################
+
+
+def test_default_config_has_default_values() -> None:
+    """Test that the shared default config uses the ClientConfig
+    defaults."""
+    assert _DEFAULT_CONFIG.to_dict() == {
+        **ClientConfig().to_dict(),
+        "backoff_strategy": _DEFAULT_CONFIG.backoff_strategy,
+    }
+    assert isinstance(_DEFAULT_CONFIG.backoff_strategy, ExponentialBackoff)
+    assert _DEFAULT_CONFIG.backoff_strategy.base_delay == 0.3
@@ -0,0 +1,207 @@
+r"""Unit tests for the shared default httpx clients."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import ANY, Mock, patch
+
+import httpx
+import pytest
+
+from aresilient import get
+from aresilient.core import (
+    DEFAULT_LIMITS,
+    MAX_DEFAULT_CLIENTS,
+    async_session,
+    close_default_clients,
+    get_default_async_client,
+    get_default_client,
+)
+
+########################################
+#     Tests for get_default_client     #
+########################################
+
+
+def test_get_default_client() -> None:
+    client = get_default_client(10.0)
+    assert isinstance(client, httpx.Client)
+    assert client.timeout == httpx.Timeout(10.0)
+
+
+def test_get_default_client_limits() -> None:
+    with patch("httpx.Client") as mock_client_class:
+        get_default_client(10.0)
+    mock_client_class.assert_called_once_with(timeout=10.0, limits=DEFAULT_LIMITS, cookies=ANY)
+
+
+def test_default_limits() -> None:
+    limits = httpx.Limits(
+        max_connections=1024, max_keepalive_connections=512, keepalive_expiry=30.0
+    )
+    assert limits == DEFAULT_LIMITS
+
+
+def test_get_default_client_same_timeout() -> None:
+    assert get_default_client(10.0) is get_default_client(10.0)
+
+
+def test_get_default_client_different_timeouts() -> None:
+    assert get_default_client(10.0) is not get_default_client(30.0)
+
+
+def test_get_default_client_timeout_object() -> None:
+    client = get_default_client(httpx.Timeout(10.0, connect=5.0))
+    assert client is get_default_client(httpx.Timeout(10.0, connect=5.0))
+    assert client.timeout == httpx.Timeout(10.0, connect=5.0)
+
+
+def test_get_default_client_evicts_least_recently_used() -> None:
+    first = get_default_client(1.0)
+    clients = [get_default_client(float(i)) for i in range(2, MAX_DEFAULT_CLIENTS + 1)]
+    # Use the first client again, so the second one is the least recently used
+    assert get_default_client(1.0) is first
+
+    get_default_client(100.0)
+
+    assert not first.is_closed
+    assert clients[0].is_closed
+    assert all(not client.is_closed for client in clients[1:])
+    assert get_default_client(2.0) is not clients[0]
+
+
+def test_get_default_client_does_not_persist_cookies() -> None:
+    cookie_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cookie_headers.append(request.headers.get("Cookie"))
+        return httpx.Response(200, headers={"Set-Cookie": "session=secret; Path=/"})
+
+    client = get_default_client(10.0)
+    client._transport = httpx.MockTransport(handler)
+
+    first = get("https://api.example.com/login")
+    get("https://api.example.com/data")
+
+    assert first.cookies["session"] == "secret"
+    assert cookie_headers == [None, None]
+    assert not client.cookies
+
+
+def test_get_default_client_sends_request_cookies() -> None:
+    client = get_default_client(10.0)
+    client._transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, text=request.headers.get("Cookie", ""))
+    )
+    with pytest.warns(DeprecationWarning, match=r"per-request cookies"):
+        response = client.get("https://api.example.com/data", cookies={"token": "abc"})
+    assert response.text == "token=abc"
+
+
+###########################################
+#     Tests for close_default_clients     #
+###########################################
+
+
+def test_close_default_clients() -> None:
+    client = get_default_client(10.0)
+    close_default_clients()
+    assert client.is_closed
+
+
+def test_close_default_clients_creates_new_client() -> None:
+    client = get_default_client(10.0)
+    close_default_clients()
+    assert get_default_client(10.0) is not client
+
+
+def test_close_default_clients_closes_all_clients() -> None:
+    clients = [Mock(spec=httpx.Client), Mock(spec=httpx.Client)]
+    with patch("httpx.Client", side_effect=clients):
+        get_default_client(10.0)
+        get_default_client(30.0)
+    close_default_clients()
+    for client in clients:
+        client.close.assert_called_once_with()
+
+
+def test_close_default_clients_empty() -> None:
+    close_default_clients()
+
+
+##############################################
+#     Tests for get_default_async_client     #
+##############################################
+
+
+def test_get_default_async_client_outside_session() -> None:
+    assert get_default_async_client() is None
+
+
+###################################
+#     Tests for async_session     #
+###################################
+
+
+@pytest.mark.asyncio
+async def test_async_session() -> None:
+    async with async_session() as client:
+        assert isinstance(client, httpx.AsyncClient)
+        assert client.timeout == httpx.Timeout(10.0)
+        assert get_default_async_client() is client
+    assert client.is_closed
+    assert get_default_async_client() is None
+
+
+@pytest.mark.asyncio
+async def test_async_session_limits() -> None:
+    with patch("httpx.AsyncClient") as mock_client_class:
+        async with async_session(timeout=5.0):
+            pass
+    mock_client_class.assert_called_once_with(timeout=5.0, limits=DEFAULT_LIMITS)
+
+
+@pytest.mark.asyncio
+async def test_async_session_nested() -> None:
+    async with async_session() as outer:
+        async with async_session() as inner:
+            assert get_default_async_client() is inner
+        assert get_default_async_client() is outer
+
+
+@pytest.mark.asyncio
+async def test_async_session_inherited_by_tasks() -> None:
+    async def get_client() -> httpx.AsyncClient | None:
+        return get_default_async_client()
+
+    async with async_session() as client:
+        assert await asyncio.gather(get_client(), get_client()) == [client, client]
+
+
+@pytest.mark.asyncio
+async def test_async_session_not_shared_with_other_tasks() -> None:
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def run_session() -> None:
+        async with async_session():
+            entered.set()
+            await release.wait()
+
+    task = asyncio.create_task(run_session())
+    await entered.wait()
+    assert get_default_async_client() is None
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_async_session_reset_on_error() -> None:
+    async def fail_in_session() -> None:
+        async with async_session():
+            msg = "boom"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match=r"boom"):
+        await fail_in_session()
+    assert get_default_async_client() is None
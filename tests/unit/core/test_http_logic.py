@@ -0,0 +1,201 @@
+r"""Unit tests for the shared HTTP method logic."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from aresilient.core.default_clients import async_session
+from aresilient.core.http_logic import execute_http_method, execute_http_method_async
+
+TEST_URL = "https://api.example.com/data"
+
+
+#########################################
+#     Tests for execute_http_method     #
+#########################################
+
+
+def test_execute_http_method_default_timeout_skips_validation(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(spec=httpx.Client, get=Mock(return_value=mock_response))
+    with (
+        patch("httpx.Client", return_value=client),
+        patch("aresilient.core.http_logic.validate_timeout") as mock_validate,
+    ):
+        assert execute_http_method(TEST_URL, "GET") is mock_response
+    mock_validate.assert_not_called()
+
+
+def test_execute_http_method_custom_timeout_is_validated(mock_response: httpx.Response) -> None:
+    client = Mock(spec=httpx.Client, get=Mock(return_value=mock_response))
+    with (
+        patch("httpx.Client", return_value=client),
+        patch("aresilient.core.http_logic.validate_timeout") as mock_validate,
+    ):
+        execute_http_method(TEST_URL, "GET", timeout=5.0)
+    mock_validate.assert_called_once_with(5.0)
+
+
+def test_execute_http_method_client_skips_timeout_validation(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(spec=httpx.Client, get=Mock(return_value=mock_response))
+    with patch("aresilient.core.http_logic.validate_timeout") as mock_validate:
+        assert execute_http_method(TEST_URL, "GET", client=client, timeout=0) is mock_response
+    mock_validate.assert_not_called()
+
+
+@pytest.mark.parametrize("method", ["GET", "post", "OPTIONS", "Get", "pAtCh"])
+def test_execute_http_method_method_names(method: str, mock_response: httpx.Response) -> None:
+    client = Mock(spec=httpx.Client)
+    setattr(client, method.lower(), Mock(return_value=mock_response))
+    assert execute_http_method(TEST_URL, method, client=client) is mock_response
+    getattr(client, method.lower()).assert_called_once_with(url=TEST_URL)
+
+
+@pytest.mark.parametrize("method", ["get", "Get", "GET"])
+def test_execute_http_method_passes_normalized_method(method: str) -> None:
+    client = Mock(spec=httpx.Client)
+    with patch("aresilient.core.http_logic.request") as mock_request:
+        execute_http_method(TEST_URL, method, client=client)
+    mock_request.assert_called_once_with(
+        url=TEST_URL, method="GET", request_func=client.get, config=None
+    )
+
+
+def test_execute_http_method_unsupported_method() -> None:
+    with (
+        patch("httpx.Client") as mock_client_class,
+        pytest.raises(ValueError, match=r"Unsupported HTTP method: 'PROPFIND'"),
+    ):
+        execute_http_method(TEST_URL, "PROPFIND")
+    mock_client_class.assert_not_called()
+
+
+def test_execute_http_method_invalid_timeout() -> None:
+    with pytest.raises(ValueError, match=r"timeout must be > 0"):
+        execute_http_method(TEST_URL, "GET", timeout=0)
+
+
+###############################################
+#     Tests for execute_http_method_async     #
+###############################################
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_default_timeout_skips_validation(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(
+        spec=httpx.AsyncClient, get=AsyncMock(return_value=mock_response), aclose=AsyncMock()
+    )
+    with (
+        patch("httpx.AsyncClient", return_value=client),
+        patch("aresilient.core.http_logic.validate_timeout") as mock_validate,
+    ):
+        assert await execute_http_method_async(TEST_URL, "GET") is mock_response
+    mock_validate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_custom_timeout_is_validated(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(
+        spec=httpx.AsyncClient, get=AsyncMock(return_value=mock_response), aclose=AsyncMock()
+    )
+    with (
+        patch("httpx.AsyncClient", return_value=client),
+        patch("aresilient.core.http_logic.validate_timeout") as mock_validate,
+    ):
+        await execute_http_method_async(TEST_URL, "GET", timeout=5.0)
+    mock_validate.assert_called_once_with(5.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_client_skips_timeout_validation(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(spec=httpx.AsyncClient, get=AsyncMock(return_value=mock_response))
+    with patch("aresilient.core.http_logic.validate_timeout") as mock_validate:
+        result = await execute_http_method_async(TEST_URL, "GET", client=client, timeout=0)
+    assert result is mock_response
+    mock_validate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_uses_session_client(
+    mock_response: httpx.Response,
+) -> None:
+    async with async_session() as session_client:
+        with (
+            patch.object(session_client, "get", AsyncMock(return_value=mock_response)) as get,
+            patch("httpx.AsyncClient") as mock_client_class,
+        ):
+            assert await execute_http_method_async(TEST_URL, "GET") is mock_response
+        assert not session_client.is_closed
+    get.assert_called_once_with(url=TEST_URL)
+    mock_client_class.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_session_client_custom_timeout(
+    mock_response: httpx.Response,
+) -> None:
+    async with async_session() as session_client:
+        with patch.object(session_client, "get", AsyncMock(return_value=mock_response)) as get:
+            await execute_http_method_async(TEST_URL, "GET", timeout=5.0)
+    get.assert_called_once_with(url=TEST_URL, timeout=5.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_explicit_client_in_session(
+    mock_response: httpx.Response,
+) -> None:
+    client = Mock(spec=httpx.AsyncClient, get=AsyncMock(return_value=mock_response))
+    async with async_session() as session_client:
+        with patch.object(session_client, "get", AsyncMock()) as session_get:
+            assert await execute_http_method_async(TEST_URL, "GET", client=client) is mock_response
+    session_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["GET", "post", "Get", "pAtCh"])
+async def test_execute_http_method_async_method_names(
+    method: str, mock_response: httpx.Response
+) -> None:
+    client = Mock(spec=httpx.AsyncClient)
+    setattr(client, method.lower(), AsyncMock(return_value=mock_response))
+    assert await execute_http_method_async(TEST_URL, method, client=client) is mock_response
+    getattr(client, method.lower()).assert_called_once_with(url=TEST_URL)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["post", "Post", "POST"])
+async def test_execute_http_method_async_passes_normalized_method(method: str) -> None:
+    client = Mock(spec=httpx.AsyncClient)
+    with patch("aresilient.core.http_logic.request_async") as mock_request:
+        await execute_http_method_async(TEST_URL, method, client=client)
+    mock_request.assert_awaited_once_with(
+        url=TEST_URL, method="POST", request_func=client.post, config=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_unsupported_method() -> None:
+    with (
+        patch("httpx.AsyncClient") as mock_client_class,
+        pytest.raises(ValueError, match=r"Unsupported HTTP method: 'PROPFIND'"),
+    ):
+        await execute_http_method_async(TEST_URL, "PROPFIND")
+    mock_client_class.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_http_method_async_invalid_timeout() -> None:
+    with pytest.raises(ValueError, match=r"timeout must be > 0"):
+        await execute_http_method_async(TEST_URL, "GET", timeout=0)
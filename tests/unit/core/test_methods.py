@@ -0,0 +1,105 @@
+r"""Unit tests for HTTP method names."""
+
+from __future__ import annotations
+
+import sys
+
+import httpx
+import pytest
+
+from aresilient.core import (
+    HTTP_METHOD_ATTRS,
+    HTTP_METHOD_NAMES,
+    HTTP_METHODS,
+    get_method_attr,
+    normalize_method,
+)
+
+##################################
+#     Tests for HTTP_METHODS     #
+##################################
+
+
+def test_http_methods_are_uppercase() -> None:
+    """Test that HTTP_METHODS contains canonical uppercase names."""
+    assert all(method == method.upper() for method in HTTP_METHODS)
+
+
+def test_http_methods_exist_on_httpx_clients() -> None:
+    """Test that each HTTP method has a matching httpx client method."""
+    for method in HTTP_METHODS:
+        assert callable(getattr(httpx.Client, method.lower()))
+        assert callable(getattr(httpx.AsyncClient, method.lower()))
+
+
+#######################################
+#     Tests for HTTP_METHOD_ATTRS     #
+#######################################
+
+
+def test_http_method_attrs_keys() -> None:
+    """Test that HTTP_METHOD_ATTRS contains the uppercase and lowercase
+    names."""
+    assert set(HTTP_METHOD_ATTRS) == set(HTTP_METHODS) | {m.lower() for m in HTTP_METHODS}
+
+
+def test_http_method_attrs_values() -> None:
+    """Test that HTTP_METHOD_ATTRS maps each name to its lowercase
+    name."""
+    assert all(attr == method.lower() for method, attr in HTTP_METHOD_ATTRS.items())
+
+
+def test_http_method_attrs_values_are_interned() -> None:
+    """Test that HTTP_METHOD_ATTRS values are the interned attribute
+    names."""
+    assert all(attr is sys.intern(attr) for attr in HTTP_METHOD_ATTRS.values())
+
+
+#####################################
+#     Tests for get_method_attr     #
+#####################################
+
+
+@pytest.mark.parametrize(
+    ("method", "attr"),
+    [("GET", "get"), ("post", "post"), ("Patch", "patch"), ("PROPFIND", "propfind")],
+)
+def test_get_method_attr(method: str, attr: str) -> None:
+    assert get_method_attr(method) == attr
+
+
+def test_http_method_attrs_is_read_only() -> None:
+    """Test that HTTP_METHOD_ATTRS cannot be modified."""
+    with pytest.raises(TypeError):
+        HTTP_METHOD_ATTRS["PROPFIND"] = "propfind"
+
+
+#######################################
+#     Tests for HTTP_METHOD_NAMES     #
+#######################################
+
+
+def test_http_method_names_keys() -> None:
+    """Test that HTTP_METHOD_NAMES contains the uppercase and lowercase
+    names."""
+    assert set(HTTP_METHOD_NAMES) == set(HTTP_METHODS) | {m.lower() for m in HTTP_METHODS}
+
+
+def test_http_method_names_values() -> None:
+    """Test that HTTP_METHOD_NAMES maps each name to the canonical
+    uppercase name."""
+    canonical = {method: method for method in HTTP_METHODS}
+    assert all(name is canonical[method.upper()] for method, name in HTTP_METHOD_NAMES.items())
+
+
+######################################
+#     Tests for normalize_method     #
+######################################
+
+
+@pytest.mark.parametrize(
+    ("method", "name"),
+    [("GET", "GET"), ("post", "POST"), ("Patch", "PATCH"), ("propfind", "PROPFIND")],
+)
+def test_normalize_method(method: str, name: str) -> None:
+    assert normalize_method(method) == name
@@ -0,0 +1,112 @@
+r"""Unit tests for the retry budget."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from aresilient.retry import RetryBudget
+
+#################################
+#     Tests for RetryBudget     #
+#################################
+
+
+def test_retry_budget_starts_full() -> None:
+    assert RetryBudget(max_tokens=5.0).tokens == 5.0
+
+
+@pytest.mark.parametrize("retry_ratio", [0.0, 0.2, 1.0])
+def test_retry_budget_valid_retry_ratio(retry_ratio: float) -> None:
+    RetryBudget(retry_ratio=retry_ratio)
+
+
+def test_retry_budget_invalid_retry_ratio() -> None:
+    with pytest.raises(ValueError, match=r"retry_ratio must be >= 0, got -0.1"):
+        RetryBudget(retry_ratio=-0.1)
+
+
+def test_retry_budget_invalid_min_retries_per_sec() -> None:
+    with pytest.raises(ValueError, match=r"min_retries_per_sec must be >= 0, got -1.0"):
+        RetryBudget(min_retries_per_sec=-1.0)
+
+
+@pytest.mark.parametrize("max_tokens", [0.0, 0.5])
+def test_retry_budget_invalid_max_tokens(max_tokens: float) -> None:
+    with pytest.raises(ValueError, match=r"max_tokens must be >= 1"):
+        RetryBudget(max_tokens=max_tokens)
+
+
+def test_retry_budget_try_withdraw() -> None:
+    budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=2.0)
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    assert budget.tokens == 0.0
+
+
+def test_retry_budget_deposit() -> None:
+    budget = RetryBudget(retry_ratio=0.5, min_retries_per_sec=0.0, max_tokens=1.0)
+    assert budget.try_withdraw()
+    budget.deposit()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+
+def test_retry_budget_deposit_capped_at_max_tokens() -> None:
+    budget = RetryBudget(retry_ratio=1.0, min_retries_per_sec=0.0, max_tokens=2.0)
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2.0
+
+
+def test_retry_budget_refill_over_time() -> None:
+    with patch("aresilient.retry.budget.time.monotonic", return_value=0.0) as mock_time:
+        budget = RetryBudget(retry_ratio=0.0, min_retries_per_sec=2.0, max_tokens=1.0)
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+        mock_time.return_value = 0.25
+        assert budget.tokens == 0.5
+        assert not budget.try_withdraw()
+        mock_time.return_value = 0.5
+        assert budget.try_withdraw()
+
+
+def test_retry_budget_refill_capped_at_max_tokens() -> None:
+    with patch("aresilient.retry.budget.time.monotonic", return_value=0.0) as mock_time:
+        budget = RetryBudget(min_retries_per_sec=10.0, max_tokens=3.0)
+        assert budget.try_withdraw()
+        mock_time.return_value = 100.0
+        assert budget.tokens == 3.0
+
+
+def test_retry_budget_thread_safety() -> None:
+    budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=50.0)
+    results: list[bool] = []
+    lock = threading.Lock()
+
+    def withdraw() -> None:
+        for _ in range(10):
+            allowed = budget.try_withdraw()
+            with lock:
+                results.append(allowed)
+
+    threads = [threading.Thread(target=withdraw) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 50
+    assert budget.tokens == 0.0
+
+
+def test_retry_budget_has_no_instance_dict() -> None:
+    """Test that RetryBudget uses slots instead of an instance dict."""
+    budget = RetryBudget()
+    assert not hasattr(budget, "__dict__")
+    with pytest.raises(AttributeError):
+        budget.unknown = 1
@@ -2,9 +2,15 @@ r"""Unit tests for retry configuration dataclasses."""
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
-from aresilient.retry import CallbackConfig, RetryConfig
+import pytest
+
+from aresilient.backoff import LinearBackoff
+from aresilient.core import ClientConfig
+from aresilient.retry import CallbackConfig, RetryBudget, RetryConfig
 
 if TYPE_CHECKING:
     import httpx
@@ -79,6 +85,54 @@ def test_retry_config_with_time_limits() -> None:
     assert config.max_wait_time == 5.0
 
 
+def test_retry_config_from_client_config() -> None:
+    """Test that from_client_config copies the retry fields."""
+    strategy = LinearBackoff()
+    retry_budget = RetryBudget()
+    config = RetryConfig.from_client_config(
+        ClientConfig(
+            max_retries=5,
+            status_forcelist=(503,),
+            jitter_factor=0.2,
+            retry_if=custom_retry,
+            backoff_strategy=strategy,
+            max_total_time=30.0,
+            max_wait_time=5.0,
+            retry_budget=retry_budget,
+        )
+    )
+    assert config == RetryConfig(
+        max_retries=5,
+        status_forcelist=(503,),
+        jitter_factor=0.2,
+        retry_if=custom_retry,
+        backoff_strategy=strategy,
+        max_total_time=30.0,
+        max_wait_time=5.0,
+        retry_budget=retry_budget,
+    )
+
+
+def test_retry_config_is_frozen() -> None:
+    """Test that RetryConfig attributes cannot be modified."""
+    config = RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)
+    with pytest.raises(FrozenInstanceError):
+        config.max_retries = 5
+
+
+def test_retry_config_has_no_instance_dict() -> None:
+    """Test that RetryConfig uses slots instead of an instance dict."""
+    config = RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)
+    assert not hasattr(config, "__dict__")
+
+
+def test_retry_config_is_hashable() -> None:
+    """Test that equal RetryConfig objects have the same hash."""
+    assert hash(RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)) == hash(
+        RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)
+    )
+
+
 def test_callback_config_creation() -> None:
     """Test CallbackConfig dataclass creation."""
     config = CallbackConfig()
@@ -112,3 +166,58 @@ def test_callback_config_partial_callbacks() -> None:
     assert config.on_retry is None
     assert config.on_success is None
     assert config.on_failure is None
+
+
+def test_callback_config_has_no_instance_dict() -> None:
+    """Test that CallbackConfig uses slots instead of an instance dict."""
+    assert not hasattr(CallbackConfig(), "__dict__")
+
+
+def test_callback_config_is_frozen() -> None:
+    """Test that CallbackConfig attributes cannot be modified."""
+    config = CallbackConfig()
+    with pytest.raises(FrozenInstanceError):
+        config.on_retry = on_retry
+
+
+def test_callback_config_in_background() -> None:
+    """Test that in_background wraps only the configured callbacks."""
+    on_retry = Mock()
+    config = CallbackConfig(on_retry=on_retry)
+    background = config.in_background()
+    assert background is not config
+    assert callable(background.on_retry)
+    assert background.on_retry is not on_retry
+    assert background.on_request is None
+    assert background.on_success is None
+    assert background.on_failure is None
+    assert config.on_retry is on_retry
+
+
+def test_callback_config_from_client_config() -> None:
+    """Test that from_client_config copies the callbacks."""
+    config = CallbackConfig.from_client_config(
+        ClientConfig(
+            on_request=on_request,
+            on_retry=on_retry,
+            on_success=on_success,
+            on_failure=on_failure,
+        )
+    )
+    assert config == CallbackConfig(
+        on_request=on_request,
+        on_retry=on_retry,
+        on_success=on_success,
+        on_failure=on_failure,
+    )
+
+
+def test_callback_config_from_client_config_background() -> None:
+    """Test that from_client_config wraps the callbacks when
+    background_callbacks is set."""
+    config = CallbackConfig.from_client_config(
+        ClientConfig(on_retry=on_retry, background_callbacks=True)
+    )
+    assert callable(config.on_retry)
+    assert config.on_retry is not on_retry
+    assert config.on_request is None
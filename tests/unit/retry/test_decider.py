@@ -47,6 +47,22 @@ def test_retry_decider_creation() -> None:
     assert decider.retry_if is None
 
 
+def test_retry_decider_with_list_status_forcelist() -> None:
+    """Test RetryDecider with a status_forcelist that is not a tuple."""
+    decider = RetryDecider(status_forcelist=[500, 503], retry_if=None)
+
+    should_retry, reason = decider.should_retry_response(
+        response=Mock(spec=httpx.Response, status_code=503),
+        attempt=0,
+        max_retries=3,
+        url="https://example.com",
+        method="GET",
+    )
+
+    assert should_retry is True
+    assert reason == "status 503"
+
+
 def test_should_retry_response_success_no_retry() -> None:
     """Test successful response (2xx) does not retry."""
     decider = RetryDecider(status_forcelist=(500, 502, 503), retry_if=None)
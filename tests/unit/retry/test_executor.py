@@ -2,14 +2,16 @@ r"""Unit tests for synchronous retry executor."""
 
 from __future__ import annotations
 
+import itertools
 from unittest.mock import Mock, call, patch
 
 import httpx
 import pytest
 
+from aresilient.backoff import ConstantBackoff
 from aresilient.circuit_breaker import CircuitBreaker
 from aresilient.exceptions import HttpRequestError
-from aresilient.retry import CallbackConfig, RetryConfig, RetryExecutor
+from aresilient.retry import CallbackConfig, RetryBudget, RetryConfig, RetryExecutor
 
 
 def test_retry_executor_creation() -> None:
@@ -248,7 +250,7 @@ def test_retry_executor_max_total_time_exceeded_with_response() -> None:
         return 0.0 if call_count["count"] == 1 else 2.0
 
     with (
-        patch("aresilient.retry.executor.time.time", side_effect=time_side_effect),
+        patch("aresilient.retry.executor.time.monotonic", side_effect=time_side_effect),
         pytest.raises(HttpRequestError) as exc_info,
     ):
         executor.execute(
@@ -262,6 +264,66 @@ def test_retry_executor_max_total_time_exceeded_with_response() -> None:
     assert exc_info.value.status_code == 500
 
 
+def test_retry_executor_max_total_time_ignores_wall_clock_jumps() -> None:
+    """Test max_total_time is measured with the monotonic clock, so a
+    wall-clock adjustment does not exhaust the time budget."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        max_total_time=1.0,
+    )
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    mock_response_ok = Mock(spec=httpx.Response, status_code=200)
+    mock_request_func = Mock(
+        side_effect=[Mock(spec=httpx.Response, status_code=500), mock_response_ok]
+    )
+
+    with (
+        patch("time.sleep"),
+        patch("aresilient.retry.executor.time.time", side_effect=itertools.count(step=3600.0)),
+    ):
+        response = executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+        )
+
+    assert response is mock_response_ok
+    assert mock_request_func.call_count == 2
+
+
+def test_retry_executor_sleep_clamped_to_max_total_time() -> None:
+    """Test the backoff delay is clamped to the remaining time budget."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        backoff_strategy=ConstantBackoff(delay=100.0),
+        max_total_time=5.0,
+    )
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    mock_response_ok = Mock(spec=httpx.Response, status_code=200)
+    mock_request_func = Mock(
+        side_effect=[Mock(spec=httpx.Response, status_code=500), mock_response_ok]
+    )
+
+    with (
+        patch("time.sleep") as mock_sleep,
+        patch("aresilient.retry.executor_core.time.monotonic", side_effect=[0.0, 1.0, 1.0]),
+    ):
+        response = executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+        )
+
+    assert response is mock_response_ok
+    mock_sleep.assert_called_once_with(4.0)
+
+
 def test_retry_executor_max_total_time_exceeded_with_exception_only() -> None:
     """Test max_total_time exceeded with exception but no response."""
     retry_config = RetryConfig(
@@ -283,7 +345,7 @@ def test_retry_executor_max_total_time_exceeded_with_exception_only() -> None:
         return 0.0 if call_count["count"] == 1 else 2.0
 
     with (
-        patch("aresilient.retry.executor.time.time", side_effect=time_side_effect),
+        patch("aresilient.retry.executor.time.monotonic", side_effect=time_side_effect),
         pytest.raises(
             HttpRequestError,
             match=r"GET request to https://example\.com failed after 1 attempts \(max_total_time exceeded\)",
@@ -375,3 +437,110 @@ def test_retry_executor_timeout_exhausts_retries(mock_sleep: Mock) -> None:
     # Should be called max_retries + 1 times
     assert mock_request_func.call_count == 3
     assert mock_sleep.call_args_list == [call(0.3), call(0.6)]
+
+
+def test_retry_executor_success_skips_decider() -> None:
+    """Test that a successful response without retry_if does not call
+    the decider."""
+    retry_config = RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_response = Mock(spec=httpx.Response, status_code=200)
+
+    with patch.object(executor.decider, "should_retry_response") as mock_decide:
+        response = executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=Mock(return_value=mock_response),
+        )
+
+    assert response is mock_response
+    mock_decide.assert_not_called()
+
+
+def test_retry_executor_success_with_retry_if_uses_decider() -> None:
+    """Test that a successful response is evaluated by retry_if."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        retry_if=lambda response, _exc: response is not None and response.status_code == 200,
+    )
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_response = Mock(spec=httpx.Response, status_code=200)
+    request_func = Mock(return_value=mock_response)
+
+    with patch("time.sleep"), pytest.raises(HttpRequestError):
+        executor.execute(url="https://example.com", method="GET", request_func=request_func)
+
+    assert request_func.call_count == 2
+
+
+def test_retry_executor_retry_budget_exhausted_with_response(mock_sleep: Mock) -> None:
+    """Test that an empty retry budget stops the retries."""
+    retry_budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=1.0)
+    retry_config = RetryConfig(
+        max_retries=5, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    on_failure = Mock()
+    executor = RetryExecutor(
+        retry_config=retry_config, callback_config=CallbackConfig(on_failure=on_failure)
+    )
+    mock_request_func = Mock(return_value=Mock(spec=httpx.Response, status_code=500))
+
+    with pytest.raises(
+        HttpRequestError,
+        match=(
+            r"GET request to https://example\.com failed with status 500 after 2 attempts "
+            r"\(retry budget exhausted\)"
+        ),
+    ) as exc_info:
+        executor.execute(url="https://example.com", method="GET", request_func=mock_request_func)
+
+    assert exc_info.value.status_code == 500
+    assert mock_request_func.call_count == 2
+    mock_sleep.assert_called_once_with(0.3)
+    on_failure.assert_called_once()
+
+
+def test_retry_executor_retry_budget_exhausted_with_exception(mock_sleep: Mock) -> None:
+    """Test that an empty retry budget stops the retries after an
+    exception."""
+    retry_budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=1.0)
+    assert retry_budget.try_withdraw()
+    retry_config = RetryConfig(
+        max_retries=5, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    error = httpx.ConnectError("Connection failed")
+
+    with pytest.raises(
+        HttpRequestError,
+        match=(
+            r"GET request to https://example\.com failed after 1 attempts "
+            r"\(retry budget exhausted\): Connection failed"
+        ),
+    ) as exc_info:
+        executor.execute(
+            url="https://example.com", method="GET", request_func=Mock(side_effect=error)
+        )
+
+    assert exc_info.value.__cause__ is error
+    mock_sleep.assert_not_called()
+
+
+def test_retry_executor_retry_budget_deposit_on_success() -> None:
+    """Test that a successful request deposits into the retry budget."""
+    retry_budget = Mock(spec=RetryBudget)
+    retry_config = RetryConfig(
+        max_retries=3, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    executor = RetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    executor.execute(
+        url="https://example.com",
+        method="GET",
+        request_func=Mock(return_value=Mock(spec=httpx.Response, status_code=200)),
+    )
+
+    retry_budget.deposit.assert_called_once_with()
+    retry_budget.try_withdraw.assert_not_called()
@@ -2,14 +2,18 @@ r"""Unit tests for asynchronous retry executor."""
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+from typing import Any
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import httpx
 import pytest
 
-from aresilient.circuit_breaker import CircuitBreaker
+from aresilient.backoff import ConstantBackoff
+from aresilient.circuit_breaker import CircuitBreaker, CircuitBreakerError
 from aresilient.exceptions import HttpRequestError
-from aresilient.retry import AsyncRetryExecutor, CallbackConfig, RetryConfig
+from aresilient.retry import AsyncRetryExecutor, CallbackConfig, RetryBudget, RetryConfig
 
 
 def test_async_retry_executor_creation() -> None:
@@ -203,6 +207,59 @@ async def test_async_retry_executor_with_callbacks() -> None:
     on_success_mock.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_async_retry_executor_circuit_breaker_opened_stops_retries(
+    mock_asleep: Mock,
+) -> None:
+    """Test that the retries stop, without sleeping, once the circuit
+    breaker opens."""
+    retry_config = RetryConfig(max_retries=5, status_forcelist=(500,), jitter_factor=0.0)
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    executor = AsyncRetryExecutor(
+        retry_config=retry_config, callback_config=CallbackConfig(), circuit_breaker=circuit_breaker
+    )
+
+    mock_request_func = AsyncMock(return_value=Mock(spec=httpx.Response, status_code=500))
+
+    with pytest.raises(CircuitBreakerError, match=r"Circuit breaker is OPEN"):
+        await executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+        )
+
+    mock_request_func.assert_called_once()
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_circuit_breaker_opened_calls_on_failure(
+    mock_asleep: Mock,
+) -> None:
+    """Test that on_failure is called, with the last exception as cause,
+    when the circuit breaker opens during the retries."""
+    retry_config = RetryConfig(max_retries=5, status_forcelist=(500,), jitter_factor=0.0)
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    on_failure = Mock()
+    executor = AsyncRetryExecutor(
+        retry_config=retry_config,
+        callback_config=CallbackConfig(on_failure=on_failure),
+        circuit_breaker=circuit_breaker,
+    )
+    error = httpx.ConnectError("Connection failed")
+
+    with pytest.raises(CircuitBreakerError) as exc_info:
+        await executor.execute(
+            url="https://example.com", method="GET", request_func=AsyncMock(side_effect=error)
+        )
+
+    on_failure.assert_called_once()
+    assert on_failure.call_args.args[0].error is exc_info.value
+    assert on_failure.call_args.args[0].status_code is None
+    assert exc_info.value.__cause__ is error
+    mock_asleep.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_async_retry_executor_circuit_breaker_records_exception_failure(
     mock_asleep: Mock,
@@ -258,7 +315,7 @@ async def test_async_retry_executor_max_total_time_exceeded_with_response() -> N
         return 0.0 if call_count["count"] == 1 else 2.0
 
     with (
-        patch("aresilient.retry.executor_async.time.time", side_effect=time_side_effect),
+        patch("aresilient.retry.executor_async.time.monotonic", side_effect=time_side_effect),
         pytest.raises(HttpRequestError) as exc_info,
     ):
         await executor.execute(
@@ -272,6 +329,36 @@ async def test_async_retry_executor_max_total_time_exceeded_with_response() -> N
     assert exc_info.value.status_code == 500
 
 
+@pytest.mark.asyncio
+async def test_async_retry_executor_sleep_clamped_to_max_total_time(mock_asleep: Mock) -> None:
+    """Test the backoff delay is clamped to the remaining time budget."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        backoff_strategy=ConstantBackoff(delay=100.0),
+        max_total_time=5.0,
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    mock_response_ok = Mock(spec=httpx.Response, status_code=200)
+    mock_request_func = AsyncMock(
+        side_effect=[Mock(spec=httpx.Response, status_code=500), mock_response_ok]
+    )
+
+    # The request starts at 0.0, then 1 second has elapsed
+    times = itertools.chain([0.0], itertools.repeat(1.0))
+    with patch("aresilient.retry.executor_core.time.monotonic", side_effect=times):
+        response = await executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+        )
+
+    assert response is mock_response_ok
+    mock_asleep.assert_called_once_with(4.0)
+
+
 @pytest.mark.asyncio
 async def test_async_retry_executor_max_total_time_exceeded_with_exception_only() -> None:
     """Test max_total_time exceeded with exception but no response."""
@@ -294,7 +381,7 @@ async def test_async_retry_executor_max_total_time_exceeded_with_exception_only(
         return 0.0 if call_count["count"] == 1 else 2.0
 
     with (
-        patch("aresilient.retry.executor_async.time.time", side_effect=time_side_effect),
+        patch("aresilient.retry.executor_async.time.monotonic", side_effect=time_side_effect),
         pytest.raises(
             HttpRequestError,
             match=r"GET request to https://example\.com failed after 1 attempts \(max_total_time exceeded\)",
@@ -310,6 +397,90 @@ async def test_async_retry_executor_max_total_time_exceeded_with_exception_only(
     assert mock_request_func.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_async_retry_executor_max_total_time_cancels_slow_request() -> None:
+    """Test a request still running when max_total_time is reached is
+    cancelled."""
+    retry_config = RetryConfig(
+        max_retries=3, status_forcelist=(500,), jitter_factor=0.0, max_total_time=0.05
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    async def slow_request(**kwargs: Any) -> httpx.Response:  # noqa: ARG001
+        await asyncio.sleep(10.0)
+        return Mock(spec=httpx.Response, status_code=200)
+
+    with pytest.raises(
+        HttpRequestError,
+        match=r"GET request to https://example\.com failed after 1 attempts \(max_total_time exceeded\)",
+    ):
+        await asyncio.wait_for(
+            executor.execute(url="https://example.com", method="GET", request_func=slow_request),
+            timeout=5.0,
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_total_time", [None, 60.0])
+async def test_async_retry_executor_request_timeout_error_is_not_budget_error(
+    max_total_time: float | None,
+) -> None:
+    """Test a TimeoutError raised by the request function is raised
+    unchanged."""
+    retry_config = RetryConfig(
+        max_retries=3, status_forcelist=(500,), jitter_factor=0.0, max_total_time=max_total_time
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_request_func = AsyncMock(side_effect=TimeoutError("app-level timeout"))
+
+    with pytest.raises(TimeoutError, match=r"app-level timeout"):
+        await executor.execute(
+            url="https://example.com", method="GET", request_func=mock_request_func
+        )
+
+    assert mock_request_func.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_max_total_time_exhausted_after_sleep(
+    mock_asleep: Mock,
+) -> None:
+    """Test no request is sent once the backoff delay used up the time
+    budget."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        backoff_strategy=ConstantBackoff(delay=100.0),
+        max_total_time=5.0,
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_request_func = AsyncMock(return_value=Mock(spec=httpx.Response, status_code=500))
+
+    # The request fails 1 second after it started, and the backoff delay
+    # uses the rest of the time budget
+    clock = {"now": 1.0}
+
+    def advance_clock(delay: float) -> None:
+        clock["now"] += delay
+
+    mock_asleep.side_effect = advance_clock
+    times = itertools.chain([0.0], iter(lambda: clock["now"], None))
+    with (
+        patch("aresilient.retry.executor_core.time.monotonic", side_effect=times),
+        pytest.raises(HttpRequestError) as exc_info,
+    ):
+        await executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+        )
+
+    assert exc_info.value.status_code == 500
+    assert mock_request_func.call_count == 1
+    mock_asleep.assert_called_once_with(4.0)
+
+
 @pytest.mark.asyncio
 async def test_async_retry_executor_handles_request_error(mock_asleep: Mock) -> None:
     """Test handling of RequestError exception."""
@@ -429,3 +600,119 @@ async def test_async_retry_executor_circuit_breaker_records_status_code_failure(
     # Should have recorded failures but then success reset the count
     assert circuit_breaker.failure_count == 0
     assert mock_asleep.call_args_list == [call(0.3), call(0.6)]
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_success_skips_decider() -> None:
+    """Test that a successful response without retry_if does not call
+    the decider."""
+    retry_config = RetryConfig(max_retries=3, status_forcelist=(500,), jitter_factor=0.0)
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_response = Mock(spec=httpx.Response, status_code=200)
+
+    with patch.object(executor.decider, "should_retry_response") as mock_decide:
+        response = await executor.execute(
+            url="https://example.com",
+            method="GET",
+            request_func=AsyncMock(return_value=mock_response),
+        )
+
+    assert response is mock_response
+    mock_decide.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_success_with_retry_if_uses_decider() -> None:
+    """Test that a successful response is evaluated by retry_if."""
+    retry_config = RetryConfig(
+        max_retries=1,
+        status_forcelist=(500,),
+        jitter_factor=0.0,
+        retry_if=lambda response, _exc: response is not None and response.status_code == 200,
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    mock_response = Mock(spec=httpx.Response, status_code=200)
+    request_func = AsyncMock(return_value=mock_response)
+
+    with patch("asyncio.sleep"), pytest.raises(HttpRequestError):
+        await executor.execute(url="https://example.com", method="GET", request_func=request_func)
+
+    assert request_func.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_retry_budget_exhausted_with_response(mock_asleep: Mock) -> None:
+    """Test that an empty retry budget stops the retries."""
+    retry_budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=1.0)
+    retry_config = RetryConfig(
+        max_retries=5, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    on_failure = Mock()
+    executor = AsyncRetryExecutor(
+        retry_config=retry_config, callback_config=CallbackConfig(on_failure=on_failure)
+    )
+    mock_request_func = AsyncMock(return_value=Mock(spec=httpx.Response, status_code=500))
+
+    with pytest.raises(
+        HttpRequestError,
+        match=(
+            r"GET request to https://example\.com failed with status 500 after 2 attempts "
+            r"\(retry budget exhausted\)"
+        ),
+    ) as exc_info:
+        await executor.execute(
+            url="https://example.com", method="GET", request_func=mock_request_func
+        )
+
+    assert exc_info.value.status_code == 500
+    assert mock_request_func.call_count == 2
+    mock_asleep.assert_called_once_with(0.3)
+    on_failure.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_retry_budget_exhausted_with_exception(
+    mock_asleep: Mock,
+) -> None:
+    """Test that an empty retry budget stops the retries after an
+    exception."""
+    retry_budget = RetryBudget(min_retries_per_sec=0.0, max_tokens=1.0)
+    assert retry_budget.try_withdraw()
+    retry_config = RetryConfig(
+        max_retries=5, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+    error = httpx.ConnectError("Connection failed")
+
+    with pytest.raises(
+        HttpRequestError,
+        match=(
+            r"GET request to https://example\.com failed after 1 attempts "
+            r"\(retry budget exhausted\): Connection failed"
+        ),
+    ) as exc_info:
+        await executor.execute(
+            url="https://example.com", method="GET", request_func=AsyncMock(side_effect=error)
+        )
+
+    assert exc_info.value.__cause__ is error
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_retry_executor_retry_budget_deposit_on_success() -> None:
+    """Test that a successful request deposits into the retry budget."""
+    retry_budget = Mock(spec=RetryBudget)
+    retry_config = RetryConfig(
+        max_retries=3, status_forcelist=(500,), jitter_factor=0.0, retry_budget=retry_budget
+    )
+    executor = AsyncRetryExecutor(retry_config=retry_config, callback_config=CallbackConfig())
+
+    await executor.execute(
+        url="https://example.com",
+        method="GET",
+        request_func=AsyncMock(return_value=Mock(spec=httpx.Response, status_code=200)),
+    )
+
+    retry_budget.deposit.assert_called_once_with()
+    retry_budget.try_withdraw.assert_not_called()
@@ -129,7 +129,7 @@ def test_on_success_callback_invoked() -> None:
     mock_response = Mock(spec=httpx.Response)
     start_time = 100.0
 
-    with patch("time.time", return_value=102.5):
+    with patch("time.monotonic", return_value=102.5):
         manager.on_success(
             url="https://example.com",
             method="PUT",
@@ -176,7 +176,7 @@ def test_on_failure_callback_invoked() -> None:
     error = Exception("Test error")
     start_time = 100.0
 
-    with patch("time.time", return_value=105.0):
+    with patch("time.monotonic", return_value=105.0):
         manager.on_failure(
             url="https://example.com",
             method="DELETE",
@@ -238,11 +238,11 @@ def test_all_callbacks_invoked() -> None:
     manager.on_retry("https://example.com", "GET", 0, 3, 1.0, None, 500)
 
     mock_response = Mock(spec=httpx.Response)
-    with patch("time.time", return_value=100.0):
+    with patch("time.monotonic", return_value=100.0):
         manager.on_success("https://example.com", "GET", 1, 3, mock_response, 99.0)
 
     error = Exception("Test")
-    with patch("time.time", return_value=100.0):
+    with patch("time.monotonic", return_value=100.0):
         manager.on_failure("https://example.com", "GET", 3, 3, error, None, 99.0)
 
     # Verify all were called
@@ -63,7 +63,7 @@ def test_with_jitter_factor(
         test_case.client_method, [mock_response_fail, mock_response]
     )
 
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.05):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.5):
         response = test_case.method_func(
             TEST_URL,
             client=mock_client,
@@ -74,7 +74,7 @@ def test_with_jitter_factor(
 
     assert response.status_code == test_case.status_code
     # Base sleep: 1.0 * 2^0 = 1.0
-    # Jitter: 0.05 * 1.0 = 0.05
+    # Jitter: 0.5 * 0.1 * 1.0 = 0.05
     # Total: 1.05
     mock_sleep.assert_called_once_with(1.05)
 
@@ -65,7 +65,7 @@ async def test_with_jitter_factor(
         test_case.client_method, [mock_response_fail, mock_response]
     )
 
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.05):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.5):
         response = await test_case.method_func(
             TEST_URL,
             client=mock_client,
@@ -76,7 +76,7 @@ async def test_with_jitter_factor(
 
     assert response.status_code == test_case.status_code
     # Base sleep: 1.0 * 2^0 = 1.0
-    # Jitter: 0.05 * 1.0 = 0.05
+    # Jitter: 0.5 * 0.1 * 1.0 = 0.05
     # Total: 1.05
     mock_asleep.assert_called_once_with(1.05)
 
@@ -2,6 +2,7 @@ r"""Unit tests for callback functionality."""
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import Mock, call, patch
 
 import httpx
@@ -14,6 +15,7 @@ from aresilient.callbacks import (
     invoke_on_request,
     invoke_on_retry,
     invoke_on_success,
+    run_in_background,
 )
 from aresilient.core import DEFAULT_MAX_RETRIES, ClientConfig
 from aresilient.exceptions import HttpRequestError
@@ -634,7 +636,7 @@ def test_invoke_on_success_calls_callback() -> None:
     mock_callback = Mock()
     mock_response = Mock(spec=httpx.Response)
 
-    with patch("aresilient.callbacks.time.time", return_value=105.5):
+    with patch("aresilient.callbacks.time.monotonic", return_value=105.5):
         invoke_on_success(
             mock_callback,
             url=TEST_URL,
@@ -660,7 +662,7 @@ def test_invoke_on_success_calculates_total_time() -> None:
     mock_callback = Mock()
     mock_response = Mock(spec=httpx.Response)
 
-    with patch("aresilient.callbacks.time.time", return_value=110.0):
+    with patch("aresilient.callbacks.time.monotonic", return_value=110.0):
         invoke_on_success(
             mock_callback,
             url=TEST_URL,
@@ -758,3 +760,85 @@ def test_invoke_on_retry_calculates_next_attempt() -> None:
 
     call_args = mock_callback.call_args[0][0]
     assert call_args.attempt == 5  # Next attempt: 3 + 2
+
+
+#######################################
+#     Tests for run_in_background     #
+#######################################
+
+
+def test_run_in_background_calls_callback() -> None:
+    """Test that the wrapped callback is called in a background
+    thread."""
+    done = threading.Event()
+    threads = []
+
+    def callback(info: str) -> None:
+        threads.append((info, threading.current_thread().name))
+        done.set()
+
+    assert run_in_background(callback)("info") is None
+    assert done.wait(timeout=5.0)
+    assert threads[0][0] == "info"
+    assert threads[0][1].startswith("aresilient-callbacks")
+
+
+def test_run_in_background_preserves_order() -> None:
+    """Test that the callbacks run in submission order."""
+    done = threading.Event()
+    calls = []
+
+    def callback(info: int) -> None:
+        calls.append(info)
+        if len(calls) == 5:
+            done.set()
+
+    wrapped = run_in_background(callback)
+    for i in range(5):
+        wrapped(i)
+    assert done.wait(timeout=5.0)
+    assert calls == [0, 1, 2, 3, 4]
+
+
+def test_run_in_background_logs_exception(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the exceptions of the callback are logged instead of
+    raised."""
+
+    def callback(info: str) -> None:
+        msg = f"cannot process {info}"
+        raise RuntimeError(msg)
+
+    # The callbacks run one at a time, so the error of the first callback
+    # is logged before the second callback runs
+    done = threading.Event()
+    with caplog.at_level("ERROR", logger="aresilient.callbacks"):
+        run_in_background(callback)("info")
+        run_in_background(lambda _info: done.set())(None)
+        assert done.wait(timeout=5.0)
+    assert "Callback run in the background failed" in caplog.text
+    assert "cannot process info" in caplog.text
+
+
+def test_request_background_callbacks(
+    mock_response: httpx.Response, mock_request_func: Mock, mock_sleep: Mock
+) -> None:
+    """Test that background_callbacks runs the callbacks in a background
+    thread."""
+    done = threading.Event()
+    threads = []
+
+    def on_success(info: object) -> None:  # noqa: ARG001
+        threads.append(threading.current_thread().name)
+        done.set()
+
+    response = request(
+        url=TEST_URL,
+        method="GET",
+        request_func=mock_request_func,
+        config=ClientConfig(on_success=on_success, background_callbacks=True),
+    )
+
+    assert response == mock_response
+    assert done.wait(timeout=5.0)
+    assert threads[0].startswith("aresilient-callbacks")
+    mock_sleep.assert_not_called()
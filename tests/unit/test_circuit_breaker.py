@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import NoReturn
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -56,6 +56,23 @@ def test_circuit_breaker_opens_at_threshold() -> None:
     assert cb.failure_count == 3
 
 
+def test_circuit_breaker_check_closed_skips_lock() -> None:
+    """Test that check() on a closed circuit does not take the lock."""
+    cb = CircuitBreaker()
+    cb._lock = MagicMock()
+    cb.check()
+    cb._lock.__enter__.assert_not_called()
+
+
+def test_circuit_breaker_has_no_instance_dict() -> None:
+    """Test that CircuitBreaker uses slots instead of an instance
+    dict."""
+    cb = CircuitBreaker()
+    assert not hasattr(cb, "__dict__")
+    with pytest.raises(AttributeError):
+        cb.unknown = 1
+
+
 def test_circuit_breaker_check_raises_when_open() -> None:
     """Test that check() raises CircuitBreakerError when circuit is
     open."""
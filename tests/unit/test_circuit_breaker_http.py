@@ -63,6 +63,51 @@ def test_circuit_breaker_opens_after_http_failures(
     assert mock_sleep.call_args_list == [call(0.3), call(0.6)]
 
 
+def test_circuit_breaker_stops_retries_when_opened(
+    mock_sleep: Mock, mock_response_fail: httpx.Response
+) -> None:
+    """Test that the retries stop, without sleeping, once the request
+    failures open the circuit."""
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+    mock_request_func = Mock(return_value=mock_response_fail)
+
+    with pytest.raises(CircuitBreakerError, match=r"Circuit breaker is OPEN \(failed 2 times\)"):
+        request(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_request_func,
+            config=ClientConfig(max_retries=5, circuit_breaker=cb),
+        )
+
+    assert mock_request_func.call_count == 2
+    assert mock_sleep.call_args_list == [call(0.3)]
+
+
+def test_circuit_breaker_opened_calls_on_failure(
+    mock_sleep: Mock, mock_response_fail: httpx.Response
+) -> None:
+    """Test that on_failure is called, with the last response as cause,
+    when the circuit opens during the retries."""
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+    on_failure = Mock()
+
+    with pytest.raises(CircuitBreakerError) as exc_info:
+        request(
+            url="https://example.com",
+            method="GET",
+            request_func=Mock(return_value=mock_response_fail),
+            config=ClientConfig(max_retries=5, circuit_breaker=cb, on_failure=on_failure),
+        )
+
+    on_failure.assert_called_once()
+    failure_info = on_failure.call_args.args[0]
+    assert failure_info.error is exc_info.value
+    assert failure_info.status_code == mock_response_fail.status_code
+    assert isinstance(exc_info.value.__cause__, HttpRequestError)
+    assert exc_info.value.__cause__.response is mock_response_fail
+    mock_sleep.assert_not_called()
+
+
 def test_circuit_breaker_fails_fast_when_open(mock_sleep: Mock) -> None:
     """Test that circuit breaker fails fast when open."""
     cb = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
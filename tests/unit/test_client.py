@@ -5,18 +5,16 @@ This file contains tests for the synchronous context manager client.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import Mock, call, patch
+from typing import Any
+from unittest.mock import MagicMock, Mock, call, patch
 
+import httpx
 import pytest
 
-from aresilient import ResilientClient
+from aresilient import HttpRequestError, ResilientClient
 from aresilient.core.config import DEFAULT_TIMEOUT, ClientConfig
 from tests.helpers import create_mock_response
 
-if TYPE_CHECKING:
-    import httpx
-
 TEST_URL = "https://api.example.com/data"
 
 
@@ -83,8 +81,8 @@ def test_client_multiple_requests(mock_sleep: Mock) -> None:
 
 
 def test_client_uses_custom_client(mock_sleep: Mock, mock_response: httpx.Response) -> None:
-    """Test that ResilientClient enters and exits a provided
-    httpx.Client (Scenario 2)."""
+    """Test that ResilientClient does not enter or exit a provided
+    httpx.Client."""
     mock_client = Mock(get=Mock(return_value=mock_response), __enter__=Mock(), __exit__=Mock())
 
     with ResilientClient(client=mock_client) as client:
@@ -92,7 +90,8 @@ def test_client_uses_custom_client(mock_sleep: Mock, mock_response: httpx.Respon
 
     assert response.status_code == 200
     mock_client.get.assert_called_once_with(url=TEST_URL)
-    mock_client.__exit__.assert_called_once_with(None, None, None)
+    mock_client.__enter__.assert_not_called()
+    mock_client.__exit__.assert_not_called()
     mock_sleep.assert_not_called()
 
 
@@ -102,8 +101,8 @@ def test_client_scenario1_externally_managed_client(
     """Test Scenario 1: client whose lifecycle is managed by an outer
     context manager.
 
-    When the provided httpx.Client is already open (its __enter__ raises
-    RuntimeError and is_closed returns False), ResilientClient uses it
+    When an httpx.Client is provided (even an already open one whose
+    __enter__ raises RuntimeError), ResilientClient uses it
     without managing its lifecycle.
     """
     mock_client = Mock(
@@ -239,6 +238,48 @@ def test_client_options_method(mock_sleep: Mock, mock_response: httpx.Response)
     mock_sleep.assert_not_called()
 
 
+def test_client_get_method_with_named_options(
+    mock_sleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test that client.get() forwards params and headers along with
+    extra keyword arguments."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock(get=Mock(return_value=mock_response), __enter__=Mock(), __exit__=Mock())
+        mock_client_class.return_value = mock_client
+
+        with ResilientClient() as client:
+            response = client.get(
+                TEST_URL, params={"page": 1}, headers={"X-Test": "1"}, follow_redirects=True
+            )
+
+        assert response.status_code == 200
+        mock_client.get.assert_called_once_with(
+            url=TEST_URL, params={"page": 1}, headers={"X-Test": "1"}, follow_redirects=True
+        )
+
+    mock_sleep.assert_not_called()
+
+
+def test_client_post_method_with_named_options(
+    mock_sleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test that client.post() forwards the body options along
+    with the other keyword arguments."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock(post=Mock(return_value=mock_response), __enter__=Mock(), __exit__=Mock())
+        mock_client_class.return_value = mock_client
+
+        with ResilientClient() as client:
+            response = client.post(TEST_URL, content=b"payload", params={"q": "x"})
+
+        assert response.status_code == 200
+        mock_client.post.assert_called_once_with(
+            url=TEST_URL, content=b"payload", params={"q": "x"}
+        )
+
+    mock_sleep.assert_not_called()
+
+
 def test_client_request_method(mock_sleep: Mock, mock_response: httpx.Response) -> None:
     """Test client.request() method with custom HTTP method."""
     with patch("httpx.Client") as mock_client_class:
@@ -255,6 +296,36 @@ def test_client_request_method(mock_sleep: Mock, mock_response: httpx.Response)
     mock_sleep.assert_not_called()
 
 
+def test_client_request_method_lowercase(mock_sleep: Mock, mock_response: httpx.Response) -> None:
+    """Test client.request() method with a lowercase HTTP method."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock(get=Mock(return_value=mock_response), __enter__=Mock(), __exit__=Mock())
+        mock_client_class.return_value = mock_client
+
+        with ResilientClient() as client:
+            response = client.request(method="get", url=TEST_URL)
+
+        assert response.status_code == 200
+        mock_client.get.assert_called_once_with(url=TEST_URL)
+
+    mock_sleep.assert_not_called()
+
+
+def test_client_request_method_lowercase_error_message(mock_sleep: Mock) -> None:
+    """Test that client.request() reports a lowercase HTTP method with
+    the canonical uppercase name."""
+    mock_client = Mock(
+        spec=httpx.Client, get=Mock(return_value=create_mock_response(status_code=404))
+    )
+    with (
+        ResilientClient(client=mock_client) as client,
+        pytest.raises(HttpRequestError, match=r"GET request to .* failed with status 404"),
+    ):
+        client.request(method="get", url=TEST_URL)
+
+    mock_sleep.assert_not_called()
+
+
 def test_client_default_max_retries(
     mock_sleep: Mock, mock_response: httpx.Response, mock_response_fail: httpx.Response
 ) -> None:
@@ -340,3 +411,96 @@ def test_client_exit_without_enter() -> None:
         # Since __enter__ was never called, the underlying client's
         # __exit__ should not be called.
         mock_client_class.return_value.__exit__.assert_not_called()
+
+
+def test_client_has_no_instance_dict() -> None:
+    """Test that ResilientClient uses slots instead of an instance
+    dict."""
+    client = ResilientClient(client=Mock())
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client.unknown = 1
+
+
+def test_client_open_close(mock_response: httpx.Response) -> None:
+    """Test that open and close manage the lifecycle without with."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.get.return_value = mock_response
+        client = ResilientClient()
+        assert client.open() is client
+        mock_client.__enter__.assert_called_once()
+
+        response = client.get(TEST_URL)
+        assert response == mock_response
+
+        client.close()
+        mock_client.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_client_close_twice() -> None:
+    """Test that close closes the underlying client only once."""
+    with patch("httpx.Client") as mock_client_class:
+        client = ResilientClient().open()
+        client.close()
+        client.close()
+        mock_client_class.return_value.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_client_open_close_externally_managed_client() -> None:
+    """Test that close does not close a client that was provided."""
+    mock_client = MagicMock()
+    client = ResilientClient(client=mock_client).open()
+    client.close()
+    mock_client.__enter__.assert_not_called()
+    mock_client.__exit__.assert_not_called()
+
+
+def test_client_closes_default_httpx_client() -> None:
+    """Test that the httpx.Client created by ResilientClient is closed on
+    exit."""
+    with ResilientClient() as client:
+        http_client = client._client
+        assert not http_client.is_closed
+    assert http_client.is_closed
+
+
+def test_client_does_not_close_provided_httpx_client() -> None:
+    """Test that a provided httpx.Client is left open on exit."""
+    with httpx.Client() as http_client:
+        with ResilientClient(client=http_client):
+            pass
+        assert not http_client.is_closed
+
+
+def test_client_binds_request_functions_lazily(mock_response: httpx.Response) -> None:
+    """Test that the request function of a method is bound on first
+    use."""
+    mock_client = Mock(get=Mock(return_value=mock_response))
+    client = ResilientClient(client=mock_client)
+    assert client._method_map == {}
+
+    client.get(TEST_URL)
+    client.get(TEST_URL)
+
+    assert client._method_map == {"GET": mock_client.get}
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "delete", "patch", "head", "options"])
+def test_client_verb_methods_call_request(method: str, mock_response: httpx.Response) -> None:
+    """Test that the verb methods go through request(), so a subclass
+    overriding it sees every request."""
+    seen = []
+
+    class LoggingClient(ResilientClient):
+        def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            seen.append((method, url, kwargs))
+            return super().request(method, url, **kwargs)
+
+    mock_client = Mock(**{method: Mock(return_value=mock_response)})
+    client = LoggingClient(client=mock_client)
+
+    assert getattr(client, method)(TEST_URL, headers={"X-Test": "1"}) is mock_response
+    assert seen == [(method.upper(), TEST_URL, {"headers": {"X-Test": "1"}})]
+    getattr(mock_client, method).assert_called_once_with(url=TEST_URL, headers={"X-Test": "1"})
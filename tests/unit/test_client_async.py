@@ -5,18 +5,17 @@ This file contains tests for the asynchronous context manager client.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, Mock, call, patch
 
+import httpx
 import pytest
 
-from aresilient import AsyncResilientClient
+from aresilient import AsyncResilientClient, HttpRequestError
 from aresilient.core.config import DEFAULT_TIMEOUT, ClientConfig
 from tests.helpers import create_mock_response
 
-if TYPE_CHECKING:
-    import httpx
-
 TEST_URL = "https://api.example.com/data"
 
 
@@ -95,8 +94,8 @@ async def test_async_client_multiple_requests(mock_asleep: Mock) -> None:
 async def test_async_client_uses_custom_client(
     mock_asleep: Mock, mock_response: httpx.Response
 ) -> None:
-    """Test that AsyncResilientClient enters and exits a provided
-    httpx.AsyncClient (Scenario 2)."""
+    """Test that AsyncResilientClient does not enter or exit a provided
+    httpx.AsyncClient."""
     mock_client = Mock(
         get=AsyncMock(return_value=mock_response), __aenter__=AsyncMock(), __aexit__=AsyncMock()
     )
@@ -106,7 +105,8 @@ async def test_async_client_uses_custom_client(
 
     assert response.status_code == 200
     mock_client.get.assert_called_once_with(url=TEST_URL)
-    mock_client.__aexit__.assert_called_once_with(None, None, None)
+    mock_client.__aenter__.assert_not_called()
+    mock_client.__aexit__.assert_not_called()
     mock_asleep.assert_not_called()
 
 
@@ -117,8 +117,8 @@ async def test_async_client_scenario1_externally_managed_client(
     """Test Scenario 1: client whose lifecycle is managed by an outer
     async context manager.
 
-    When the provided httpx.AsyncClient is already open (its __aenter__
-    raises RuntimeError and is_closed returns False),
+    When an httpx.AsyncClient is provided (even an already open one whose
+    __aenter__ raises RuntimeError),
     AsyncResilientClient uses it without managing its lifecycle.
     """
     mock_client = Mock(
@@ -277,6 +277,58 @@ async def test_async_client_options_method(
     mock_asleep.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_async_client_get_method_with_named_options(
+    mock_asleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test that client.get() forwards params and headers along with
+    extra keyword arguments."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock(
+            get=AsyncMock(return_value=mock_response),
+            __aenter__=AsyncMock(),
+            __aexit__=AsyncMock(),
+        )
+        mock_client_class.return_value = mock_client
+
+        async with AsyncResilientClient() as client:
+            response = await client.get(
+                TEST_URL, params={"page": 1}, headers={"X-Test": "1"}, follow_redirects=True
+            )
+
+        assert response.status_code == 200
+        mock_client.get.assert_called_once_with(
+            url=TEST_URL, params={"page": 1}, headers={"X-Test": "1"}, follow_redirects=True
+        )
+
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_post_method_with_named_options(
+    mock_asleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test that client.post() forwards the body options along
+    with the other keyword arguments."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock(
+            post=AsyncMock(return_value=mock_response),
+            __aenter__=AsyncMock(),
+            __aexit__=AsyncMock(),
+        )
+        mock_client_class.return_value = mock_client
+
+        async with AsyncResilientClient() as client:
+            response = await client.post(TEST_URL, content=b"payload", params={"q": "x"})
+
+        assert response.status_code == 200
+        mock_client.post.assert_called_once_with(
+            url=TEST_URL, content=b"payload", params={"q": "x"}
+        )
+
+    mock_asleep.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_async_client_request_method(
     mock_asleep: Mock, mock_response: httpx.Response
@@ -298,6 +350,42 @@ async def test_async_client_request_method(
     mock_asleep.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_async_client_request_method_lowercase(
+    mock_asleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test client.request() method with a lowercase HTTP method."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock(
+            get=AsyncMock(return_value=mock_response),
+            __aenter__=AsyncMock(),
+            __aexit__=AsyncMock(),
+        )
+        mock_client_class.return_value = mock_client
+
+        async with AsyncResilientClient() as client:
+            response = await client.request(method="get", url=TEST_URL)
+
+        assert response.status_code == 200
+        mock_client.get.assert_called_once_with(url=TEST_URL)
+
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_request_method_lowercase_error_message(mock_asleep: Mock) -> None:
+    """Test that client.request() reports a lowercase HTTP method with
+    the canonical uppercase name."""
+    mock_client = Mock(
+        spec=httpx.AsyncClient, get=AsyncMock(return_value=create_mock_response(status_code=404))
+    )
+    with pytest.raises(HttpRequestError, match=r"GET request to .* failed with status 404"):
+        async with AsyncResilientClient(client=mock_client) as client:
+            await client.request(method="get", url=TEST_URL)
+
+    mock_asleep.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_async_client_default_max_retries(
     mock_asleep: Mock, mock_response: httpx.Response, mock_response_fail: httpx.Response
@@ -388,3 +476,365 @@ async def test_async_client_exit_without_enter() -> None:
         # Since __aenter__ was never called, the underlying client's
         # __aexit__ should not be called.
         mock_client_class.return_value.__aexit__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather(mock_response: httpx.Response) -> None:
+    """Test that gather sends all requests and preserves their order."""
+    response_post = create_mock_response(status_code=201)
+    mock_client = Mock(
+        get=AsyncMock(return_value=mock_response),
+        post=AsyncMock(return_value=response_post),
+        __aenter__=AsyncMock(),
+        __aexit__=AsyncMock(),
+    )
+    async with AsyncResilientClient(client=mock_client) as client:
+        responses = await client.gather(
+            [("GET", TEST_URL, {"params": {"page": 1}}), ("POST", TEST_URL, {"json": {"a": 1}})]
+        )
+
+    assert responses == [mock_response, response_post]
+    mock_client.get.assert_called_once_with(url=TEST_URL, params={"page": 1})
+    mock_client.post.assert_called_once_with(url=TEST_URL, json={"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather_max_concurrency(mock_response: httpx.Response) -> None:
+    """Test that gather bounds the number of requests in flight."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get(**kwargs: Any) -> httpx.Response:  # noqa: ARG001
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return mock_response
+
+    mock_client = Mock(get=get, __aenter__=AsyncMock(), __aexit__=AsyncMock())
+    async with AsyncResilientClient(client=mock_client) as client:
+        responses = await client.gather([("GET", TEST_URL, {})] * 10, max_concurrency=3)
+
+    assert responses == [mock_response] * 10
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather_return_exceptions(
+    mock_asleep: Mock, mock_response: httpx.Response
+) -> None:
+    """Test that gather returns the errors when return_exceptions is
+    True."""
+    mock_client = Mock(
+        get=AsyncMock(return_value=mock_response),
+        post=AsyncMock(return_value=create_mock_response(status_code=404)),
+        __aenter__=AsyncMock(),
+        __aexit__=AsyncMock(),
+    )
+    async with AsyncResilientClient(client=mock_client) as client:
+        responses = await client.gather(
+            [("GET", TEST_URL, {}), ("POST", TEST_URL, {})],
+            max_concurrency=1,
+            return_exceptions=True,
+        )
+
+    assert responses[0] is mock_response
+    assert isinstance(responses[1], HttpRequestError)
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather_raises_error(mock_asleep: Mock) -> None:
+    """Test that gather raises the first error by default."""
+    mock_client = Mock(
+        get=AsyncMock(return_value=create_mock_response(status_code=404)),
+        __aenter__=AsyncMock(),
+        __aexit__=AsyncMock(),
+    )
+    async with AsyncResilientClient(client=mock_client) as client:
+        with pytest.raises(HttpRequestError, match=r"failed with status 404"):
+            await client.gather([("GET", TEST_URL, {})])
+
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather_empty() -> None:
+    """Test that gather returns an empty list when there is no
+    request."""
+    mock_client = Mock(__aenter__=AsyncMock(), __aexit__=AsyncMock())
+    async with AsyncResilientClient(client=mock_client) as client:
+        assert await client.gather([], max_concurrency=2) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_async_client_gather_invalid_max_concurrency(max_concurrency: int) -> None:
+    """Test that gather raises an error if max_concurrency is not
+    positive."""
+    mock_client = Mock(__aenter__=AsyncMock(), __aexit__=AsyncMock())
+    async with AsyncResilientClient(client=mock_client) as client:
+        with pytest.raises(ValueError, match=r"max_concurrency must be > 0"):
+            await client.gather([("GET", TEST_URL, {})], max_concurrency=max_concurrency)
+    mock_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [None, 2])
+async def test_async_client_gather_invalid_spec(max_concurrency: int | None) -> None:
+    """Test that gather checks every spec before creating any request
+    coroutine."""
+    client = AsyncResilientClient(client=Mock())
+    with (
+        patch.object(AsyncResilientClient, "_request") as mock_request,
+        pytest.raises(AttributeError),
+    ):
+        await client.gather(
+            [("GET", TEST_URL, {}), (None, TEST_URL, {})], max_concurrency=max_concurrency
+        )
+    mock_request.assert_not_called()
+
+
+def test_async_client_has_no_instance_dict() -> None:
+    """Test that AsyncResilientClient uses slots instead of an instance
+    dict."""
+    client = AsyncResilientClient(client=Mock())
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client.unknown = 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_aopen_aclose(mock_response: httpx.Response) -> None:
+    """Test that aopen and aclose manage the lifecycle without async
+    with."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock(
+            get=AsyncMock(return_value=mock_response),
+            __aenter__=AsyncMock(),
+            __aexit__=AsyncMock(),
+        )
+        mock_client_class.return_value = mock_client
+        client = AsyncResilientClient()
+        assert await client.aopen() is client
+        mock_client.__aenter__.assert_called_once()
+
+        response = await client.get(TEST_URL)
+        assert response == mock_response
+
+        await client.aclose()
+        mock_client.__aexit__.assert_called_once_with(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_async_client_aclose_twice() -> None:
+    """Test that aclose closes the underlying client only once."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock(__aenter__=AsyncMock(), __aexit__=AsyncMock())
+        mock_client_class.return_value = mock_client
+        client = await AsyncResilientClient().aopen()
+        await client.aclose()
+        await client.aclose()
+        mock_client.__aexit__.assert_called_once_with(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_async_client_aopen_aclose_externally_managed_client() -> None:
+    """Test that aclose does not close a client that was provided."""
+    mock_client = Mock(__aenter__=AsyncMock(), __aexit__=AsyncMock())
+    client = await AsyncResilientClient(client=mock_client).aopen()
+    await client.aclose()
+    mock_client.__aenter__.assert_not_called()
+    mock_client.__aexit__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_closes_default_httpx_client() -> None:
+    """Test that the httpx.AsyncClient created by AsyncResilientClient is
+    closed on exit."""
+    async with AsyncResilientClient() as client:
+        http_client = client._client
+        assert not http_client.is_closed
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_close_provided_httpx_client() -> None:
+    """Test that a provided httpx.AsyncClient is left open on exit."""
+    async with httpx.AsyncClient() as http_client:
+        async with AsyncResilientClient(client=http_client):
+            pass
+        assert not http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_get(mock_response: httpx.Response) -> None:
+    """Test that GET requests are sent when max_concurrency_per_host is
+    set."""
+    mock_client = Mock(get=AsyncMock(return_value=mock_response))
+    async with AsyncResilientClient(client=mock_client, max_concurrency_per_host=2) as client:
+        responses = await asyncio.gather(
+            client.get(TEST_URL, params={"page": 1}), client.get("https://other.example.com/")
+        )
+
+    assert responses == [mock_response, mock_response]
+    assert mock_client.get.call_args_list == [
+        call(url=TEST_URL, params={"page": 1}),
+        call(url="https://other.example.com/"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_get_max_concurrency_per_host(
+    mock_response: httpx.Response,
+) -> None:
+    """Test that max_concurrency_per_host bounds the number of requests
+    in flight per host."""
+    in_flight: dict[str, int] = {"api.example.com": 0, "other.example.com": 0}
+    max_in_flight: dict[str, int] = {"api.example.com": 0, "other.example.com": 0}
+
+    async def get(url: str, **kwargs: Any) -> httpx.Response:  # noqa: ARG001
+        host = httpx.URL(url).host
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0)
+        in_flight[host] -= 1
+        return mock_response
+
+    client = AsyncResilientClient(client=Mock(get=get), max_concurrency_per_host=2)
+    urls = [TEST_URL, "https://other.example.com/data"] * 5
+    responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert responses == [mock_response] * 10
+    assert max_in_flight == {"api.example.com": 2, "other.example.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_request_and_gather(mock_response: httpx.Response) -> None:
+    """Test that max_concurrency_per_host also bounds the GET requests
+    sent by request() and gather()."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get(url: str, **kwargs: Any) -> httpx.Response:  # noqa: ARG001
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return mock_response
+
+    client = AsyncResilientClient(client=Mock(get=get), max_concurrency_per_host=1)
+    responses = await asyncio.gather(
+        client.request("get", TEST_URL),
+        client.gather([("GET", TEST_URL, {}), ("GET", TEST_URL, {})]),
+        client.get(TEST_URL),
+    )
+
+    assert responses == [mock_response, [mock_response, mock_response], mock_response]
+    assert max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_limits_removed_when_idle(
+    mock_response: httpx.Response,
+) -> None:
+    """Test that the limit of a host is removed once none of its
+    requests is running or waiting."""
+    client = AsyncResilientClient(
+        client=Mock(get=AsyncMock(return_value=mock_response)), max_concurrency_per_host=1
+    )
+    await asyncio.gather(client.get(TEST_URL), client.get("https://other.example.com/"))
+    assert client._host_limits == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_limits_removed_on_error(mock_asleep: Mock) -> None:
+    """Test that the limit of a host is removed when its request
+    fails."""
+    mock_client = Mock(get=AsyncMock(return_value=create_mock_response(status_code=404)))
+    client = AsyncResilientClient(client=mock_client, max_concurrency_per_host=1)
+    with pytest.raises(HttpRequestError, match=r"failed with status 404"):
+        await client.get(TEST_URL)
+    assert client._host_limits == {}
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_get_error(mock_asleep: Mock) -> None:
+    """Test that a GET request limited per host raises the request
+    error."""
+    mock_client = Mock(get=AsyncMock(return_value=create_mock_response(status_code=404)))
+    client = AsyncResilientClient(client=mock_client, max_concurrency_per_host=1)
+    with pytest.raises(HttpRequestError, match=r"failed with status 404"):
+        await client.get(TEST_URL)
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_per_host_get_caller_cancelled() -> None:
+    """Test that cancelling the caller cancels the request limited per
+    host."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def get(**kwargs: Any) -> httpx.Response:  # noqa: ARG001
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client = AsyncResilientClient(client=Mock(get=get), max_concurrency_per_host=1)
+    task = asyncio.create_task(client.get(TEST_URL))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+
+@pytest.mark.parametrize("max_concurrency_per_host", [0, -1])
+def test_async_client_invalid_max_concurrency_per_host(max_concurrency_per_host: int) -> None:
+    """Test that max_concurrency_per_host must be positive."""
+    with pytest.raises(ValueError, match=r"max_concurrency_per_host must be > 0"):
+        AsyncResilientClient(client=Mock(), max_concurrency_per_host=max_concurrency_per_host)
+
+
+@pytest.mark.asyncio
+async def test_async_client_binds_request_functions_lazily(mock_response: httpx.Response) -> None:
+    """Test that the request function of a method is bound on first
+    use."""
+    mock_client = Mock(get=AsyncMock(return_value=mock_response))
+    client = AsyncResilientClient(client=mock_client)
+    assert client._method_map == {}
+
+    await client.get(TEST_URL)
+    await client.get(TEST_URL)
+
+    assert client._method_map == {"GET": mock_client.get}
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["get", "post", "put", "delete", "patch", "head", "options"])
+async def test_async_client_verb_methods_call_request(
+    method: str, mock_response: httpx.Response
+) -> None:
+    """Test that the verb methods go through request(), so a subclass
+    overriding it sees every request."""
+    seen = []
+
+    class LoggingClient(AsyncResilientClient):
+        async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            seen.append((method, url, kwargs))
+            return await super().request(method, url, **kwargs)
+
+    mock_client = Mock(**{method: AsyncMock(return_value=mock_response)})
+    client = LoggingClient(client=mock_client)
+
+    assert await getattr(client, method)(TEST_URL, headers={"X-Test": "1"}) is mock_response
+    assert seen == [(method.upper(), TEST_URL, {"headers": {"X-Test": "1"}})]
+    getattr(mock_client, method).assert_awaited_once_with(url=TEST_URL, headers={"X-Test": "1"})
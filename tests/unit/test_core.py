@@ -23,13 +23,13 @@ Retry, backoff, and recovery tests are in their respective specialized files:
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import httpx
 import pytest
 
 from aresilient import HttpRequestError
-from aresilient.core import ClientConfig
+from aresilient.core import DEFAULT_LIMITS, DEFAULT_TIMEOUT, ClientConfig
 from tests.helpers import (
     HTTP_METHODS,
     HttpMethodTestCase,
@@ -155,8 +155,9 @@ def test_zero_timeout(test_case: HttpMethodTestCase) -> None:
 
 
 @pytest.mark.parametrize("test_case", HTTP_METHODS)
-def test_client_close_when_owns_client(test_case: HttpMethodTestCase) -> None:
-    """Test that client is closed when created internally."""
+def test_default_client_not_closed(test_case: HttpMethodTestCase) -> None:
+    """Test that the shared default client is kept open after the
+    request."""
     mock_response = Mock(spec=httpx.Response, status_code=test_case.status_code)
     mock_client = Mock(spec=httpx.Client)
     setattr(mock_client, test_case.client_method, Mock(return_value=mock_response))
@@ -164,7 +165,24 @@ def test_client_close_when_owns_client(test_case: HttpMethodTestCase) -> None:
     with patch("httpx.Client", return_value=mock_client):
         test_case.method_func(TEST_URL)
 
-    mock_client.close.assert_called_once()
+    mock_client.close.assert_not_called()
+
+
+@pytest.mark.parametrize("test_case", HTTP_METHODS)
+def test_default_client_reused(test_case: HttpMethodTestCase) -> None:
+    """Test that consecutive requests reuse the shared default client."""
+    mock_response = Mock(spec=httpx.Response, status_code=test_case.status_code)
+    mock_client = Mock(spec=httpx.Client)
+    setattr(mock_client, test_case.client_method, Mock(return_value=mock_response))
+
+    with patch("httpx.Client", return_value=mock_client) as mock_client_class:
+        test_case.method_func(TEST_URL)
+        test_case.method_func(TEST_URL)
+
+    mock_client_class.assert_called_once_with(
+        timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS, cookies=ANY
+    )
+    assert getattr(mock_client, test_case.client_method).call_count == 2
 
 
 @pytest.mark.parametrize("test_case", HTTP_METHODS)
@@ -193,7 +211,7 @@ def test_custom_timeout(
         mock_client_class.return_value = mock_client
         test_case.method_func(TEST_URL, timeout=30.0)
 
-    mock_client_class.assert_called_once_with(timeout=30.0)
+    mock_client_class.assert_called_once_with(timeout=30.0, limits=DEFAULT_LIMITS, cookies=ANY)
     mock_sleep.assert_not_called()
 
 
@@ -213,7 +231,9 @@ def test_with_httpx_timeout_object(
         mock_client_class.return_value = mock_client_instance
         response = test_case.method_func(TEST_URL, timeout=timeout_config)
 
-    mock_client_class.assert_called_once_with(timeout=timeout_config)
+    mock_client_class.assert_called_once_with(
+        timeout=timeout_config, limits=DEFAULT_LIMITS, cookies=ANY
+    )
     assert response.status_code == test_case.status_code
     mock_sleep.assert_not_called()
 
@@ -302,11 +322,12 @@ def test_error_message_includes_url(
 
 
 @pytest.mark.parametrize("test_case", HTTP_METHODS)
-def test_client_close_on_exception(
+def test_default_client_not_closed_on_exception(
     test_case: HttpMethodTestCase,
     mock_sleep: Mock,
 ) -> None:
-    """Test that client is closed even when exception occurs."""
+    """Test that the shared default client is kept open when an exception
+    occurs."""
     mock_client = Mock(spec=httpx.Client)
     client_method = Mock(side_effect=httpx.TimeoutException("Timeout"))
     setattr(mock_client, test_case.client_method, client_method)
@@ -320,7 +341,7 @@ def test_client_close_on_exception(
     ):
         test_case.method_func(TEST_URL, config=ClientConfig(max_retries=0))
 
-    mock_client.close.assert_called_once()
+    mock_client.close.assert_not_called()
     mock_sleep.assert_not_called()
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import Mock
 
 import httpx
+import pytest
 
 from aresilient.callbacks import (
     CallbackInfo,
@@ -308,3 +309,11 @@ def test_callback_info_equality() -> None:
         total_time=0.1,
     )
     assert callback_info1 == callback_info2
+
+
+@pytest.mark.parametrize("cls", [CallbackInfo, FailureInfo, RequestInfo, ResponseInfo, RetryInfo])
+def test_callback_info_classes_use_slots(cls: type) -> None:
+    """Test that the callback info dataclasses use slots instead of an
+    instance dict."""
+    assert "__slots__" in cls.__dict__
+    assert "__dict__" not in dir(cls)
@@ -34,8 +34,10 @@ def test_all_exports_count() -> None:
     # 3 classes (AsyncResilientClient, HttpRequestError, ResilientClient)
     # + 1 version (__version__)
     # + 16 HTTP method functions (8 sync + 8 async)
-    # = 20
-    assert len(aresilient.__all__) == 20
+    # + 1 event loop helper (install_uvloop)
+    # + 2 default client helpers (async_session, close_default_clients)
+    # = 23
+    assert len(aresilient.__all__) == 23
 
 
 def test_exception_class_is_callable() -> None:
@@ -30,7 +30,7 @@ def test_max_total_time_exceeded(
     client_method = Mock(return_value=mock_response_fail)
     setattr(mock_client, test_case.client_method, client_method)
 
-    # Mock time.time() to simulate elapsed time exceeding budget
+    # Mock time.monotonic() to simulate elapsed time exceeding budget
     call_count = {"count": 0}
 
     def time_side_effect() -> float:
@@ -39,7 +39,7 @@ def test_max_total_time_exceeded(
         call_count["count"] += 1
         return 0.0 if call_count["count"] == 1 else 2.0
 
-    with patch("aresilient.retry.executor.time.time", side_effect=time_side_effect):
+    with patch("aresilient.retry.executor.time.monotonic", side_effect=time_side_effect):
         with pytest.raises(HttpRequestError) as exc_info:
             test_case.method_func(
                 TEST_URL,
@@ -68,7 +68,7 @@ def test_max_total_time_not_exceeded(
     client_method = Mock(side_effect=[mock_response_fail, mock_response])
     setattr(mock_client, test_case.client_method, client_method)
 
-    # Mock time.time() - elapsed time stays within budget
+    # Mock time.monotonic() - elapsed time stays within budget
     call_count = {"count": 0}
 
     def time_side_effect() -> float:
@@ -76,7 +76,7 @@ def test_max_total_time_not_exceeded(
         call_count["count"] += 1
         return 0.5 * call_count["count"]  # 0.5, 1.0, 1.5, etc
 
-    with patch("aresilient.retry.executor.time.time", side_effect=time_side_effect):
+    with patch("aresilient.retry.executor.time.monotonic", side_effect=time_side_effect):
         response = test_case.method_func(
             TEST_URL,
             client=mock_client,
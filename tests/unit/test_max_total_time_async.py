@@ -31,7 +31,7 @@ async def test_max_total_time_exceeded_async(
     client_method = AsyncMock(return_value=mock_response_fail)
     setattr(mock_client, test_case.client_method, client_method)
 
-    # Mock time.time() to simulate elapsed time exceeding budget
+    # Mock time.monotonic() to simulate elapsed time exceeding budget
     call_count = {"count": 0}
 
     def time_side_effect() -> float:
@@ -40,7 +40,7 @@ async def test_max_total_time_exceeded_async(
         call_count["count"] += 1
         return 0.0 if call_count["count"] == 1 else 2.0
 
-    with patch("aresilient.retry.executor_async.time.time", side_effect=time_side_effect):
+    with patch("aresilient.retry.executor_async.time.monotonic", side_effect=time_side_effect):
         with pytest.raises(HttpRequestError) as exc_info:
             await test_case.method_func(
                 TEST_URL,
@@ -70,7 +70,7 @@ async def test_max_total_time_not_exceeded_async(
     client_method = AsyncMock(side_effect=[mock_response_fail, mock_response])
     setattr(mock_client, test_case.client_method, client_method)
 
-    # Mock time.time() - elapsed time stays within budget
+    # Mock time.monotonic() - elapsed time stays within budget
     call_count = {"count": 0}
 
     def time_side_effect() -> float:
@@ -78,7 +78,7 @@ async def test_max_total_time_not_exceeded_async(
         call_count["count"] += 1
         return 0.5 * call_count["count"]  # 0.5, 1.0, 1.5, etc
 
-    with patch("aresilient.retry.executor_async.time.time", side_effect=time_side_effect):
+    with patch("aresilient.retry.executor_async.time.monotonic", side_effect=time_side_effect):
         response = await test_case.method_func(
             TEST_URL,
             client=mock_client,
@@ -2,7 +2,7 @@ r"""Unit tests for request function."""
 
 from __future__ import annotations
 
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import httpx
 import pytest
@@ -14,7 +14,8 @@ from aresilient.core import (
     RETRY_STATUS_CODES,
     ClientConfig,
 )
-from aresilient.request import request
+from aresilient.request import _get_executor, request
+from aresilient.retry import RetryExecutor
 
 TEST_URL = "https://api.example.com/data"
 
@@ -1053,3 +1054,97 @@ def test_request_config_none_uses_defaults(
     assert response == mock_response
     mock_request_func.assert_called_once_with(url=TEST_URL)
     mock_sleep.assert_not_called()
+
+
+def test_request_without_config_reuses_default_executor(
+    mock_response: httpx.Response, mock_request_func: Mock, mock_sleep: Mock
+) -> None:
+    """Test that requests without config do not build a new executor."""
+    with patch("aresilient.request._create_executor") as mock_create:
+        response = request(url=TEST_URL, method="GET", request_func=mock_request_func)
+    assert response is mock_response
+    mock_create.assert_not_called()
+    mock_sleep.assert_not_called()
+
+
+def test_request_with_config_gets_executor(mock_request_func: Mock) -> None:
+    """Test that requests with a custom config get the executor of this
+    config."""
+    config = ClientConfig(max_retries=1)
+    with patch("aresilient.request._get_executor") as mock_get:
+        request(url=TEST_URL, method="GET", request_func=mock_request_func, config=config)
+    mock_get.assert_called_once_with(config)
+
+
+###################################
+#     Tests for _get_executor     #
+###################################
+
+
+def test_get_executor_same_config() -> None:
+    """Test that the executor of a config is cached."""
+    config = ClientConfig(max_retries=1)
+    executor = _get_executor(config)
+    assert isinstance(executor, RetryExecutor)
+    assert executor.config.max_retries == 1
+    assert _get_executor(config) is executor
+
+
+def test_get_executor_equal_configs() -> None:
+    """Test that equal configs share their executor."""
+    strategy = ExponentialBackoff()
+    assert _get_executor(ClientConfig(max_retries=2, backoff_strategy=strategy)) is _get_executor(
+        ClientConfig(max_retries=2, backoff_strategy=strategy)
+    )
+
+
+def test_get_executor_different_configs() -> None:
+    """Test that different configs get different executors."""
+    assert _get_executor(ClientConfig(max_retries=1)) is not _get_executor(
+        ClientConfig(max_retries=2)
+    )
+
+
+def test_get_executor_equal_default_configs() -> None:
+    """Test that equal configs built separately with the default
+    backoff strategy share their executor."""
+    assert _get_executor(ClientConfig(max_retries=2)) is _get_executor(ClientConfig(max_retries=2))
+
+
+def test_get_executor_creation_error_not_retried() -> None:
+    """Test that a TypeError raised while creating the executor is raised
+    without creating the executor again."""
+    with (
+        patch(
+            "aresilient.request.RetryConfig.from_client_config", side_effect=TypeError("boom")
+        ) as mock_from_config,
+        pytest.raises(TypeError, match=r"boom"),
+    ):
+        _get_executor(ClientConfig(max_retries=7))
+    mock_from_config.assert_called_once()
+
+
+def test_get_executor_hashes_config_once() -> None:
+    """Test that the config is hashed only once per call."""
+
+    class CountingBackoff(ExponentialBackoff):
+        calls = 0
+
+        def __hash__(self) -> int:
+            CountingBackoff.calls += 1
+            return super().__hash__()
+
+    config = ClientConfig(backoff_strategy=CountingBackoff(base_delay=0.123))
+    executor = _get_executor(config)
+    assert CountingBackoff.calls == 1
+    assert _get_executor(config) is executor
+    assert CountingBackoff.calls == 2
+
+
+def test_get_executor_unhashable_config() -> None:
+    """Test that a config with an unhashable field still gets an
+    executor, without caching it."""
+    config = ClientConfig(status_forcelist=[500])
+    executor = _get_executor(config)
+    assert isinstance(executor, RetryExecutor)
+    assert _get_executor(config) is not executor
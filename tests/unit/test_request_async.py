@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, Mock, call
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import httpx
 import pytest
 
 from aresilient import HttpRequestError, request_async
+from aresilient.backoff import ExponentialBackoff
 from aresilient.core import ClientConfig
+from aresilient.request_async import _get_executor
+from aresilient.retry import AsyncRetryExecutor
 
 ###################################
 #     Tests for request_async     #
@@ -732,3 +735,102 @@ async def test_request_async_config_none_uses_defaults(
     assert response == mock_response
     mock_async_request_func.assert_called_once_with(url="https://example.com")
     mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_async_without_config_reuses_default_executor(
+    mock_response: httpx.Response, mock_async_request_func: AsyncMock, mock_asleep: Mock
+) -> None:
+    """Test that requests without config do not build a new executor."""
+    with patch("aresilient.request_async._create_executor") as mock_create:
+        result = await request_async(
+            url="https://example.com", method="GET", request_func=mock_async_request_func
+        )
+    assert result is mock_response
+    mock_create.assert_not_called()
+    mock_asleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_async_with_config_gets_executor(
+    mock_async_request_func: AsyncMock,
+) -> None:
+    """Test that requests with a custom config get the executor of this
+    config."""
+    config = ClientConfig(max_retries=1)
+    with patch("aresilient.request_async._get_executor") as mock_get:
+        mock_get.return_value.execute = AsyncMock()
+        await request_async(
+            url="https://example.com",
+            method="GET",
+            request_func=mock_async_request_func,
+            config=config,
+        )
+    mock_get.assert_called_once_with(config)
+
+
+###################################
+#     Tests for _get_executor     #
+###################################
+
+
+def test_get_executor_same_config() -> None:
+    """Test that the executor of a config is cached."""
+    config = ClientConfig(max_retries=1)
+    executor = _get_executor(config)
+    assert isinstance(executor, AsyncRetryExecutor)
+    assert executor.config.max_retries == 1
+    assert _get_executor(config) is executor
+
+
+def test_get_executor_equal_configs() -> None:
+    """Test that equal configs share their executor."""
+    strategy = ExponentialBackoff()
+    assert _get_executor(ClientConfig(max_retries=2, backoff_strategy=strategy)) is _get_executor(
+        ClientConfig(max_retries=2, backoff_strategy=strategy)
+    )
+
+
+def test_get_executor_equal_default_configs() -> None:
+    """Test that equal configs built separately with the default
+    backoff strategy share their executor."""
+    assert _get_executor(ClientConfig(max_retries=2)) is _get_executor(ClientConfig(max_retries=2))
+
+
+def test_get_executor_creation_error_not_retried() -> None:
+    """Test that a TypeError raised while creating the executor is raised
+    without creating the executor again."""
+    with (
+        patch(
+            "aresilient.request_async.RetryConfig.from_client_config", side_effect=TypeError("boom")
+        ) as mock_from_config,
+        pytest.raises(TypeError, match=r"boom"),
+    ):
+        _get_executor(ClientConfig(max_retries=7))
+    mock_from_config.assert_called_once()
+
+
+def test_get_executor_hashes_config_once() -> None:
+    """Test that the config is hashed only once per call."""
+
+    class CountingBackoff(ExponentialBackoff):
+        calls = 0
+
+        def __hash__(self) -> int:
+            CountingBackoff.calls += 1
+            return super().__hash__()
+
+    config = ClientConfig(backoff_strategy=CountingBackoff(base_delay=0.123))
+    executor = _get_executor(config)
+    assert CountingBackoff.calls == 1
+    assert _get_executor(config) is executor
+    assert CountingBackoff.calls == 2
+
+
+def test_get_executor_unhashable_config() -> None:
+    """Test that a config with an unhashable field still gets an
+    executor, without caching it."""
+    config = ClientConfig(status_forcelist=[500])
+    executor = _get_executor(config)
+    assert isinstance(executor, AsyncRetryExecutor)
+    assert _get_executor(config) is not executor
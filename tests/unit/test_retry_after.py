@@ -119,9 +119,9 @@ def test_request_with_jitter_applied(mock_sleep: Mock) -> None:
     mock_success_response = Mock(spec=httpx.Response, status_code=200)
     mock_request_func = Mock(side_effect=[mock_fail_response, mock_success_response])
 
-    # Mock random.uniform to return a specific jitter value
+    # Mock random.random to return a specific jitter value
     with patch(
-        "aresilient.utils.sleep.random.uniform", return_value=0.05
+        "aresilient.utils.sleep.random.random", return_value=0.05
     ):  # returns 5% of jitter_factor
         response = request(
             url=TEST_URL,
@@ -149,7 +149,7 @@ def test_request_jitter_with_retry_after(mock_sleep: Mock) -> None:
     mock_request_func = Mock(side_effect=[mock_fail_response, mock_success_response])
 
     # Mock jitter to 0.1 (10% of jitter_factor)
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.1):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.1):
         response = request(
             url=TEST_URL,
             method="GET",
@@ -146,8 +146,8 @@ async def test_request_with_jitter_applied_async(mock_asleep: Mock) -> None:
     mock_success_response = Mock(spec=httpx.Response, status_code=200)
     mock_request_func = AsyncMock(side_effect=[mock_fail_response, mock_success_response])
 
-    # Mock random.uniform to return a specific jitter value
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.05):  # 5% jitter
+    # Mock random.random to return a specific jitter value
+    with patch("aresilient.utils.sleep.random.random", return_value=0.05):  # 5% jitter
         response = await request_async(
             url=TEST_URL,
             method="GET",
@@ -187,7 +187,7 @@ async def test_request_jitter_range_async(
 
     mock_request_func = AsyncMock(side_effect=[mock_fail_response, mock_success_response])
 
-    with patch("aresilient.utils.sleep.random.uniform", return_value=jitter_multiplier):
+    with patch("aresilient.utils.sleep.random.random", return_value=jitter_multiplier):
         response = await request_async(
             url=TEST_URL,
             method="GET",
@@ -218,7 +218,7 @@ async def test_request_jitter_with_retry_after_async(mock_asleep: Mock) -> None:
     mock_request_func = AsyncMock(side_effect=[mock_fail_response, mock_success_response])
 
     # Mock jitter to 10% (maximum)
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.1):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.1):
         response = await request_async(
             url=TEST_URL,
             method="GET",
@@ -0,0 +1,51 @@
+r"""Unit tests for event loop utilities."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from unittest.mock import Mock, patch
+
+from aresilient.utils.event_loop import install_uvloop
+
+####################################
+#     Tests for install_uvloop     #
+####################################
+
+
+def test_install_uvloop_available() -> None:
+    """Test that the uvloop policy is installed when uvloop is available."""
+    policy = Mock()
+    uvloop = ModuleType("uvloop")
+    uvloop.EventLoopPolicy = Mock(return_value=policy)
+    with (
+        patch.dict(sys.modules, {"uvloop": uvloop}),
+        patch("aresilient.utils.event_loop.is_uvloop_available", lambda: True),
+        patch("aresilient.utils.event_loop.sys.version_info", (3, 13, 0)),
+        patch("aresilient.utils.event_loop.asyncio.set_event_loop_policy") as set_policy,
+    ):
+        assert install_uvloop()
+    set_policy.assert_called_once_with(policy)
+
+
+def test_install_uvloop_not_available() -> None:
+    """Test that the event loop policy is unchanged when uvloop is
+    missing."""
+    with (
+        patch("aresilient.utils.event_loop.is_uvloop_available", lambda: False),
+        patch("aresilient.utils.event_loop.asyncio.set_event_loop_policy") as set_policy,
+    ):
+        assert not install_uvloop()
+    set_policy.assert_not_called()
+
+
+def test_install_uvloop_python_314() -> None:
+    """Test that the deprecated event loop policy API is not used on
+    Python 3.14+."""
+    with (
+        patch("aresilient.utils.event_loop.is_uvloop_available", lambda: True),
+        patch("aresilient.utils.event_loop.sys.version_info", (3, 14, 0)),
+        patch("aresilient.utils.event_loop.asyncio.set_event_loop_policy") as set_policy,
+    ):
+        assert not install_uvloop()
+    set_policy.assert_not_called()
@@ -207,7 +207,7 @@ def test_handle_exception_with_callback_final_attempt_with_callback() -> None:
     exc = Exception("Test error")
 
     with (
-        patch("aresilient.utils.exceptions.time.time", return_value=105.0),
+        patch("aresilient.utils.exceptions.time.monotonic", return_value=105.0),
         pytest.raises(HttpRequestError),
     ):
         handle_exception_with_callback(
@@ -309,7 +309,7 @@ def test_raise_final_error_calls_on_failure_with_response() -> None:
     mock_response = Mock(spec=httpx.Response, status_code=500)
 
     with (
-        patch("aresilient.utils.exceptions.time.time", return_value=110.0),
+        patch("aresilient.utils.exceptions.time.monotonic", return_value=110.0),
         pytest.raises(HttpRequestError),
     ):
         raise_final_error(
@@ -337,7 +337,7 @@ def test_raise_final_error_calls_on_failure_without_response() -> None:
     mock_on_failure = Mock()
 
     with (
-        patch("aresilient.utils.exceptions.time.time", return_value=115.0),
+        patch("aresilient.utils.exceptions.time.monotonic", return_value=115.0),
         pytest.raises(HttpRequestError),
     ):
         raise_final_error(
@@ -365,7 +365,7 @@ def test_raise_final_error_calculates_total_time() -> None:
     mock_response = Mock(spec=httpx.Response, status_code=429)
 
     with (
-        patch("aresilient.utils.exceptions.time.time", return_value=123.456),
+        patch("aresilient.utils.exceptions.time.monotonic", return_value=123.456),
         pytest.raises(HttpRequestError),
     ):
         raise_final_error(
@@ -0,0 +1,29 @@
+r"""Unit tests for optional dependency helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from aresilient.utils.imports import is_uvloop_available
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache() -> None:
+    is_uvloop_available.cache_clear()
+
+
+#########################################
+#     Tests for is_uvloop_available     #
+#########################################
+
+
+def test_is_uvloop_available_true() -> None:
+    with patch("aresilient.utils.imports.package_available", return_value=True):
+        assert is_uvloop_available()
+
+
+def test_is_uvloop_available_false() -> None:
+    with patch("aresilient.utils.imports.package_available", return_value=False):
+        assert not is_uvloop_available()
@@ -139,7 +139,7 @@ def test_handle_exception_timeout_retry_if_returns_true_with_attempts_remaining(
         attempt=0,
         max_retries=3,
         on_failure=None,
-        start_time=time.time(),
+        start_time=time.monotonic(),
     )
 
     assert result is True
@@ -160,7 +160,7 @@ def test_handle_exception_timeout_retry_if_returns_false() -> None:
             attempt=0,
             max_retries=3,
             on_failure=None,
-            start_time=time.time(),
+            start_time=time.monotonic(),
         )
 
     error = exc_info.value
@@ -184,7 +184,7 @@ def test_handle_exception_timeout_max_retries_reached() -> None:
             attempt=3,
             max_retries=3,
             on_failure=None,
-            start_time=time.time(),
+            start_time=time.monotonic(),
         )
 
     error = exc_info.value
@@ -203,7 +203,7 @@ def test_handle_exception_request_error_retry_if_returns_true() -> None:
         attempt=1,
         max_retries=5,
         on_failure=None,
-        start_time=time.time(),
+        start_time=time.monotonic(),
     )
 
     assert result is True
@@ -225,7 +225,7 @@ def test_handle_exception_request_error_retry_if_returns_false() -> None:
             attempt=2,
             max_retries=5,
             on_failure=None,
-            start_time=time.time(),
+            start_time=time.monotonic(),
         )
 
     error = exc_info.value
@@ -243,7 +243,7 @@ def test_handle_exception_with_on_failure_callback() -> None:
     def on_failure(info: FailureInfo) -> None:
         callback_data["info"] = info
 
-    start = time.time()
+    start = time.monotonic()
 
     with pytest.raises(
         HttpRequestError, match=r"DELETE request to https://example.com timed out \(3 attempts\)"
@@ -285,7 +285,7 @@ def test_handle_exception_connect_error() -> None:
             attempt=0,
             max_retries=3,
             on_failure=None,
-            start_time=time.time(),
+            start_time=time.monotonic(),
         )
 
 
@@ -303,5 +303,5 @@ def test_handle_exception_read_timeout() -> None:
             attempt=1,
             max_retries=3,
             on_failure=None,
-            start_time=time.time(),
+            start_time=time.monotonic(),
         )
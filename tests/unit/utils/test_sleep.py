@@ -23,7 +23,7 @@ def test_calculate_sleep_time_exponential_backoff(attempt: int, sleep_time: floa
 
 def test_calculate_sleep_time_with_jitter() -> None:
     """Test that jitter is correctly added to sleep time."""
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.05):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.05):
         # Base sleep: 1.0 * 2^0 = 1.0
         # Jitter: 0.05 * 1.0 = 0.05
         # Total: 1.05
@@ -64,7 +64,7 @@ def test_calculate_sleep_time_with_retry_after_and_jitter() -> None:
     """Test that jitter is applied to Retry-After value."""
     mock_response = Mock(spec=httpx.Response, headers={"Retry-After": "100"})
 
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.1):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.1):
         # Base sleep from Retry-After: 100
         # Jitter: 0.1 * 100 = 10
         # Total: 110
@@ -119,7 +119,7 @@ def test_calculate_sleep_time_strategy_with_jitter() -> None:
     """Test that jitter is applied to backoff strategy."""
     strategy = ConstantBackoff(delay=5.0)
 
-    with patch("aresilient.utils.sleep.random.uniform", return_value=0.2):
+    with patch("aresilient.utils.sleep.random.random", return_value=0.2):
         # Base sleep from strategy: 5.0
         # Jitter: 0.2 * 5.0 = 1.0
         # Total: 6.0
@@ -150,3 +150,40 @@ def test_calculate_sleep_time_retry_after_takes_precedence_over_strategy() -> No
         )
         == 120.0
     )
+
+
+def test_calculate_sleep_time_jitter_does_not_exceed_max_wait_time() -> None:
+    """Test that jitter cannot push the sleep time above max_wait_time."""
+    with patch("aresilient.utils.sleep.random.random", return_value=0.5):
+        # Base sleep from strategy: 10.0, capped to 8.0
+        # Jitter: 0.5 * 8.0 = 4.0
+        # Total: 12.0, capped to 8.0
+        assert (
+            calculate_sleep_time(
+                attempt=0,
+                jitter_factor=1.0,
+                response=None,
+                backoff_strategy=ConstantBackoff(delay=10.0),
+                max_wait_time=8.0,
+            )
+            == 8.0
+        )
+
+
+def test_calculate_sleep_time_jitter_below_max_wait_time() -> None:
+    """Test that jitter is kept when the total stays under
+    max_wait_time."""
+    with patch("aresilient.utils.sleep.random.random", return_value=0.5):
+        # Base sleep from strategy: 4.0
+        # Jitter: 0.5 * 4.0 = 2.0
+        # Total: 6.0
+        assert (
+            calculate_sleep_time(
+                attempt=0,
+                jitter_factor=1.0,
+                response=None,
+                backoff_strategy=ConstantBackoff(delay=4.0),
+                max_wait_time=8.0,
+            )
+            == 6.0
+        )